@@ -0,0 +1,53 @@
+# csv_encoding.py
+# -*- coding: utf-8 -*-
+"""
+csv_encoding.py - CSV 인코딩 판별 (filter.py / filterV3-jp.py / filterV3-kr.py 공용)
+
+filterGUI/filter_core_v2.detect_csv_encoding 과 같은 로직.
+단독 실행 스크립트는 filterGUI 를 import 하지 않으므로 스크립트와 같은 폴더에 둠 (바꿀 때 filter_core_v2 도 함께 수정)
+→ filterGUI/tests/test_encoding.py 에서 두 구현의 결과가 같은지 확인
+"""
+
+import codecs
+import re
+
+ENCODING_SAMPLE_BYTES = 1024 * 1024   # 판별에 사용하는 앞부분 크기 (1MB)
+JP_CHAR_RE = re.compile(r"[　-ヿ一-鿿！-～]")  # 가나/한자/전각 기호
+NON_ASCII_RE = re.compile(r"[^\x00-\x7F]")
+
+def _decodes(sample: bytes, encoding: str, final: bool):
+    # 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음 (final=False)
+    try:
+        return codecs.getincrementaldecoder(encoding)().decode(sample, final=final)
+    except UnicodeDecodeError:
+        return None
+
+def detect_csv_encoding(csv_path: str, sample_bytes: int = ENCODING_SAMPLE_BYTES):
+    """
+    return: (인코딩, 신뢰도 0.0~1.0)
+    - UTF-8 BOM 있음        → utf-8-sig (1.0)
+    - 샘플이 UTF-8 로 정상  → utf-8 (멀티바이트 포함 0.99 / ASCII 만 0.6)
+    - 샘플이 cp932 로 정상  → cp932 (0.5~0.99, 일본어 문자 비율로 가중)
+    - 둘 다 실패           → 깨진 문자가 적은 쪽 (0.0)
+    """
+    with open(csv_path, "rb") as f:
+        sample = f.read(sample_bytes)
+        final = f.read(1) == b""
+
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig", 1.0
+
+    if _decodes(sample, "utf-8", final) is not None:
+        return "utf-8", (0.6 if sample.isascii() else 0.99)
+
+    text = _decodes(sample, "cp932", final)
+    if text is not None:
+        non_ascii = len(NON_ASCII_RE.findall(text))
+        jp = len(JP_CHAR_RE.findall(text))
+        return "cp932", round(0.5 + 0.49 * jp / max(non_ascii, 1), 2)
+
+    errors = {
+        enc: sample.decode(enc, errors="replace").count("�")
+        for enc in ("utf-8", "cp932")
+    }
+    return min(errors, key=errors.get), 0.0
@@ -21,6 +21,8 @@ import re
 import pandas as pd
 from datetime import datetime
 
+from csv_encoding import detect_csv_encoding
+
 # ============================================================
 # 0) 경로 설정
 # ============================================================
@@ -133,18 +135,23 @@ def has_garbled_text(s: str) -> bool:
     return False
 
 # ============================================================
-# 4) CSV 로드: 인코딩 자동 감지 (utf-8-sig → cp932 → utf-8)
+# 4) CSV 로드: 인코딩 자동 감지 (BOM + 샘플로 판별 → 한 번만 읽기)
 # ============================================================
 if not os.path.exists(CSV_PATH):
     raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {CSV_PATH}")
 
+# 샘플로 판별한 인코딩으로 한 번만 읽기 (판별: csv_encoding.py)
+# (판별이 틀린 경우에만 나머지 인코딩 시도)
+CSV_ENCODING, CSV_ENCODING_CONFIDENCE = detect_csv_encoding(CSV_PATH)
 df = None
 last_err = None
-for enc in ["utf-8-sig", "cp932", "utf-8"]:
+for enc in [CSV_ENCODING] + [e for e in ["utf-8-sig", "cp932", "utf-8"] if e != CSV_ENCODING]:
     try:
         df = pd.read_csv(CSV_PATH, encoding=enc)
+        if enc != CSV_ENCODING:
+            CSV_ENCODING, CSV_ENCODING_CONFIDENCE = enc, 0.0
         break
-    except Exception as e:
+    except UnicodeDecodeError as e:
         last_err = e
 
 if df is None:
@@ -409,4 +416,5 @@ with pd.ExcelWriter(OUT_XLSX, engine="openpyxl") as writer:
 
 print("\n✅ 저장 완료:", OUT_XLSX)
 print("✅ 소개회사명 매핑(参照列):", col_intro_company)
-print("✅ 최저임금 판정 기준: 給与形態(unitText) + 給与下限(minValue) (給与 텍스트는 사용 X)")
\ No newline at end of file
+print("✅ 최저임금 판정 기준: 給与形態(unitText) + 給与下限(minValue) (給与 텍스트는 사용 X)")
+print("✅ 인코딩:", CSV_ENCODING, f"(신뢰도 {CSV_ENCODING_CONFIDENCE})")
\ No newline at end of file
@@ -0,0 +1,312 @@
+# bench_jobdata.py
+# -*- coding: utf-8 -*-
+"""
+bench_jobdata.py - 합성 JobMasterList CSV 생성기 + run_filter 단계별 벤치마크
+
+사용법:
+    python bench_jobdata.py                                   # 10k / 100k / 1M 행 x utf-8 / cp932
+    python bench_jobdata.py --rows 10000 --encodings cp932 --ng-ratio 0.2 --check-ratio 0.1
+    python bench_jobdata.py --rows 100000 --generate-only --data-dir ./benchdata
+    python bench_jobdata.py --rows 100000 --load infer text --skip-write   # 로드 방식별 읽기 시간 / 메모리 비교
+
+- 실제 내보내기와 같은 86개 컬럼 헤더(給与形態（unitText） / 都道府県（addressRegion） 등)로 CSV 생성
+  (NG / 要確認 이 되는 행의 비율 지정 가능, 시드 고정으로 재현 가능)
+- 읽기(load) / 판정(check) / 저장(write) 단계를 따로 측정 + 읽은 DataFrame 의 메모리(frame_mb)
+- 결과는 --out 파일(JSON Lines)에 1측정 1행으로 추가 → 같은 조건의 이전 기록과 비교해서 출력
+"""
+
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from filter_core_v2 import (
+    SCREEN_ENGINES, ALLOWED_EMPLOYMENT, current_rules, col_work_company, col_intro_company, col_email,
+    col_employment, col_job, col_city, col_pref, col_address, col_worktime, col_wage_unit, col_wage_lower,
+    LOAD_MODES, read_csv_auto,
+)
+from result_writer import TOTAL_COL, WRITER_BACKENDS, write_result_workbook
+
+# ============================================================
+# [JobMasterList 컬럼] 실제 내보내기 CSV 헤더 순서 그대로
+# ============================================================
+JOB_MASTER_COLUMNS = [
+    "状態", "仕事ID", "お仕事No.", "掲載プラン", "掲載企業No.", "求人原稿種別", "掲載開始日", "掲載終了日",
+    "就業先会社名", "メインキャッチ", "コメント", "ホワイトポイントメリット", "ホワイトポイントPR", "職種", "職務内容",
+    "勤務地住所", "勤務地MAP", "年収", "年収備考", "給与", "給与備考", "残業代/残業時間",
+    "勤務時間/月平均所定労働時間", "休日/休暇", "PR", "応募方法/応募条件", "応募URL", "待遇/福利厚生",
+    "紹介元会社名", "応募先メールアドレス", "自動返信メール文面", "有給休暇の平均取得日数", "特徴", "平均勤続年数",
+    "メンター制度", "キャリア・コンサルティング制度/自己啓発支援", "受付担当", "面接地", "雇用形態", "勤務地備考",
+    "アクセス", "画像1", "画像2", "画像3", "画像4", "画像5", "画像3テキスト", "画像4テキスト", "画像5テキスト",
+    "【運営元管理者】専用備考欄", "共有備考欄", "掲載期間", "更新日時", "勤務地(市区町村コード)",
+    "職種(検索キーコード)", "求人カテゴリ(検索キーコード)", "ジャンル(検索キーコード)", "こだわり条件(検索キーコード)",
+    "公式認定マーク(検索キーコード)", "時給(金額)", "日給(金額)", "月給(金額)", "年収(金額)",
+    "駅-1(駅コード)", "交通手段-1(徒歩=0,車・バス=1)", "所要時間-1(分)",
+    "駅-2(駅コード)", "交通手段-2(徒歩=0,車・バス=1)", "所要時間-2(分)",
+    "駅-3(駅コード)", "交通手段-3(徒歩=0,車・バス=1)", "所要時間-3(分)",
+    "他サイト連携ID", "掲載終了日（valid Through）", "職種（title）", "郵便番号（postalCode）",
+    "都道府県（addressRegion）", "市区町村（addressLocality）", "町域以下（streetAddress）",
+    "勤務形態（jobLocationType）", "リモートワーク勤務地（applicantLocationRequirements）",
+    "求人の詳細な説明（description）", "給与形態（unitText）", "給与下限（minValue）", "給与上限（maxValue）",
+    "雇用形態（employment Type）",
+]
+
+# ============================================================
+# [생성용 값 목록] 정상 행은 모든 체크가 OK 가 되는 값만 사용 (cp932 로 인코딩 가능한 문자만)
+# ============================================================
+PREF_CAPITALS = {
+    "北海道": "札幌市", "青森": "青森市", "岩手": "盛岡市", "宮城": "仙台市", "秋田": "秋田市", "山形": "山形市",
+    "福島": "福島市", "茨城": "水戸市", "栃木": "宇都宮市", "群馬": "前橋市", "埼玉": "さいたま市", "千葉": "千葉市",
+    "東京": "新宿区", "神奈川": "横浜市", "新潟": "新潟市", "富山": "富山市", "石川": "金沢市", "福井": "福井市",
+    "山梨": "甲府市", "長野": "長野市", "岐阜": "岐阜市", "静岡": "静岡市", "愛知": "名古屋市", "三重": "津市",
+    "滋賀": "大津市", "京都": "京都市", "大阪": "大阪市", "兵庫": "神戸市", "奈良": "奈良市", "和歌山": "和歌山市",
+    "鳥取": "鳥取市", "島根": "松江市", "岡山": "岡山市", "広島": "広島市", "山口": "山口市", "徳島": "徳島市",
+    "香川": "高松市", "愛媛": "松山市", "高知": "高知市", "福岡": "福岡市", "佐賀": "佐賀市", "長崎": "長崎市",
+    "熊本": "熊本市", "大分": "大分市", "宮崎": "宮崎市", "鹿児島": "鹿児島市", "沖縄": "那覇市",
+}
+COMPANIES = [
+    "株式会社さくらケア", "医療法人みどり会", "社会福祉法人あおば福祉会", "株式会社ひかり物流",
+    "合同会社ミライフーズ", "株式会社アルファ技研", "有限会社やまびこ", "株式会社サンライズ保育",
+]
+INTRO_COMPANIES = ["ライフワンズ株式会社", "VIVID株式会社", "株式会社ジョブリンク", ""]
+JOB_TITLES = [
+    "介護スタッフ", "看護師", "理学療法士", "保育士", "一般事務", "経理事務", "調理師", "配送ドライバー",
+    "倉庫内軽作業", "施工管理", "機械設計", "販売スタッフ", "受付スタッフ", "薬剤師", "歯科衛生士",
+]
+EMPLOYMENTS = sorted(ALLOWED_EMPLOYMENT)
+WORKTIMES = [
+    "09:00-18:00\n\n休憩時間（日勤）　60分",
+    "08:30-17:30\n\n休憩時間（日勤）　60分",
+    "（1）08:45～17:15\n（2）16:30～09:00",
+    "10:00-19:00\n\n休憩時間（日勤）　60分",
+]
+CATCHES = [
+    "年間休日120日以上！土日祝休みでプライベートも充実",
+    "賞与年2回・各種手当充実◎ 長く働ける環境です",
+    "地域に根ざしたアットホームな職場です",
+]
+DESCRIPTIONS = [
+    "利用者様の日常生活のサポートをお願いします。食事・入浴・排せつの介助が中心です。",
+    "入出荷データの入力や電話応対など、事務全般をお任せします。",
+    "担当エリアのお客様へ商品をお届けします。ルートは決まっているので安心です。",
+]
+HOURS_PER_UNIT = {1: 1, 2: 8, 3: 160}   # unitText → 최저임금에 곱할 시간 (filter_core_v2 의 환산 상수와 같음)
+
+# 결함 종류 (NG / 要確認 이 되도록 값을 바꿈)
+NG_DEFECTS = ["email_bad", "email_blank", "company_mark", "wage_low", "employment", "city_blank"]
+CHECK_DEFECTS = ["job_token", "job_digit", "weekly_wage"]
+
+def _pref_full(pref: str) -> str:
+    if pref == "北海道":
+        return pref
+    if pref == "東京":
+        return "東京都"
+    if pref in ("大阪", "京都"):
+        return pref + "府"
+    return pref + "県"
+
+def generate_frame(rows: int, start: int, rng: np.random.Generator,
+                   ng_ratio: float, check_ratio: float) -> pd.DataFrame:
+    """start 번째 행부터 rows 행의 합성 데이터"""
+    idx = np.arange(start, start + rows)
+    prefs = np.array(list(PREF_CAPITALS), dtype=object)
+    pick = lambda values: np.asarray(values, dtype=object)[rng.integers(0, len(values), rows)]
+
+    pref = pick(prefs)
+    city = np.array([PREF_CAPITALS[p] for p in pref], dtype=object)
+    pref_full = np.array([_pref_full(p) for p in pref], dtype=object)
+    unit = pick([1, 1, 2, 3, 3, 3]).astype(np.int64)
+    min_wage = current_rules().min_wage()
+    minw = np.array([min_wage[p] for p in pref], dtype=np.int64)
+    hours = np.array([HOURS_PER_UNIT[u] for u in unit], dtype=np.int64)
+    lower = (minw + rng.integers(0, 400, rows)) * hours
+
+    company = pick(COMPANIES)
+    private = rng.random(rows) < 0.05
+    company[private] = "非公開"
+    intro = pick(INTRO_COMPANIES)
+    intro[private & (intro == "")] = INTRO_COMPANIES[0]   # 非公開 + 紹介元空欄 은 NG 이므로 정상 행에서는 제외
+    email = np.char.add(np.char.add("recruit", (idx % 997).astype(str)), "@example.co.jp").astype(object)
+    job = pick(JOB_TITLES)
+    employment = pick(EMPLOYMENTS)
+
+    # 결함 주입: r < ng_ratio → NG, ng_ratio <= r < ng_ratio + check_ratio → 要確認
+    r = rng.random(rows)
+    ng = r < ng_ratio
+    check = ~ng & (r < ng_ratio + check_ratio)
+    ng_kind = np.asarray(NG_DEFECTS, dtype=object)[rng.integers(0, len(NG_DEFECTS), rows)]
+    check_kind = np.asarray(CHECK_DEFECTS, dtype=object)[rng.integers(0, len(CHECK_DEFECTS), rows)]
+    defect = np.where(ng, ng_kind, np.where(check, check_kind, "")).astype(object)
+
+    m = defect == "email_bad"
+    email[m] = "recruit@@example"
+    email[defect == "email_blank"] = ""
+    m = defect == "company_mark"
+    company[m] = np.char.add("(株)", company[m].astype(str)).astype(object)
+    m = defect == "wage_low"
+    lower[m] = (minw[m] - 50) * hours[m]
+    employment[defect == "employment"] = "正職員"
+    city[defect == "city_blank"] = ""
+    m = defect == "job_token"
+    job[m] = np.char.add(job[m].astype(str), "（急募）").astype(object)
+    m = defect == "job_digit"
+    job[m] = np.char.add(job[m].astype(str), " No.12").astype(object)
+    unit[defect == "weekly_wage"] = 5
+
+    dates = pd.Timestamp("2026-01-01") + pd.to_timedelta(rng.integers(0, 60, rows), unit="D")
+    data = {c: np.full(rows, "", dtype=object) for c in JOB_MASTER_COLUMNS}
+    data.update({
+        "状態": np.ones(rows, dtype=np.int64),
+        "仕事ID": 3400000 + idx,
+        "お仕事No.": np.char.add("test", np.char.zfill(idx.astype(str), 7)).astype(object),
+        "掲載プラン": np.full(rows, 9),
+        "掲載企業No.": rng.integers(100, 999, rows),
+        "求人原稿種別": np.ones(rows, dtype=np.int64),
+        "掲載開始日": dates.strftime("%Y-%m-%d").to_numpy(dtype=object),
+        "掲載終了日": np.full(rows, "2030-12-31", dtype=object),
+        "メインキャッチ": pick(CATCHES),
+        "職務内容": pick(DESCRIPTIONS),
+        "給与": np.char.add(lower.astype(str), "円～").astype(object),
+        "郵便番号（postalCode）": np.char.add("0", rng.integers(100000, 999999, rows).astype(str)).astype(object),
+        "町域以下（streetAddress）": np.char.add("本町", (idx % 9 + 1).astype(str)).astype(object),
+        "職種（title）": job,
+        "雇用形態（employment Type）": employment,
+        col_work_company: company,
+        col_intro_company: intro,
+        col_email: email,
+        col_employment: employment,
+        col_job: job,
+        col_city: city,
+        col_pref: pref_full,
+        col_address: (pref_full + city + "本町1-2-3").astype(object),
+        col_worktime: pick(WORKTIMES),
+        col_wage_unit: unit,
+        col_wage_lower: lower,
+        "給与上限（maxValue）": lower + 200 * hours,
+    })
+    return pd.DataFrame(data, columns=JOB_MASTER_COLUMNS)
+
+def generate_csv(path: str, rows: int, encoding: str = "utf-8", ng_ratio: float = 0.1,
+                 check_ratio: float = 0.05, seed: int = 0, block_rows: int = 100_000) -> str:
+    """합성 JobMasterList CSV 생성 (block_rows 행씩 나눠 써서 1M 행도 메모리 사용량 일정)"""
+    rng = np.random.default_rng(seed)
+    with open(path, "w", encoding=encoding, newline="") as f:
+        for start in range(0, rows, block_rows):
+            part = generate_frame(min(block_rows, rows - start), start, rng, ng_ratio, check_ratio)
+            part.to_csv(f, index=False, header=(start == 0))
+    return path
+
+# ============================================================
+# [벤치마크]
+# ============================================================
+def bench_once(csv_path: str, engine: str, writer: str, out_dir: str, skip_write: bool, load: str = "infer") -> dict:
+    t0 = time.perf_counter()
+    df, enc, _ = read_csv_auto(csv_path, **LOAD_MODES[load])
+    t1 = time.perf_counter()
+    out = SCREEN_ENGINES[engine](df)
+    t2 = time.perf_counter()
+
+    write_sec = None
+    if not skip_write:
+        out_xlsx = os.path.join(out_dir, "bench_out.xlsx")
+        write_result_workbook(pd.concat([out, df], axis=1), out_xlsx, backend=writer)
+        write_sec = time.perf_counter() - t2
+        os.remove(out_xlsx)
+
+    counts = out[TOTAL_COL].value_counts()
+    total_sec = (t2 - t0) + (write_sec or 0.0)
+    return {
+        "detected_encoding": enc,
+        "frame_mb": round(df.memory_usage(deep=True).sum() / 1024 / 1024, 1),
+        "load_sec": round(t1 - t0, 4),
+        "check_sec": round(t2 - t1, 4),
+        "write_sec": None if write_sec is None else round(write_sec, 4),
+        "total_sec": round(total_sec, 4),
+        "rows_per_sec": round(len(df) / total_sec) if total_sec > 0 else None,
+        "ok": int(counts.get("OK", 0)),
+        "ng": int(counts.get("NG", 0)),
+        "check": int(counts.get("要確認", 0)),
+    }
+
+def load_history(path: str) -> list:
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def main():
+    ap = argparse.ArgumentParser(description="합성 JobMasterList 생성 + run_filter 단계별 벤치마크")
+    ap.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    ap.add_argument("--encodings", nargs="+", default=["utf-8", "cp932"])
+    ap.add_argument("--ng-ratio", type=float, default=0.1, help="NG 결함을 넣을 행 비율")
+    ap.add_argument("--check-ratio", type=float, default=0.05, help="要確認 결함을 넣을 행 비율")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--engine", default="columnar", choices=list(SCREEN_ENGINES))
+    ap.add_argument("--writer", default="stream", choices=list(WRITER_BACKENDS))
+    ap.add_argument("--load", nargs="+", default=["infer"], choices=list(LOAD_MODES),
+                    help="입력 로드 방식 (run_filter 의 load= / 여러 개면 같은 CSV 로 차례로 측정해서 비교)")
+    ap.add_argument("--skip-write", action="store_true", help="저장 단계는 측정하지 않음")
+    ap.add_argument("--data-dir", default=None, help="생성한 CSV 를 보관할 폴더 (같은 조건의 파일이 있으면 재사용)")
+    ap.add_argument("--generate-only", action="store_true", help="CSV 만 생성하고 측정하지 않음")
+    ap.add_argument("--out", default="bench_results.jsonl", help="측정 결과를 추가할 JSON Lines 파일")
+    args = ap.parse_args()
+
+    history = load_history(args.out)
+    tmp = tempfile.TemporaryDirectory()
+    data_dir = args.data_dir or tmp.name
+    os.makedirs(data_dir, exist_ok=True)
+
+    try:
+        for rows in args.rows:
+            for enc in args.encodings:
+                name = f"jobdata_{rows}_{enc}_ng{args.ng_ratio}_chk{args.check_ratio}_s{args.seed}.csv"
+                csv_path = os.path.join(data_dir, name)
+                if not os.path.exists(csv_path):
+                    t = time.perf_counter()
+                    generate_csv(csv_path, rows, enc, args.ng_ratio, args.check_ratio, args.seed)
+                    print(f"생성: {csv_path} ({time.perf_counter() - t:.1f}s)")
+                if args.generate_only:
+                    continue
+
+                for load in args.load:
+                    record = {
+                        "timestamp": datetime.now().isoformat(timespec="seconds"),
+                        "rows": rows,
+                        "encoding": enc,
+                        "ng_ratio": args.ng_ratio,
+                        "check_ratio": args.check_ratio,
+                        "engine": args.engine,
+                        "load": load,
+                        "writer": None if args.skip_write else args.writer,
+                        "file_mb": round(os.path.getsize(csv_path) / 1024 / 1024, 2),
+                        "python": platform.python_version(),
+                        "pandas": pd.__version__,
+                        "cpu_count": os.cpu_count(),
+                    }
+                    record.update(bench_once(csv_path, args.engine, args.writer, data_dir, args.skip_write, load))
+
+                    # 같은 조건의 직전 기록과 비교 (회귀 확인)
+                    key = ("rows", "encoding", "ng_ratio", "check_ratio", "engine", "load", "writer")
+                    prev = next((h for h in reversed(history) if all(h.get(k) == record[k] for k in key)), None)
+                    diff = (f"  (前回 {prev['total_sec']:.2f}s → x{prev['total_sec'] / record['total_sec']:.2f})"
+                            if prev else "")
+                    write = "-" if record["write_sec"] is None else f"{record['write_sec']:.2f}s"
+                    print(f"rows={rows:<8} {enc:<6} {load:<5} load={record['load_sec']:.2f}s "
+                          f"({record['frame_mb']:.0f}MB) check={record['check_sec']:.2f}s "
+                          f"write={write} total={record['total_sec']:.2f}s "
+                          f"OK/NG/要確認={record['ok']}/{record['ng']}/{record['check']}{diff}")
+
+                    with open(args.out, "a", encoding="utf-8") as f:
+                        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    history.append(record)
+    finally:
+        tmp.cleanup()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# bench_workers.py
+# -*- coding: utf-8 -*-
+"""
+bench_workers.py - 병렬 판정(workers=N) 처리량 벤치마크
+
+사용법:
+    python bench_workers.py 審査データ.csv --repeat 50 --workers 1 2 4 8
+    python bench_workers.py 審査データ.csv --engine row
+
+CSV 를 한 번 읽은 뒤(--repeat 배로 복제), workers 수별로 판정 단계만 측정하여
+처리량(행/초)과 직렬(workers=1) 대비 배율을 출력. 결과가 직렬 실행과 같은지도 확인함
+"""
+
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from filter_core_v2 import SCREEN_ENGINES, read_csv_auto, screen_parallel
+
+def main():
+    ap = argparse.ArgumentParser(description="workers 수별 판정 처리량 벤치마크")
+    ap.add_argument("csv_path")
+    ap.add_argument("--repeat", type=int, default=1, help="입력 행을 N배로 복제해서 측정")
+    ap.add_argument("--engine", default="columnar", choices=list(SCREEN_ENGINES))
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    args = ap.parse_args()
+
+    df, _, _ = read_csv_auto(args.csv_path)
+    if args.repeat > 1:
+        df = pd.concat([df] * args.repeat, ignore_index=True)
+    screen = SCREEN_ENGINES[args.engine]
+    print(f"rows={len(df)} engine={args.engine} cpu={os.cpu_count()}")
+
+    serial = None
+    serial_sec = None
+    for w in sorted(set(args.workers)):
+        t0 = time.perf_counter()
+        out = screen_parallel(df, screen, w)
+        sec = time.perf_counter() - t0
+
+        if serial is None:
+            serial, serial_sec = out, sec
+            same = "-"
+        else:
+            same = "OK" if out.equals(serial) else "MISMATCH"
+        print(f"workers={w:<3} {sec:>8.3f}s  {len(df) / sec:>10.0f} rows/s  x{serial_sec / sec:>5.2f}  결과일치={same}")
+
+if __name__ == "__main__":
+    main()
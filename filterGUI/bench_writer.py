@@ -0,0 +1,71 @@
+# bench_writer.py
+# -*- coding: utf-8 -*-
+"""
+bench_writer.py - XLSX 저장 방식(result_writer 백엔드) 벤치마크
+
+사용법:
+    python bench_writer.py 審査データ.csv --repeat 10
+    python bench_writer.py 審査データ.csv --backends stream pandas
+    python bench_writer.py 審査データ.csv --layout single --slim
+
+CSV 를 한 번 판정해서 df_out 을 만든 뒤(--repeat 배로 복제),
+같은 df_out 을 각 저장 방식으로 기록하여 시간 / 처리량 / 파일 크기를 비교함
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from filter_core_v2 import output_frame, read_csv_auto, screen_columns
+from result_writer import LAYOUTS, WRITER_BACKENDS, write_result_workbook
+
+def build_df_out(csv_path: str, repeat: int, slim: bool = False) -> pd.DataFrame:
+    df, _, _ = read_csv_auto(csv_path)
+    if repeat > 1:
+        df = pd.concat([df] * repeat, ignore_index=True)
+    return output_frame(screen_columns(df), df, slim)
+
+def bench(df_out: pd.DataFrame, backends, out_dir: str, layout: str = "sheets"):
+    results = []
+    for backend in backends:
+        out_xlsx = os.path.join(out_dir, f"bench_{backend}.xlsx")
+        t0 = time.perf_counter()
+        try:
+            write_result_workbook(df_out, out_xlsx, backend=backend, layout=layout)
+        except RuntimeError as e:
+            print(f"- {backend}: 건너뜀 ({e})")
+            continue
+        sec = time.perf_counter() - t0
+        results.append({
+            "backend": backend,
+            "seconds": round(sec, 3),
+            "rows_per_sec": round(len(df_out) / sec) if sec > 0 else None,
+            "size_mb": round(os.path.getsize(out_xlsx) / 1024 / 1024, 2),
+        })
+    return results
+
+def main():
+    ap = argparse.ArgumentParser(description="XLSX 저장 방식 벤치마크")
+    ap.add_argument("csv_path")
+    ap.add_argument("--repeat", type=int, default=1, help="입력 행을 N배로 복제해서 측정")
+    ap.add_argument("--backends", nargs="+", default=list(WRITER_BACKENDS), choices=list(WRITER_BACKENDS))
+    ap.add_argument("--layout", default="sheets", choices=LAYOUTS, help="시트 구성 (run_filter 의 layout=)")
+    ap.add_argument("--slim", action="store_true", help="디버그용 컬럼 제외 (run_filter 의 slim=True)")
+    args = ap.parse_args()
+
+    df_out = build_df_out(args.csv_path, args.repeat, args.slim)
+    print(f"rows={len(df_out)} cols={df_out.shape[1]} layout={args.layout}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = bench(df_out, args.backends, tmp, args.layout)
+
+    base = next((r for r in results if r["backend"] == "pandas"), None)
+    for r in results:
+        ratio = f" (pandas 대비 x{base['seconds'] / r['seconds']:.2f})" if base and r["seconds"] else ""
+        print(f"{r['backend']:<11} {r['seconds']:>8.3f}s  {r['rows_per_sec']:>9} rows/s  {r['size_mb']:>7} MB{ratio}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+# filter_cli.py
+# -*- coding: utf-8 -*-
+"""
+filter_cli.py - run_filter 명령줄 실행 (GUI 없이 / 여러 파일 일괄 처리)
+
+사용법:
+    python -m filter_cli 審査データ.csv -o out/
+    python -m filter_cli "incoming/*.csv" other/a.csv -o out/ --jobs 4
+    python -m filter_cli data/*.csv -o out/ --layout single --slim --summary out/summary.json
+
+- 입력: 파일 경로 또는 glob 패턴 (여러 개 가능 / 쉘이 펼치지 않는 환경(Windows)에서도 동작)
+- 출력: -o 폴더에 <입력 파일명>.xlsx (이름이 겹치면 _2, _3 … 을 붙임)
+- --jobs N: 한 프로세스 풀(N개)에서 파일 단위로 동시에 판정
+           → 파일마다 인터프리터/pandas 를 새로 띄우지 않음 (각 워커는 pandas 를 한 번만 import)
+- 표준 출력: 파일별 결과 JSON (rows / NG / 要確認 건수 / 단계별 시간 / 오류). 진행 상황은 표준 에러로 출력
+- --server URL: 직접 판정하지 않고 상주 심사 서비스(filter_server)에 작업으로 제출 → 끝날 때까지 기다림
+               (결과 XLSX 는 서비스의 --out-dir 에 저장)
+- 종료 코드: 모두 성공 0 / 실패한 파일(없는 경로 포함)이 있으면 1
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from filter_core_v2 import LOAD_MODES, REASON_LANGS, RESULTS_DB, SCREEN_ENGINES, VERDICT_CACHE_DB, run_filter
+from result_writer import COMPANIONS, LAYOUTS, SHEET_ALL, SHEET_CHECK, SHEET_NG, WRITER_BACKENDS
+from run_profiler import RunProfiler
+
+def expand_inputs(patterns) -> list:
+    """파일 경로 / glob 패턴 → 입력 파일 목록 (지정 순서 유지, 중복 제거). 일치하는 파일이 없는 패턴은 그대로 남김"""
+    paths = []
+    for p in patterns:
+        hits = sorted(glob.glob(p, recursive=True)) if glob.has_magic(p) else [p]
+        paths.extend(h for h in hits if not os.path.isdir(h))
+        if not hits:
+            paths.append(p)    # 실행 시 "CSV 파일 없음" 오류로 보고
+    seen = set()
+    return [p for p in paths if not (os.path.abspath(p) in seen or seen.add(os.path.abspath(p)))]
+
+def output_paths(csv_paths, out_dir: str) -> list:
+    """입력 파일별 출력 XLSX 경로 (파일명이 같은 입력은 _2, _3 … 으로 구분)"""
+    used = set()
+    outs = []
+    for p in csv_paths:
+        stem = os.path.splitext(os.path.basename(p))[0]
+        name, k = stem, 1
+        while name.lower() in used:
+            k += 1
+            name = f"{stem}_{k}"
+        used.add(name.lower())
+        outs.append(os.path.join(out_dir, f"{name}.xlsx"))
+    return outs
+
+def screen_file(csv_path: str, out_xlsx: str, options: dict, progress=None, cancel_event=None) -> dict:
+    """
+    파일 1개 처리 → 결과 요약 (프로세스 풀 워커 / filter_server 에서 실행. 예외는 요약의 error 로 돌려줌)
+    progress / cancel_event: run_filter 에 그대로 전달
+    """
+    stats = {}
+    profile = RunProfiler(memory=None)
+    t0 = time.perf_counter()
+    try:
+        run_filter(csv_path, out_xlsx, stats=stats, profile=profile, progress=progress, cancel_event=cancel_event,
+                   **options)
+        error = None
+    except Exception as e:
+        error = str(e)
+    sheets = stats.get("sheet_rows", {})
+    return {
+        "input": csv_path,
+        "output": out_xlsx if error is None else None,
+        "ok": error is None,
+        "error": error,
+        "rows": stats.get("rows"),
+        "ng": sheets.get(SHEET_NG),
+        "check": sheets.get(SHEET_CHECK),
+        "ok_rows": (sheets[SHEET_ALL] - sheets[SHEET_NG] - sheets[SHEET_CHECK]) if sheets else None,
+        "encoding": stats.get("encoding"),
+        "companion": stats.get("companion"),
+        "run_id": stats.get("results_db", {}).get("run_id"),
+        "seconds": round(time.perf_counter() - t0, 3),
+        "phases": {p["phase"]: p["sec"] for p in profile.phases},
+    }
+
+def run_batch(csv_paths, out_dir: str, jobs: int = 1, options: dict = None, on_done=None) -> list:
+    """
+    여러 CSV 를 판정해서 out_dir 에 저장 → 파일별 요약 목록 (입력 순서)
+    jobs: 2 이상이면 프로세스 풀에서 파일 단위로 병렬 처리
+    on_done: 파일 하나가 끝날 때마다 on_done(요약) 호출 (끝난 순서)
+    """
+    options = dict(options or {})
+    os.makedirs(out_dir, exist_ok=True)
+    out_paths = output_paths(csv_paths, out_dir)
+    results = [None] * len(csv_paths)
+
+    def done(i, r):
+        results[i] = r
+        if on_done is not None:
+            on_done(r)
+
+    if jobs <= 1 or len(csv_paths) <= 1:
+        for i, (p, o) in enumerate(zip(csv_paths, out_paths)):
+            done(i, screen_file(p, o, options))
+        return results
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(csv_paths))) as executor:
+        futures = {executor.submit(screen_file, p, o, options): i
+                   for i, (p, o) in enumerate(zip(csv_paths, out_paths))}
+        for f in as_completed(futures):
+            done(futures[f], f.result())
+    return results
+
+def run_remote(csv_paths, out_dir: str, server: str, options: dict = None, on_done=None) -> list:
+    """
+    run_batch 와 같은 결과를 상주 심사 서비스(filter_server)에서 처리 (작업을 모두 제출한 뒤 입력 순서대로 기다림)
+    결과 XLSX 는 서비스의 --out-dir 에 같은 파일명으로 저장 (out_dir 은 파일명 구분에만 사용 / 실제 경로는 요약의 output)
+    verdict_cache / results_db 는 경로 대신 사용 여부만 전달 (서비스의 기본 위치)
+    """
+    from filter_server import OPTION_DEFAULT_PATHS, submit_job, wait_job
+
+    options = {k: (True if k in OPTION_DEFAULT_PATHS else v) for k, v in (options or {}).items() if v is not None}
+    names = [os.path.basename(o) for o in output_paths(csv_paths, out_dir)]
+    jobs = [submit_job(p, name, server, **options) for p, name in zip(csv_paths, names)]
+    results = []
+    for p, job in zip(csv_paths, jobs):
+        job = wait_job(job["id"], server)
+        r = job["result"] or {"input": p, "output": None, "ok": False, "error": job["error"] or f"❌ {job['status']}",
+                              "rows": None, "ng": None, "check": None, "ok_rows": None, "encoding": None,
+                              "companion": None, "run_id": None, "seconds": 0.0, "phases": {}}
+        r = dict(r, input=p, job_id=job["id"])
+        results.append(r)
+        if on_done is not None:
+            on_done(r)
+    return results
+
+def batch_summary(results: list, seconds: float) -> dict:
+    ok = [r for r in results if r["ok"]]
+    return {
+        "files": results,
+        "total": {
+            "files": len(results),
+            "failed": len(results) - len(ok),
+            "rows": sum(r["rows"] or 0 for r in ok),
+            "ng": sum(r["ng"] or 0 for r in ok),
+            "check": sum(r["check"] or 0 for r in ok),
+            "seconds": round(seconds, 3),
+        },
+    }
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="filter_cli", description="求人CSV 審査 (GUI なし / 複数ファイル一括)")
+    ap.add_argument("inputs", nargs="+", help="입력 CSV 경로 또는 glob 패턴")
+    ap.add_argument("-o", "--out-dir", required=True, help="결과 XLSX 저장 폴더")
+    ap.add_argument("-j", "--jobs", type=int, default=1, help="동시에 처리할 파일 수 (프로세스 풀 크기)")
+    ap.add_argument("--engine", default="columnar", choices=list(SCREEN_ENGINES))
+    ap.add_argument("--writer", default="stream", choices=list(WRITER_BACKENDS))
+    ap.add_argument("--layout", default="sheets", choices=LAYOUTS)
+    ap.add_argument("--slim", action="store_true", help="디버그용 컬럼 제외")
+    ap.add_argument("--lang", default="jp", choices=list(REASON_LANGS), help="理由(要約) 표시 언어")
+    ap.add_argument("--load", default="infer", choices=list(LOAD_MODES))
+    ap.add_argument("--chunksize", type=int, default=None,
+                    help="지정하면 스트리밍 모드 (chunksize 행씩 처리 / 항상 --load text 로 읽음)")
+    ap.add_argument("--companion", default=None, choices=list(COMPANIONS), help="전체 결과를 CSV/Parquet 로도 저장")
+    ap.add_argument("--verdict-cache", nargs="?", const=VERDICT_CACHE_DB, default=None,
+                    help="판정 캐시 사용 (경로 생략 시 기본 위치)")
+    ap.add_argument("--results-db", nargs="?", const=RESULTS_DB, default=None,
+                    help="판정 결과를 결과 DB 에 기록 (경로 생략 시 기본 위치 / 조회: python -m results_store)")
+    ap.add_argument("--summary", default=None, help="결과 요약 JSON 저장 경로 (표준 출력에도 출력)")
+    ap.add_argument("--server", default=None,
+                    help="상주 심사 서비스 주소 (例: http://127.0.0.1:8765 / unix:/tmp/filter.sock). 지정하면 작업으로 제출")
+    args = ap.parse_args(argv)
+
+    if args.jobs < 1:
+        ap.error(f"--jobs 는 1 이상이어야 함: {args.jobs}")
+    csv_paths = expand_inputs(args.inputs)
+
+    options = dict(engine=args.engine, writer=args.writer, layout=args.layout, slim=args.slim, lang=args.lang,
+                   load=args.load, chunksize=args.chunksize, companion=args.companion,
+                   verdict_cache=args.verdict_cache, results_db=args.results_db)
+
+    def report(r):
+        if r["ok"]:
+            print(f"✅ {r['input']}: {r['rows']}行 NG={r['ng']} 要確認={r['check']} ({r['seconds']:.1f}s)", file=sys.stderr)
+        else:
+            print(f"{r['error']} ({r['input']})", file=sys.stderr)
+
+    t0 = time.perf_counter()
+    if args.server:
+        results = run_remote(csv_paths, args.out_dir, args.server, options, on_done=report)
+    else:
+        results = run_batch(csv_paths, args.out_dir, args.jobs, options, on_done=report)
+    summary = batch_summary(results, time.perf_counter() - t0)
+
+    text = json.dumps(summary, ensure_ascii=False, indent=1)
+    print(text)
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            f.write(text)
+    return 1 if summary["total"]["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,10 +9,28 @@ filter_core_v2.py - 채용공고 자동 필터링 시스템 (Core)
 
 import os
 import re
+import codecs
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from typing import Optional, Tuple
+from datetime import date, datetime
+from typing import Callable, Optional, Tuple
 import json
+import functools
+import hashlib
+import time
+import threading
+from collections import deque
+from types import MappingProxyType
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from result_writer import COMPANIONS, LAYOUTS, WRITER_BACKENDS, open_result_writer
+from min_wage_table import MinWageTable, to_day, wages_in_force
+from municipalities import MUNICIPALITIES, SHARED_WARD_NAMES
+from input_snapshot import InputSnapshotCache
+from garbled_text import CITY_GARBLED_CHAR_TABLE, GARBLED_CHAR_TABLE, ROUNDTRIP_ENCODINGS, GarbledTextDetector
+from run_profiler import RunProfiler
+from verdict_cache import VerdictCache
+from results_store import ResultsStore
 
 # ============================================================
 # [최저임금 DB]
@@ -26,11 +44,16 @@ DEFAULT_MIN_WAGE = {
     "徳島": 1046, "香川": 1036, "愛媛": 1033, "高知": 1023, "福岡": 1057, "佐賀": 1030, "長崎": 1031,
     "熊本": 1034, "大分": 1035, "宮崎": 1023, "鹿児島": 1026, "沖縄": 1023,
 }
+# 기본값(令和7年度)의 발효일. 실제 발효일은 都道府県마다 다름(2025-10 ~ 2026-03)
+# → 정확한 날짜/다음 해 개정분은 設定(最低賃金) 에서 발효일을 지정해 버전으로 추가
+DEFAULT_MIN_WAGE_EFFECTIVE = "2025-10-01"
 
 # ============================================================
 # [최저임금 설정(영속화)]
 # GUI로 편집 → 저장하면 다음 번에도 반영
 # 저장 파일이 없으면 기본값 그대로
+# 파일 형식: {"versions": {発効日: {都道府県: 円/時}}} (발효일별 버전 → min_wage_table 참고)
+#           예전 형식 {都道府県: 円/時} 는 기본값 버전을 덮어쓴 것으로 읽음
 # ============================================================
 def get_desktop_dir() -> str:
     # Windows 바탕화면 경로
@@ -39,31 +62,64 @@ def get_desktop_dir() -> str:
 DESKTOP_DIR = get_desktop_dir()
 MIN_WAGE_JSON = os.path.join(DESKTOP_DIR, "FilteredTool_最低賃金.json")
 
-def load_min_wage() -> dict:
+def load_min_wage_versions() -> dict:
+    """{発効日: {都道府県: 円/時}}. 기본값 버전(DEFAULT_MIN_WAGE_EFFECTIVE)은 항상 47都道府県 전부 포함"""
+    versions = {DEFAULT_MIN_WAGE_EFFECTIVE: dict(DEFAULT_MIN_WAGE)}
     # 바탕화면에 파일 없으면 기본값
     if not os.path.exists(MIN_WAGE_JSON):
-        return dict(DEFAULT_MIN_WAGE)
+        return versions
 
     try:
         with open(MIN_WAGE_JSON, "r", encoding="utf-8") as f:
             data = json.load(f)
 
-        merged = dict(DEFAULT_MIN_WAGE)
-        for k, v in data.items():
-            if k in merged:
-                merged[k] = int(v)
-        return merged
+        saved = data["versions"] if "versions" in data else {DEFAULT_MIN_WAGE_EFFECTIVE: data}
+        for eff, wages in saved.items():
+            date.fromisoformat(eff)
+            version = versions.setdefault(eff, {})
+            for k, v in wages.items():
+                if k in DEFAULT_MIN_WAGE:
+                    version[k] = int(v)
+        return {eff: w for eff, w in versions.items() if w}
     except Exception:
-        return dict(DEFAULT_MIN_WAGE)
+        return {DEFAULT_MIN_WAGE_EFFECTIVE: dict(DEFAULT_MIN_WAGE)}
 
-def save_min_wage(new_map: dict) -> str:
+def load_min_wage(as_of: Optional[date] = None) -> dict:
+    """as_of(기본: 오늘) 시점에 유효한 {都道府県: 円/時}"""
+    return wages_in_force(load_min_wage_versions(), as_of or date.today())
+
+def latest_min_wage_effective() -> str:
+    """가장 최근 버전의 発効日 (설정 화면의 기본값)"""
+    return max(load_min_wage_versions())
+
+def save_min_wage(new_map: dict, effective: Optional[str] = None, base: Optional[dict] = None) -> str:
+    """
+    new_map 을 발효일 effective(기본: 가장 최근 버전)의 값으로 저장.
+    그 전날까지 유효한 값과 같은 都道府県은 버전에 넣지 않음 (바뀐 都道府県만 기록)
+    base: 편집 화면에 처음 보여 준 값. 주면 base 와 다른 都道府県(고친 것)만 effective 시점에 유효한 값 위에 덮어씀
+          → 최근 버전을 보여 주고 더 이른 발효일로 저장해도 나중 버전의 값이 앞당겨 기록되지 않음
+    """
+    versions = load_min_wage_versions()
+    effective = effective or max(versions)
+    if base is not None:
+        edited = {k: int(v) for k, v in new_map.items() if base.get(k) != int(v)}
+        new_map = dict(wages_in_force(versions, date.fromisoformat(effective)), **edited)
+    if effective == DEFAULT_MIN_WAGE_EFFECTIVE:
+        # 기본값 버전은 항상 47都道府県 전부
+        versions[effective] = {k: int(new_map.get(k, v)) for k, v in DEFAULT_MIN_WAGE.items()}
+    else:
+        day = date.fromisoformat(effective)   # 형식 확인 (YYYY-MM-DD)
+        versions.pop(effective, None)
+        before = wages_in_force(versions, day)
+        changed = {k: int(v) for k, v in new_map.items() if before.get(k) != int(v)}
+        if changed:
+            versions[effective] = changed
     with open(MIN_WAGE_JSON, "w", encoding="utf-8") as f:
-        json.dump(new_map, f, ensure_ascii=False, indent=2)
+        json.dump({"versions": dict(sorted(versions.items()))}, f, ensure_ascii=False, indent=2)
+    _forget_current_rules()   # 다음 current_rules() 에서 다시 읽음 (수정 시각이 같아도)
     return MIN_WAGE_JSON
 
-MIN_WAGE = load_min_wage()
-PREF_LIST = list(MIN_WAGE.keys())
-PREF_RE = re.compile("|".join(map(re.escape, sorted(PREF_LIST, key=len, reverse=True))))
+PREF_LIST = list(DEFAULT_MIN_WAGE.keys())
 
 # ============================================================
 # [허용되는 고용형태]
@@ -78,6 +134,23 @@ ALLOWED_EMPLOYMENT = {
 EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$")
 SPECIAL_COMPANY_MARKS = ["㈱", "（株）", "(株)", "㈲", "（有）", "(有)"]
 
+# 職種 에 섞이면 안 되는 단어 (모집 조건 / 고용형태 / 근무 조건 / 직책)
+JOB_CONDITION_TOKENS = [
+    "募集", "急募", "大募集", "積極採用", "オープニング", "新規",
+    "正社員", "契約社員", "派遣社員", "アルバイト", "パート", "業務委託",
+    "夜勤", "日勤", "深夜", "早朝", "交替", "シフト", "残業",
+    "未経験", "経験不問", "学歴不問", "資格不問", "○○不問", "歓迎", "優遇",
+    "高収入", "日払い", "週払い", "即日", "短期", "長期", "寮", "社宅",
+    "在宅", "リモート", "テレワーク",
+    "マネージャー", "リーダー", "部長", "課長", "係長", "主任", "候補",
+]
+FACILITY_TOKENS = [
+    "病院", "クリニック", "医院", "歯科",
+    "学校", "大学", "専門学校", "保育園", "幼稚園",
+    "ホテル", "旅館",
+    "空港", "センター", "工場", "倉庫", "店舗", "営業所", "本社", "支店",
+]
+
 # unitText 규칙
 UNIT_MAP = {1: "HOUR", 2: "DAY", 3: "MONTH", 4: "YEAR", 5: "WEEK"}
 
@@ -88,6 +161,163 @@ ASSUME_HOURS_PER_DAY = 8.0
 ASSUME_HOURS_PER_MONTH = 160.0   # 8h * 20d
 ASSUME_HOURS_PER_YEAR = 1920.0   # 160h * 12m
 
+# unitText 코드별 환산 시간 (minValue 하한 = 최저임금 × 환산 시간)
+UNIT_HOURS = {1: 1.0, 2: ASSUME_HOURS_PER_DAY, 3: ASSUME_HOURS_PER_MONTH, 4: ASSUME_HOURS_PER_YEAR}
+# 시급 환산 근거의 고정 내역 (환산 시간이 기본값일 때만 표시)
+UNIT_HOURS_NOTES = {3: ":8h×20d", 4: ":160h×12m"}
+
+# ============================================================
+# [규칙 설정] RuleConfig
+# 판정에 쓰는 설정(최저임금 표 / 토큰 목록 / 환산 시간)과 그것으로 만든 매처를 한 객체로 묶음
+# - 변경 불가. 설정을 바꾸려면 replace(...) → 새 객체
+#   (바뀌지 않은 설정에만 의존하는 매처/표는 이전 객체의 것을 그대로 재사용)
+# - 매처/표는 처음 쓸 때 한 번만 만듦 (cached_property)
+# - key: 설정 내용의 해시 → 판정 캐시 등 하위 캐시의 키 (rules_fingerprint)
+# - run_filter(rules=None) 은 current_rules() 를 사용 → 設定(最低賃金) 저장 후 재시작 없이 반영
+# ============================================================
+class RuleConfig:
+    # 설정 이름 → 이 설정으로 만드는 부분
+    SETTINGS = ("min_wage_versions", "prefs", "allowed_employment", "special_company_marks",
+                "job_condition_tokens", "unit_hours")
+    DERIVED = {
+        "pref_re": ("prefs",),
+        "min_wage_table": ("min_wage_versions", "prefs"),
+        "special_mark_matcher": ("special_company_marks",),
+        "job_condition_matcher": ("job_condition_tokens",),
+    }
+
+    def __init__(self, min_wage_versions: Optional[dict] = None, prefs=PREF_LIST,
+                 allowed_employment=ALLOWED_EMPLOYMENT, special_company_marks=SPECIAL_COMPANY_MARKS,
+                 job_condition_tokens=JOB_CONDITION_TOKENS, unit_hours: dict = UNIT_HOURS):
+        """min_wage_versions: {発効日: {都道府県: 円/時}} (생략 시 기본값 버전만)"""
+        if min_wage_versions is None:
+            min_wage_versions = {DEFAULT_MIN_WAGE_EFFECTIVE: DEFAULT_MIN_WAGE}
+        if set(map(int, unit_hours)) != set(UNIT_HOURS):
+            raise ValueError(f"❌ 환산 시간은 unitText 코드 {', '.join(map(str, UNIT_HOURS))} 에 대해 지정해야 함")
+        values = {
+            "min_wage_versions": MappingProxyType({
+                str(eff): MappingProxyType({k: int(v) for k, v in wages.items()})
+                for eff, wages in sorted(min_wage_versions.items())
+            }),
+            "prefs": tuple(prefs),
+            "allowed_employment": frozenset(allowed_employment),
+            "special_company_marks": tuple(special_company_marks),
+            "job_condition_tokens": tuple(job_condition_tokens),
+            "unit_hours": MappingProxyType({int(k): float(v) for k, v in sorted(unit_hours.items())}),
+        }
+        # 설정별 정규화된 내용 (비교 / 해시용)
+        parts = {
+            "min_wage_versions": {eff: dict(w) for eff, w in values["min_wage_versions"].items()},
+            "prefs": list(values["prefs"]),
+            "allowed_employment": sorted(values["allowed_employment"]),
+            "special_company_marks": list(values["special_company_marks"]),
+            "job_condition_tokens": list(values["job_condition_tokens"]),
+            "unit_hours": {str(k): v for k, v in values["unit_hours"].items()},
+        }
+        parts = {k: json.dumps(v, ensure_ascii=False, sort_keys=True) for k, v in parts.items()}
+        for k, v in values.items():
+            object.__setattr__(self, k, v)
+        object.__setattr__(self, "_parts", parts)
+        object.__setattr__(self, "key",
+                           hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()[:16])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"❌ RuleConfig 는 변경할 수 없음: replace({name}=...) 로 새 설정을 만들 것")
+
+    def __eq__(self, other):
+        return isinstance(other, RuleConfig) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return f"RuleConfig(key={self.key})"
+
+    def settings(self) -> dict:
+        """설정 값 (일반 dict/list) → RuleConfig(**settings) 로 같은 설정을 다시 만들 수 있음"""
+        return {
+            "min_wage_versions": {eff: dict(w) for eff, w in self.min_wage_versions.items()},
+            "prefs": list(self.prefs),
+            "allowed_employment": set(self.allowed_employment),
+            "special_company_marks": list(self.special_company_marks),
+            "job_condition_tokens": list(self.job_condition_tokens),
+            "unit_hours": dict(self.unit_hours),
+        }
+
+    def replace(self, **changes) -> "RuleConfig":
+        """일부 설정만 바꾼 새 RuleConfig. 바뀐 설정에 의존하는 부분만 다시 만듦 (내용이 같으면 self)"""
+        unknown = set(changes) - set(self.SETTINGS)
+        if unknown:
+            raise ValueError(f"❌ 알 수 없는 규칙 설정: {', '.join(sorted(unknown))}")
+        new = RuleConfig(**{**self.settings(), **changes})
+        if new.key == self.key:
+            return self
+        for name, deps in self.DERIVED.items():
+            if name in self.__dict__ and all(new._parts[d] == self._parts[d] for d in deps):
+                new.__dict__[name] = self.__dict__[name]
+        return new
+
+    def __reduce__(self):
+        # 프로세스 풀로 넘길 때 이미 만든 매처/표도 함께 보냄 (워커에서 다시 만들지 않음)
+        return _restore_rules, (self.settings(), {k: self.__dict__[k] for k in self.DERIVED if k in self.__dict__})
+
+    # --------------------------------------------------------
+    # 설정으로 만드는 부분 (처음 쓸 때 한 번만)
+    # --------------------------------------------------------
+    @functools.cached_property
+    def pref_re(self) -> re.Pattern:
+        return re.compile("|".join(map(re.escape, sorted(self.prefs, key=len, reverse=True))))
+
+    @functools.cached_property
+    def min_wage_table(self) -> MinWageTable:
+        return MinWageTable(self.min_wage_versions, self.prefs)
+
+    @functools.cached_property
+    def special_mark_matcher(self) -> "TokenMatcher":
+        return TokenMatcher(self.special_company_marks)
+
+    @functools.cached_property
+    def job_condition_matcher(self) -> "TokenMatcher":
+        return TokenMatcher(self.job_condition_tokens)
+
+    def min_wage(self, as_of: Optional[date] = None) -> dict:
+        """as_of(기본: 오늘) 시점에 유효한 {都道府県: 円/時}"""
+        return wages_in_force(self.min_wage_versions, as_of or date.today())
+
+def _restore_rules(settings: dict, derived: dict) -> RuleConfig:
+    rules = RuleConfig(**settings)
+    rules.__dict__.update(derived)
+    return rules
+
+DEFAULT_RULES = RuleConfig()   # 기본값 (설정 파일 무시)
+
+_current = {"stamp": None, "rules": None}
+_current_lock = threading.Lock()
+
+def _settings_stamp():
+    try:
+        st = os.stat(MIN_WAGE_JSON)
+        return st.st_mtime_ns, st.st_size
+    except OSError:
+        return None
+
+def _forget_current_rules():
+    with _current_lock:
+        _current["stamp"] = object()   # 어떤 파일 상태와도 다름 → 다음 호출에서 다시 읽음
+
+def current_rules() -> RuleConfig:
+    """
+    설정 파일(MIN_WAGE_JSON)의 현재 내용으로 만든 RuleConfig.
+    파일이 바뀌지 않았으면 이전 객체를 그대로 돌려줌 (바뀌었으면 최저임금 표만 다시 만듦)
+    """
+    stamp = _settings_stamp()
+    with _current_lock:
+        if _current["rules"] is None or _current["stamp"] != stamp:
+            base = _current["rules"] or DEFAULT_RULES
+            _current["rules"] = base.replace(min_wage_versions=load_min_wage_versions())
+            _current["stamp"] = stamp
+        return _current["rules"]
+
 # ============================================================
 # [입력 데이터 컬럼 맵핑]
 # ============================================================
@@ -102,6 +332,13 @@ col_address        = "勤務地住所"
 col_worktime       = "勤務時間/月平均所定労働時間"
 col_wage_unit      = "給与形態（unitText）"
 col_wage_lower     = "給与下限（minValue）"
+col_posted         = "掲載開始日"   # 최저임금 표 버전 선택 기준일 (없거나 읽을 수 없으면 실행일)
+
+# 판정에 사용하는 컬럼 (나머지 컬럼은 결과 뒤에 그대로 붙이기만 함)
+SCREEN_INPUT_COLS = [
+    col_work_company, col_intro_company, col_email, col_employment, col_job,
+    col_city, col_pref, col_address, col_worktime, col_wage_unit, col_wage_lower, col_posted,
+]
 
 # ============================================================
 # [유틸리티 함수]
@@ -132,29 +369,198 @@ def to_float_safe(x) -> Optional[float]:
     except Exception:
         return None
 
+POSTED_DATE_RE = re.compile(r"^(\d{4})[-/.年](\d{1,2})[-/.月](\d{1,2})")   # 2025-10-01 / 2025/10/01 12:00 / 2025年10月1日
+
+def parse_posted_day(x) -> Optional[int]:
+    """掲載開始日 → 1970-01-01 기준 일수 (읽을 수 없으면 None → 실행일 기준)"""
+    m = POSTED_DATE_RE.match(safe_strip(x))
+    if not m:
+        return None
+    try:
+        return to_day(date(*map(int, m.groups())))
+    except ValueError:
+        return None
+
+# 문자 깨짐: 표 기반 검출기 (garbled_text.py). 市区町村 은 지명 전용 문자(공백 / 깨짐에서 자주 보이는 한자)를 더한 표
+GARBLED_DETECTOR = GarbledTextDetector()
+CITY_GARBLED_DETECTOR = GarbledTextDetector(CITY_GARBLED_CHAR_TABLE)
+
 def has_garbled_text(s: str) -> bool:
     if not isinstance(s, str) or s.strip() == "":
         return False
-    if " " in s:
-        return True
-    if re.search(r"[\x00-\x08\x0B\x0C\x0E-\x1F]", s):
-        return True
-    if re.search(r"闖|驥|伴", s):
-        return True
-    return False
-
-def find_pref_anywhere(*texts: str) -> Tuple[str, str]:
+    return CITY_GARBLED_DETECTOR.is_garbled(s)
+
+class TokenMatcher:
+    """
+    여러 토큰을 한 번의 스캔으로 찾는 매처 (토큰 전체를 하나의 교대 패턴으로 컴파일).
+    같은 위치에서는 긴 토큰 우선 (例: "大募集" 이 "募集" 보다 먼저)
+    """
+
+    def __init__(self, tokens):
+        self.tokens = list(tokens)
+        self.regex = re.compile("|".join(map(re.escape, sorted(set(self.tokens), key=len, reverse=True))))
+
+    def search(self, s: str) -> bool:
+        return self.regex.search(s) is not None
+
+    def hits(self, s: str) -> str:
+        """s 에 포함된 토큰 (등장 순, 중복 제거) → "、" 로 연결. 없으면 "" """
+        return "、".join(dict.fromkeys(self.regex.findall(s)))
+
+    def hits_col(self, s: pd.Series) -> np.ndarray:
+        """hits 의 컬럼 버전 (s 는 _text_col 결과)"""
+        out = np.full(len(s), "", dtype=object)
+        matched = s.str.contains(self.regex).to_numpy(dtype=bool)
+        out[matched] = [self.hits(v) for v in s.to_numpy()[matched]]   # 해당 행만 다시 스캔
+        return out
+
+class MunicipalityIndex:
+    """
+    市区町村名 → 都道府県 해시 색인 (municipalities.py 사전).
+    이름의 끝 글자(市/区)가 나오는 위치마다 그 위치에서 끝나는 이름을 긴 것부터 조회
+    (北広島市 / 広島市, 大和郡山市 / 郡山市 → 긴 이름 우선). 왼쪽에서 처음 찾은 이름을 사용
+    → 텍스트 길이 × 최대 이름 길이 이내의 dict 조회로 끝남
+    이름 바로 앞이 한자/가나면 단어 중간으로 보고 무시 (観光市場 → 光市 X / 勤務地：柏市 → O)
+    """
+    WORD_CHAR_RE = re.compile(r"[一-鿿々〆ヵヶぁ-んァ-ヴー]")
+
+    def __init__(self, table: dict, ambiguous=()):
+        self.index = {}
+        for pref, names in table.items():
+            for name in names.split():
+                # 여러 都道府県에 같은 이름 → "" (판별 불가)
+                self.index[name] = pref if self.index.get(name, pref) == pref else ""
+        for name in ambiguous:
+            self.index[name] = ""
+        self.tails = {name[-1] for name in self.index}
+        self.max_len = max(map(len, self.index))
+
+    def find(self, s: str) -> Tuple[str, str]:
+        """return: (市区町村名, 都道府県). 못 찾으면 ("", "")"""
+        for end, ch in enumerate(s, start=1):
+            if ch not in self.tails:
+                continue
+            for start in range(max(end - self.max_len, 0), end - 1):
+                pref = self.index.get(s[start:end])
+                if pref is None or (start and self.WORD_CHAR_RE.match(s[start - 1])):
+                    continue
+                if pref:
+                    return s[start:end], pref
+                break   # 판별 불가 이름 → 이 위치의 더 짧은 이름은 보지 않음 (府中市 → 中市 등)
+        return "", ""
+
+MUNICIPALITY_INDEX = MunicipalityIndex(MUNICIPALITIES, SHARED_WARD_NAMES)
+
+@functools.lru_cache(maxsize=100_000)
+def find_municipality(s: str) -> Tuple[str, str]:
+    # 같은 住所/市区町村 값이 여러 행에 반복되므로 서로 다른 값 단위로 캐시
+    return MUNICIPALITY_INDEX.find(s)
+
+def find_pref_anywhere(*texts: str, municipal_texts: int = 0,
+                       rules: Optional[RuleConfig] = None) -> Tuple[str, str]:
+    """
+    texts 를 순서대로 보고 都道府県명을 찾음.
+    앞에서 municipal_texts 개(住所/市区町村)는 都道府県명이 없으면 市区町村名 사전으로도 찾음
+    """
+    pref_re = (rules or current_rules()).pref_re
     for i, t in enumerate(texts, start=1):
         s = safe_strip(t)
         if not s:
             continue
-        m = PREF_RE.search(s)
+        m = pref_re.search(s)
         if m:
             return m.group(0), f"テキスト#{i}から都道府県を抽出"
+        if i <= municipal_texts:
+            name, pref = find_municipality(s)
+            if pref:
+                return pref, f"テキスト#{i}の市区町村名({name})から都道府県を推定"
     return "", "都道府県抽出失敗"
 
 # ============================================================
-# [데이터 검증 함수 - 9개 체크항목]
+# [CSV 인코딩 판별]
+# BOM + 앞부분 샘플(바이트)만 보고 코덱을 한 번에 결정 → CSV 는 한 번만 파싱
+# (기존: utf-8-sig → cp932 → utf-8 순서로 전체 파싱을 최대 3번 반복)
+# ============================================================
+ENCODING_SAMPLE_BYTES = 1024 * 1024   # 판별에 사용하는 앞부분 크기 (1MB)
+CSV_ENCODINGS = ["utf-8-sig", "cp932", "utf-8"]
+JP_CHAR_RE = re.compile(r"[　-ヿ一-鿿！-～]")  # 가나/한자/전각 기호
+NON_ASCII_RE = re.compile(r"[^\x00-\x7F]")
+
+def _decodes(sample: bytes, encoding: str, final: bool) -> Optional[str]:
+    # 샘플 끝에서 잘린 멀티바이트 문자는 오류로 보지 않음 (final=False)
+    try:
+        return codecs.getincrementaldecoder(encoding)().decode(sample, final=final)
+    except UnicodeDecodeError:
+        return None
+
+def detect_csv_encoding(csv_path: str, sample_bytes: int = ENCODING_SAMPLE_BYTES) -> Tuple[str, float]:
+    """
+    return: (인코딩, 신뢰도 0.0~1.0)
+    - UTF-8 BOM 있음        → utf-8-sig (1.0)
+    - 샘플이 UTF-8 로 정상  → utf-8 (멀티바이트 포함 0.99 / ASCII 만 0.6)
+    - 샘플이 cp932 로 정상  → cp932 (0.5~0.99, 일본어 문자 비율로 가중)
+    - 둘 다 실패           → 깨진 문자가 적은 쪽 (0.0)
+    """
+    with open(csv_path, "rb") as f:
+        sample = f.read(sample_bytes)
+        final = f.read(1) == b""
+
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig", 1.0
+
+    if _decodes(sample, "utf-8", final) is not None:
+        return "utf-8", (0.6 if sample.isascii() else 0.99)
+
+    text = _decodes(sample, "cp932", final)
+    if text is not None:
+        non_ascii = len(NON_ASCII_RE.findall(text))
+        jp = len(JP_CHAR_RE.findall(text))
+        return "cp932", round(0.5 + 0.49 * jp / max(non_ascii, 1), 2)
+
+    errors = {
+        enc: sample.decode(enc, errors="replace").count("�")
+        for enc in ("utf-8", "cp932")
+    }
+    return min(errors, key=errors.get), 0.0
+
+def read_csv_auto(csv_path: str, **kwargs) -> Tuple[pd.DataFrame, str, float]:
+    """
+    인코딩을 판별한 뒤 한 번만 read_csv.
+    샘플 이후에서 디코딩 오류가 난 경우에만 나머지 코덱으로 재시도한다.
+    return: (DataFrame, 사용한 인코딩, 신뢰도)
+    """
+    enc, confidence = detect_csv_encoding(csv_path)
+    candidates = [enc] + [e for e in CSV_ENCODINGS if e != enc]
+
+    last_err = None
+    for i, e in enumerate(candidates):
+        try:
+            df = pd.read_csv(csv_path, encoding=e, **kwargs)
+            return df, e, (confidence if i == 0 else 0.0)
+        except UnicodeDecodeError as err:
+            last_err = err
+        except Exception as err:
+            raise RuntimeError(f"❌ CSV 읽기 실패: {err}") from err
+
+    raise RuntimeError(f"❌ CSV 읽기 실패: {last_err}")
+
+# ============================================================
+# [입력 로드 방식] read_csv 옵션
+# - "infer": pandas 타입 추론 (기존). 결측이 섞인 숫자 컬럼은 float 가 됨 (求人ID 12345 → 12345.0)
+# - "text" : 모든 컬럼을 문자열(object)로 읽음 → 판정 안 하는 컬럼도 원문 그대로 결과에 실림
+#            (求人ID·郵便番号 의 앞자리 0 / 자릿수 유지)
+#   판정 컬럼(SCREEN_INPUT_COLS)의 숫자(給与形態/給与下限)는 체크에서 고유값 단위로 float() 변환하므로
+#   판정 결과는 "infer" 와 동일. 결측으로 보는 셀(空欄/NA 등)도 pandas 기본값 그대로
+#   ※ 출력 충실도용이며 빠르지 않음: 숫자 컬럼도 파이썬 객체가 되므로 메모리는 "infer" 보다 큼
+#     (비교: python bench_jobdata.py --load infer text --skip-write)
+# ============================================================
+LOAD_MODES = {
+    "infer": {},
+    "text": {"dtype": object},
+}
+
+# ============================================================
+# [데이터 검증 함수 - 10개 체크항목]
 # ============================================================
 REQUIRED_COLS_BASE = [
     col_work_company, col_employment, col_job, col_email,
@@ -184,30 +590,32 @@ def check_email(row):
             return "NG", f"メール形式不正: {p}"
     return "OK", ""
 
-def check_employment(row):
+def check_employment(row, rules: Optional[RuleConfig] = None):
     v = safe_strip(row.get(col_employment))
     if v == "":
         return "NG", "雇用形態が空欄"
-    if v not in ALLOWED_EMPLOYMENT:
+    if v not in (rules or current_rules()).allowed_employment:
         return "NG", f"雇用形態が許可表記と不一致: {v}"
     return "OK", ""
 
-def check_company_special(row):
+def check_company_special(row, rules: Optional[RuleConfig] = None):
     """[체크 1] 채용처 회사명: 특수기호(㈱) 확인"""
     v = safe_strip(row.get(col_work_company))
     if v == "":
         return "NG", "採用先会社名空欄" # 채용처 회사명 공란
-    if any(mark in v for mark in SPECIAL_COMPANY_MARKS):
-        return "NG", "採用先に特殊記号を含む(㈱)" # 채용처에 특수기호 포함(㈱)
+    marks = (rules or current_rules()).special_mark_matcher.hits(v)
+    if marks:
+        return "NG", f"採用先に特殊記号を含む(㈱): {marks}" # 채용처에 특수기호 포함(㈱) + 해당 기호
     return "OK", ""
 
-def check_intro_company_special(row):
+def check_intro_company_special(row, rules: Optional[RuleConfig] = None):
     """[체크 2] 소개원 회사명: 특수기호(㈱) 확인"""
     v = safe_strip(row.get(col_intro_company))
     if v == "":
         return "OK", ""  # 공란 허용
-    if any(mark in v for mark in SPECIAL_COMPANY_MARKS):
-        return "NG", "紹介元に特殊記号を含む(㈱)" # 소개원에 특수기호 포함(㈱)
+    marks = (rules or current_rules()).special_mark_matcher.hits(v)
+    if marks:
+        return "NG", f"紹介元に特殊記号を含む(㈱): {marks}" # 소개원에 특수기호 포함(㈱) + 해당 기호
     return "OK", ""
 
 def check_private_intro(row):
@@ -244,21 +652,25 @@ def check_city_garbled(row):
         return "NG", "市区町村に文字化けの可能性"
     return "OK", ""
 
-JOB_CONDITION_TOKENS = [
-    "募集", "急募", "大募集", "積極採用", "オープニング", "新規",
-    "正社員", "契約社員", "派遣社員", "アルバイト", "パート", "業務委託",
-    "夜勤", "日勤", "深夜", "早朝", "交替", "シフト", "残業",
-    "未経験", "経験不問", "学歴不問", "資格不問", "○○不問", "歓迎", "優遇",
-    "高収入", "日払い", "週払い", "即日", "短期", "長期", "寮", "社宅",
-    "在宅", "リモート", "テレワーク",
-    "マネージャー", "リーダー", "部長", "課長", "係長", "主任", "候補",
-]
-FACILITY_TOKENS = [
-    "病院", "クリニック", "医院", "歯科",
-    "学校", "大学", "専門学校", "保育園", "幼稚園",
-    "ホテル", "旅館",
-    "空港", "センター", "工場", "倉庫", "店舗", "営業所", "本社", "支店",
-]
+def garbled_scan_cols(df: pd.DataFrame) -> list:
+    """
+    문자 깨짐을 검사할 컬럼 = 입력의 모든 문자열 컬럼 (職務内容 / 給与 / PR 등 판정에 안 쓰는 자유 기술 컬럼 포함, 입력 순서).
+    숫자 컬럼은 깨질 수 없으므로 제외. 市区町村 은 check_city_garbled 에서 NG 로 따로 처리
+    """
+    return [c for c in df.columns if c != col_city and pd.api.types.is_string_dtype(df[c].dtype)]
+
+def check_text_garbled(row, cols=None):
+    """
+    문자열 컬럼 전체의 문자 깨짐 (cp932/utf-8 혼동 등) → 해당 컬럼명
+    cols: 검사할 컬럼 (garbled_scan_cols(df)). 생략 시 행의 모든 컬럼
+    """
+    if cols is None:
+        cols = [c for c in row.index if c != col_city]
+    hits = [str(c) for c in cols if GARBLED_DETECTOR.is_garbled(safe_strip(row.get(c)))]
+    if hits:
+        return "要確認", "文字化けの可能性: " + ", ".join(hits)
+    return "OK", ""
+
 PLACE_INNER_RE = re.compile(r"(区|市|町|村|駅)")
 
 def looks_like_place(s: str) -> bool:
@@ -267,18 +679,20 @@ def looks_like_place(s: str) -> bool:
         return False
     return bool(PLACE_INNER_RE.search(t))
 
-def check_job_title(row):
+def check_job_title(row, rules: Optional[RuleConfig] = None):
+    rules = rules or current_rules()
     v = safe_strip(row.get(col_job))
     if v == "":
         return "NG", "職種が空欄" # 직종 공란
 
-    if PREF_RE.search(v):
+    if rules.pref_re.search(v):
         return "NG", "職種に地域名（都道府県）が含まれている" # 직종에 지역명(도도부현) 포함
     if looks_like_place(v):
         return "NG", "職種に地名形式（○○区／市／町／村／駅）が含まれている" # 직종에 지명형식(○○구/시/町/村/역) 포함
 
-    if any(t in v for t in JOB_CONDITION_TOKENS):
-        return "要確認", "職種に募集条件・雇用形態・勤務条件等が混在している可能性" # 직종에 모집/고용형태/근무시간/역할/조건 혼합 가능
+    tokens = rules.job_condition_matcher.hits(v)
+    if tokens:
+        return "要確認", f"職種に募集条件・雇用形態・勤務条件等が混在している可能性: {tokens}" # 직종에 모집/고용형태/근무시간/역할/조건 혼합 가능 + 해당 단어
 
     if re.search(r"\d", v):
         return "要確認", "職種に数字が含まれている（管理番号等の可能性）" # 직종에 숫자 포함(관리번호 가능성)
@@ -288,9 +702,11 @@ def check_job_title(row):
 # ============================================================
 # [최저임금 판정]
 # ============================================================
-def resolve_pref(row) -> Tuple[str, str]:
+def resolve_pref(row, rules: Optional[RuleConfig] = None) -> Tuple[str, str]:
+    rules = rules or current_rules()
+    known = rules.min_wage_table.codes
     pref_raw = safe_strip(row.get(col_pref))
-    if pref_raw in MIN_WAGE:
+    if pref_raw in known:
         return pref_raw, "GFJ都道府県を使用"
 
     addr = safe_strip(row.get(col_address))
@@ -298,48 +714,57 @@ def resolve_pref(row) -> Tuple[str, str]:
     job  = safe_strip(row.get(col_job))
     comp = safe_strip(row.get(col_work_company))
 
-    pref2, b2 = find_pref_anywhere(addr, city, job, comp)
-    if pref2 in MIN_WAGE:
+    pref2, b2 = find_pref_anywhere(addr, city, job, comp, municipal_texts=2, rules=rules)
+    if pref2 in known:
         return pref2, b2
 
     return "", "都道府県不明(補完失敗)"
 
-def hourly_from_unit(unit_code: int, amount: float):
+def hourly_from_unit(unit_code: int, amount: float, rules: Optional[RuleConfig] = None):
     unit = UNIT_MAP.get(unit_code, "UNKNOWN")
+    hours = (rules or current_rules()).unit_hours
 
     if unit == "HOUR":
         return amount, "HOUR: 下限をそのまま時給として使用"
 
+    def note(code):
+        return UNIT_HOURS_NOTES.get(code, "") if hours[code] == UNIT_HOURS[code] else ""
+
     if unit == "DAY":
-        return amount / ASSUME_HOURS_PER_DAY, f"DAY→時給: {ASSUME_HOURS_PER_DAY}h/日(固定)で換算"
+        return amount / hours[2], f"DAY→時給: {hours[2]}h/日(固定{note(2)})で換算"
 
     if unit == "MONTH":
-        return amount / ASSUME_HOURS_PER_MONTH, f"MONTH→時給: {ASSUME_HOURS_PER_MONTH}h/月(固定:8h×20d)で換算"
+        return amount / hours[3], f"MONTH→時給: {hours[3]}h/月(固定{note(3)})で換算"
 
     if unit == "YEAR":
-        return amount / ASSUME_HOURS_PER_YEAR, f"YEAR→時給: {ASSUME_HOURS_PER_YEAR}h/年(固定:160h×12m)で換算"
+        return amount / hours[4], f"YEAR→時給: {hours[4]}h/年(固定{note(4)})で換算"
 
     if unit == "WEEK":
         return None, "WEEK: 想定外(要確認) - 時給換算しない"
 
     return None, "給与形態(unitText)不明"
 
-def judge_min_wage(row):
-    pref, pref_basis = resolve_pref(row)
+def judge_min_wage(row, rules: Optional[RuleConfig] = None):
+    rules = rules or current_rules()
+    table = rules.min_wage_table
+    pref, pref_basis = resolve_pref(row, rules)
     unit_code = to_int_safe(row.get(col_wage_unit))
     lower = to_float_safe(row.get(col_wage_lower))
 
     if pref == "":
         return "NG", "最低賃金判定不可(都道府県不明)", None, None, None, pref_basis
 
-    minw = float(MIN_WAGE[pref])
+    # 掲載開始日 시점에 유효한 버전 (없으면 실행일 기준)
+    day = parse_posted_day(row.get(col_posted))
+    i, minw = table.entry(pref, to_day(date.today()) if day is None else day)
+    pref_basis = f"{pref_basis} / 最低賃金{table.effective(i)}発効分"
 
     if unit_code is None:
         return "NG", "最低賃金判定不可(給与形態unitText不明)", pref, minw, None, pref_basis
     if lower is None:
         return "NG", "最低賃金判定不可(給与下限minValue不明)", pref, minw, None, pref_basis
 
-    hourly, basis = hourly_from_unit(unit_code, lower)
+    hourly, basis = hourly_from_unit(unit_code, lower, rules)
 
     if hourly is None and UNIT_MAP.get(unit_code) == "WEEK":
         return "要確認", "最低賃金要確認(週給は想定外)", pref, minw, None, f"{pref_basis} / {basis}"
@@ -347,52 +772,171 @@ def judge_min_wage(row):
     if hourly is None:
         return "NG", "最低賃金判定不可(時給換算不可)", pref, minw, None, f"{pref_basis} / {basis}"
 
+    # 환산 시급과 비교 (minValue 와 "최저임금 × 환산 시간" 비교는 경계값에서 반올림이 달라질 수 있음)
     if hourly >= minw:
         return "OK", "", pref, minw, hourly, f"{pref_basis} / {basis}"
 
     return "NG", f"最低賃金未満(換算時給{hourly:.2f} < {minw})", pref, minw, hourly, f"{pref_basis} / {basis}"
 
 # ============================================================
-# [핵심 실행 함수] GUI에서 이 함수만 호출하면 됨
+# [판정 결과 표현] 상태 코드 / 理由 표시 언어
+# - 상태(OK/要確認/NG)는 int8 코드의 Categorical (코드가 클수록 우선 → 종합 판정 = 최대값)
+# - 理由(要約)/最低賃金_都道府県/最低賃金_換算根拠 도 Categorical:
+#   행에는 정수 코드만 두고, 문자열은 서로 다른 값(理由 조합)마다 한 번만 만듦
+# - 理由 문장의 언어는 출력 시 선택 (check_* 는 항상 일본어 → render_reason 으로 변환)
+# - 판정 캐시에는 언어와 무관한 코드 형식(REASON_CODE)으로 저장 → 꺼낼 때 render_reason_entries 로 문장화
 # ============================================================
-def run_filter(csv_path: str, out_xlsx: str) -> str:
-    """
-    csv_path: 입력 CSV 경로
-    out_xlsx: 출력 XLSX 경로
-    return: 생성된 XLSX 경로
-    """
-    if not os.path.exists(csv_path):
-        raise FileNotFoundError(f"❌ CSV 파일 없음: {csv_path}")
+STATUS_OK, STATUS_CHECK, STATUS_NG = 0, 1, 2
+STATUS_LABELS = ["OK", "要確認", "NG"]
+STATUS_DTYPE = pd.CategoricalDtype(STATUS_LABELS)
+STATUS_COLS = [
+    "判定(総合)", "必須項目", "応募先メール", "雇用形態", "職種", "就業先会社名表記", "紹介元会社名表記",
+    "非公開→紹介元会社名", "GFJ市区町村", "文字化け(全項目)", "最低賃金判定",
+]
+TEXT_CATEGORY_COLS = ["理由(要約)", "最低賃金_都道府県", "最低賃金_換算根拠"]
+UNIT_RESULT_COL = "給与形態(unitText)"     # 給与形態 코드 (정수, 빈 값은 <NA>)
+
+REASON_LANGS = ("jp", "kr")
+REASON_CODE = "code"   # 엔진의 lang 으로 주면 理由 를 JSON [[코드, 값], ...] 으로 반환 (판정 캐시용. 값 없는 문장은 null)
+# (일본어, 한국어) 理由 템플릿. "{}" = 해당 값 (빈칸 항목명 / 메일 / 검출 단어 등)
+REASON_TEXTS = [
+    ("必須項目が空欄: {}", "필수 항목 공란: {}"),
+    ("応募先メールが空欄", "응모처 메일 공란"),
+    ("メール形式不正: {}", "메일 형식 오류: {}"),
+    ("雇用形態が空欄", "고용형태 공란"),
+    ("雇用形態が許可表記と不一致: {}", "고용형태가 허용 표기와 불일치: {}"),
+    ("採用先会社名空欄", "채용처 회사명 공란"),
+    ("採用先に特殊記号を含む(㈱): {}", "채용처에 특수기호 포함(㈱): {}"),
+    ("紹介元に特殊記号を含む(㈱): {}", "소개원에 특수기호 포함(㈱): {}"),
+    ("就業先会社名が非公開かつ紹介元会社名が空欄", "취업처 회사명 비공개 + 소개원 회사명 공란"),
+    ("就業先会社名が非公開かつ雇用形態が派遣社員(紹介元会社名が未入力・非公開)",
+     "취업처 회사명 비공개 + 고용형태 파견사원(소개원 회사명 미입력/비공개)"),
+    ("就業先会社名が非公開かつ雇用形態が派遣社員以外(紹介元会社名が非公開)",
+     "취업처 회사명 비공개 + 고용형태 파견사원 외(소개원 회사명 비공개)"),
+    ("市区町村が空欄", "시구정촌 공란"),
+    ("市区町村に文字化けの可能性", "시구정촌에 문자 깨짐 가능성"),
+    ("文字化けの可能性: {}", "문자 깨짐 가능성: {}"),
+    ("職種が空欄", "직종 공란"),
+    ("職種に地域名（都道府県）が含まれている", "직종에 지역명(도도부현) 포함"),
+    ("職種に地名形式（○○区／市／町／村／駅）が含まれている", "직종에 지명형식(○○구/시/町/村/역) 포함"),
+    ("職種に募集条件・雇用形態・勤務条件等が混在している可能性: {}", "직종에 모집/고용형태/근무시간/역할/조건 혼합 가능: {}"),
+    ("職種に数字が含まれている（管理番号等の可能性）", "직종에 숫자 포함(관리번호 가능성)"),
+    ("最低賃金判定不可(都道府県不明)", "최저임금 판정 불가(도도부현 불명)"),
+    ("最低賃金判定不可(給与形態unitText不明)", "최저임금 판정 불가(급여형태 unitText 불명)"),
+    ("最低賃金判定不可(給与下限minValue不明)", "최저임금 판정 불가(급여 하한 minValue 불명)"),
+    ("最低賃金要確認(週給は想定外)", "최저임금 확인 필요(주급은 상정 외)"),
+    ("最低賃金判定不可(時給換算不可)", "최저임금 판정 불가(시급 환산 불가)"),
+    ("最低賃金未満({})", "최저임금 미달({})"),
+]
+_REASON_PATTERNS = [
+    (re.compile(re.escape(jp).replace(re.escape("{}"), "(.*)"), re.S), kr) for jp, kr in REASON_TEXTS
+]
 
-    # CSV 인코딩 자동감지
-    df = None
-    last_err = None
-    for enc in ["utf-8-sig", "cp932", "utf-8"]:
-        try:
-            df = pd.read_csv(csv_path, encoding=enc)
-            break
-        except Exception as e:
-            last_err = e
+@functools.lru_cache(maxsize=65536)
+def render_reason(text: str, lang: str = "jp") -> str:
+    """check_* 의 理由(일본어) 하나 → lang 표기. 템플릿에 없는 문장은 그대로"""
+    if lang == "jp" or not text:
+        return text
+    for pattern, kr in _REASON_PATTERNS:
+        m = pattern.fullmatch(text)
+        if m:
+            return kr.replace("{}", m.group(1)) if m.groups() else kr
+    return text
+
+@functools.lru_cache(maxsize=65536)
+def reason_entry(text: str) -> str:
+    """check_* 의 理由(일본어) 하나 → JSON [코드, 값]. 템플릿에 없는 문장은 [-1, 문장]"""
+    for code, (pattern, _) in enumerate(_REASON_PATTERNS):
+        m = pattern.fullmatch(text)
+        if m:
+            return json.dumps([code, m.group(1) if m.groups() else None], ensure_ascii=False)
+    return json.dumps([-1, text], ensure_ascii=False)
+
+@functools.lru_cache(maxsize=65536)
+def render_reason_entries(entries: str, lang: str = "jp") -> str:
+    """REASON_CODE 형식의 理由(要約) → lang 표기 (" / " 로 연결)"""
+    texts = []
+    for code, value in json.loads(entries):
+        if code < 0:
+            texts.append(value)
+        else:
+            template = REASON_TEXTS[code][REASON_LANGS.index(lang)]
+            texts.append(template if value is None else template.replace("{}", value))
+    return " / ".join(texts)
+
+# 理由 코드 = REASON_TEXTS 의 번호 (일본어 / 한국어 어느 쪽 문장이든 같은 번호. 번호가 바뀌지 않도록 새 문장은 끝에 추가)
+_REASON_CODE_PATTERNS = [
+    (re.compile(re.escape(text).replace(re.escape("{}"), ".*"), re.S), code)
+    for code, texts in enumerate(REASON_TEXTS) for text in texts
+]
+
+@functools.lru_cache(maxsize=65536)
+def reason_codes(summary: str) -> tuple:
+    """理由(要約) (" / " 로 이은 문장들) → 理由 코드 튜플. 템플릿에 없는 문장은 -1"""
+    codes = []
+    for text in summary.split(" / ") if summary else []:
+        codes.append(next((code for pattern, code in _REASON_CODE_PATTERNS if pattern.fullmatch(text)), -1))
+    return tuple(codes)
 
-    if df is None:
-        raise RuntimeError(f"❌ CSV 읽기 실패: {last_err}")
+def status_categorical(codes: np.ndarray) -> pd.Categorical:
+    """상태 코드(STATUS_OK/CHECK/NG) 배열 → Categorical"""
+    return pd.Categorical.from_codes(np.asarray(codes, dtype=np.int8), dtype=STATUS_DTYPE)
+
+def compact_result(out: pd.DataFrame) -> pd.DataFrame:
+    """
+    문자열로 된 판정 결과 컬럼 → Categorical (행 단위 엔진 / 구간 합치기 / 캐시 복원 후)
+    給与形態(unitText) 는 항상 Int64 (빈 값 유무로 int64 / float64 가 갈리면 청크마다 3 / 3.0 으로 표시가 달라짐)
+    """
+    if UNIT_RESULT_COL in out.columns and out[UNIT_RESULT_COL].dtype != "Int64":
+        out[UNIT_RESULT_COL] = out[UNIT_RESULT_COL].astype(float).astype("Int64")
+    for c in STATUS_COLS:
+        if c in out.columns and not isinstance(out[c].dtype, pd.CategoricalDtype):
+            out[c] = pd.Categorical(out[c], dtype=STATUS_DTYPE)
+    for c in TEXT_CATEGORY_COLS:
+        if c in out.columns and not isinstance(out[c].dtype, pd.CategoricalDtype):
+            out[c] = pd.Categorical(out[c])
+    return out
 
-    # 메인 루프
+# ============================================================
+# [행 단위 판정 엔진] 기존 iterrows 루프 (기준 구현)
+# 컬럼 단위 엔진과 결과 비교(동일성 검증)용으로 유지
+# ============================================================
+def _timed_call(sink: dict):
+    """call(fn, row, *args): fn(row, *args) 실행 + 함수별 누적 시간을 sink 에 기록"""
+    def call(fn, row, *args):
+        t0 = time.perf_counter()
+        result = fn(row, *args)
+        sink[fn.__name__] = sink.get(fn.__name__, 0.0) + time.perf_counter() - t0
+        return result
+    return call
+
+def screen_rows(df: pd.DataFrame, timings: bool = False, lang: str = "jp",
+                rules: Optional[RuleConfig] = None) -> pd.DataFrame:
+    """
+    timings=True 면 check_* 함수별 누적 시간을 out.attrs["check_sec"] 에 기록
+    lang: 理由 표시 언어 (REASON_LANGS)
+    rules: 판정 규칙 (생략 시 current_rules())
+    """
+    rules = rules or current_rules()
     rows = []
+    check_sec = {}
+    call = _timed_call(check_sec) if timings else (lambda fn, row, *args: fn(row, *args))
+    scan_cols = garbled_scan_cols(df)
 
     for _, r in df.iterrows():
-        req_s, req_r = check_required(r)
-        email_s, email_r = check_email(r)
-        emp_s, emp_r = check_employment(r)
-        job_s, job_r = check_job_title(r)
-        comp_s, comp_r = check_company_special(r)
-        intro_s, intro_r = check_intro_company_special(r)
-        priv_s, priv_r = check_private_intro(r)
-        city_s, city_r = check_city_garbled(r)
-
-        mw_s, mw_r, mw_pref, mw_minw, mw_hourly, mw_basis = judge_min_wage(r)
-
-        statuses = [req_s, email_s, emp_s, job_s, comp_s, intro_s, priv_s, city_s, mw_s]
+        req_s, req_r = call(check_required, r)
+        email_s, email_r = call(check_email, r)
+        emp_s, emp_r = call(check_employment, r, rules)
+        job_s, job_r = call(check_job_title, r, rules)
+        comp_s, comp_r = call(check_company_special, r, rules)
+        intro_s, intro_r = call(check_intro_company_special, r, rules)
+        priv_s, priv_r = call(check_private_intro, r)
+        city_s, city_r = call(check_city_garbled, r)
+        garbled_s, garbled_r = call(check_text_garbled, r, scan_cols)
+
+        mw_s, mw_r, mw_pref, mw_minw, mw_hourly, mw_basis = call(judge_min_wage, r, rules)   # resolve_pref 포함
+
+        statuses = [req_s, email_s, emp_s, job_s, comp_s, intro_s, priv_s, city_s, garbled_s, mw_s]
         if "NG" in statuses:
             total = "NG"
         elif "要確認" in statuses:
@@ -400,7 +944,11 @@ def run_filter(csv_path: str, out_xlsx: str) -> str:
         else:
             total = "OK"
 
-        reason = " / ".join([x for x in [mw_r, req_r, email_r, emp_r, job_r, comp_r, intro_r, priv_r, city_r] if x])
+        reasons = [mw_r, req_r, email_r, emp_r, job_r, comp_r, intro_r, priv_r, city_r, garbled_r]
+        if lang == REASON_CODE:
+            reason = "[" + ",".join([reason_entry(x) for x in reasons if x]) + "]"
+        else:
+            reason = " / ".join([render_reason(x, lang) for x in reasons if x])
 
         rows.append({
             "判定(総合)": total,
@@ -414,11 +962,12 @@ def run_filter(csv_path: str, out_xlsx: str) -> str:
             "紹介元会社名表記": intro_s,
             "非公開→紹介元会社名": priv_s,
             "GFJ市区町村": city_s,
+            "文字化け(全項目)": garbled_s,
             "最低賃金判定": mw_s,
 
             "最低賃金_都道府県": mw_pref if mw_pref else safe_strip(r.get(col_pref)),
             "最低賃金_基準値(円/時)": mw_minw,
-            "給与形態(unitText)": to_int_safe(r.get(col_wage_unit)),
+            UNIT_RESULT_COL: to_int_safe(r.get(col_wage_unit)),
             "給与下限(minValue)": to_float_safe(r.get(col_wage_lower)),
             "時給換算値(円/時)": mw_hourly,
             "最低賃金_換算根拠": mw_basis,
@@ -430,18 +979,964 @@ def run_filter(csv_path: str, out_xlsx: str) -> str:
             "職種(原文)": safe_strip(r.get(col_job)),
         })
 
-    out = pd.DataFrame(rows)
-    df_out = pd.concat([out, df], axis=1)
+    out = compact_result(pd.DataFrame(rows, index=df.index, columns=RESULT_COLS))   # 0행이어도 컬럼 유지
+    if timings:
+        out.attrs["check_sec"] = check_sec
+    return out
+
+# ============================================================
+# [컬럼 단위(벡터화) 판정 엔진] run_filter 기본 엔진
+# 각 체크를 컬럼 전체에 대한 pandas/NumPy 연산으로 처리.
+# 判定/理由 문자열은 위의 check_* 함수(행 단위)와 완전히 동일해야 함
+# ============================================================
+PLACE_INNER_COL_RE = re.compile(r"[区市町村駅]")                         # PLACE_INNER_RE 와 같은 조건 (캡처 그룹 없음)
+EMAIL_SPLIT_PATTERN = r"[,、; \n\r\t]+"                                  # check_email 의 분리 규칙
+
+def _text_col(df: pd.DataFrame, col: str) -> pd.Series:
+    """safe_strip 의 컬럼 버전 (컬럼 없음/결측 → "")"""
+    if col not in df.columns:
+        return pd.Series([""] * len(df), index=df.index, dtype=object)
+    s = df[col]
+    s = s.astype(object).where(s.notna(), "").astype(str)
+    # object dtype 으로 고정 → str.* 정규식이 항상 Python re 로 처리됨 (행 단위와 동일한 규칙)
+    return s.astype(object).str.strip()
+
+def _float_col(df: pd.DataFrame, col: str) -> Tuple[np.ndarray, np.ndarray]:
+    """to_float_safe 의 컬럼 버전. (값, 변환 성공 여부) 를 반환"""
+    n = len(df)
+    if col not in df.columns:
+        return np.full(n, np.nan), np.zeros(n, dtype=bool)
+    s = df[col]
+    if pd.api.types.is_numeric_dtype(s):
+        vals = s.to_numpy(dtype=float, na_value=np.nan)
+        return vals, ~np.isnan(vals)
+
+    # 문자열 컬럼은 고유값 단위로 float() 변환 후 전체 행에 펼침 (Python float() 규칙 그대로)
+    codes, uniques = pd.factorize(s)
+    parsed = [to_float_safe(u) for u in uniques]
+    u_vals = np.array([np.nan if p is None else p for p in parsed] + [np.nan], dtype=float)
+    u_ok = np.array([p is not None for p in parsed] + [False], dtype=bool)
+    return u_vals[codes], u_ok[codes]   # codes == -1(결측) → 마지막 원소(실패)
+
+def _select(n: int, cases, default=""):
+    """np.select 와 같은 우선순위(앞의 조건 우선)로 object 배열을 만든다"""
+    out = np.full(n, default, dtype=object)
+    for cond, value in reversed(cases):
+        cond = np.asarray(cond, dtype=bool)
+        out[cond] = value[cond] if isinstance(value, np.ndarray) else value
+    return out
+
+def _status(n: int, cases, default: int = STATUS_OK) -> np.ndarray:
+    """_select 의 상태 코드(int8) 버전"""
+    out = np.full(n, default, dtype=np.int8)
+    for cond, code in reversed(cases):
+        out[np.asarray(cond, dtype=bool)] = code
+    return out
+
+def _join_nonempty(n: int, parts, sep: str) -> np.ndarray:
+    """sep.join([x for x in parts if x]) 의 컬럼 버전"""
+    out = np.full(n, "", dtype=object)
+    for p in parts:
+        p = np.asarray(p, dtype=object)
+        has_p = p != ""
+        first = has_p & (out == "")
+        more = has_p & ~first
+        out[first] = p[first]
+        out[more] = out[more] + sep + p[more]
+    return out
+
+def _categorical(codes: np.ndarray, labels) -> pd.Categorical:
+    """(행별 코드, 코드별 문자열) → Categorical. categories 는 문자열 순 (pd.Categorical(값 배열) 과 같은 결과)"""
+    cats, remap = np.unique(np.asarray(labels, dtype=object), return_inverse=True)
+    return pd.Categorical.from_codes(remap.reshape(-1)[codes], categories=cats)
+
+def _joined_categorical(parts, sep: str, render=None) -> pd.Categorical:
+    """
+    sep.join([render(x) for x in parts if x]) 의 Categorical 버전.
+    부분별 코드를 조합한 키로 행을 묶고, 문자열 연결/번역은 서로 다른 조합마다 한 번만 함
+    """
+    n = len(parts[0])
+    key = np.zeros(n, dtype=np.int64)
+    for p in parts:
+        codes, u = pd.factorize(np.asarray(p, dtype=object))
+        key, _ = pd.factorize(key * max(len(u), 1) + codes)   # 조합 수 <= 행 수 → 범위 초과 없음
+    _, first = np.unique(key, return_index=True)               # 조합 k 의 첫 행 (factorize 코드 = 등장 순서)
+    labels = [sep.join([render(x) if render else x for x in (p[r] for p in parts) if x]) for r in first]
+    return _categorical(key, labels)
+
+def _nullable_float(vals: np.ndarray, valid: np.ndarray):
+    """None 이 섞인 행 단위 결과를 DataFrame 으로 만들었을 때와 같은 dtype 으로 맞춘다"""
+    if len(vals) and not valid.any():
+        return np.full(len(vals), None, dtype=object)
+    return np.where(valid, vals, np.nan)
+
+def _distinct_text(df: pd.DataFrame, col: str) -> Tuple[np.ndarray, pd.Series]:
+    """
+    _text_col 을 서로 다른 값 단위로 계산 → (codes, 서로 다른 값의 문자열)
+    행 값 = uniq.to_numpy()[codes]. 같은 회사명/고용형태/메일이 수천 행 반복되어도 한 번만 처리
+    """
+    if col not in df.columns:
+        return np.zeros(len(df), dtype=np.intp), pd.Series([""], dtype=object)
+    s = df[col]
+    if s.dtype == object:
+        # object 는 1 과 1.0 이 같은 값으로 묶이므로 문자열로 바꾼 뒤 묶음
+        codes, uniques = pd.factorize(_text_col(df, col))
+        return codes, pd.Series(uniques, dtype=object)
+    codes, uniques = pd.factorize(s)
+    u = pd.DataFrame({col: pd.Series(list(uniques) + [None], dtype=object)})
+    return np.where(codes < 0, len(uniques), codes), _text_col(u, col)   # codes == -1(결측) → 마지막("")
+
+# ------------------------------------------------------------
+# 한 컬럼만 보는 체크 (서로 다른 값 Series → (判定, 理由) 배열)
+# ------------------------------------------------------------
+def _email_checks(email: pd.Series):
+    """응모처 메일 (복수 메일은 분리 후 첫 번째 형식 오류를 보고)"""
+    n = len(email)
+    split = email.str.split(EMAIL_SPLIT_PATTERN, regex=True)
+    pos = np.repeat(np.arange(n), split.str.len().to_numpy(dtype=int))
+    parts = pd.Series(split.explode().to_numpy(), dtype=object).str.strip()
+    filled = (parts != "").to_numpy()
+    bad = filled & ~parts.str.match(EMAIL_RE.pattern).to_numpy(dtype=bool)
+    has_part = np.bincount(pos[filled], minlength=n) > 0
+    bad_part = np.full(n, "", dtype=object)
+    bad_rows, first_idx = np.unique(pos[bad], return_index=True)
+    bad_part[bad_rows] = parts.to_numpy()[bad][first_idx]
+    has_bad = np.zeros(n, dtype=bool)
+    has_bad[bad_rows] = True
+    email_empty = (email == "").to_numpy() | ~has_part
+    return (
+        _status(n, [(email_empty | has_bad, STATUS_NG)]),
+        _select(n, [
+            (email_empty, "応募先メールが空欄"),
+            (has_bad, "メール形式不正: " + bad_part),
+        ]),
+    )
+
+def _employment_checks(emp: pd.Series, rules: RuleConfig):
+    n = len(emp)
+    emp_bad = ~emp.isin(rules.allowed_employment).to_numpy()
+    return (
+        _status(n, [(emp_bad, STATUS_NG)]),
+        _select(n, [
+            ((emp == "").to_numpy(), "雇用形態が空欄"),
+            (emp_bad, "雇用形態が許可表記と不一致: " + emp.to_numpy()),
+        ]),
+    )
+
+def _job_checks(job: pd.Series, rules: RuleConfig):
+    n = len(job)
+    job_pref = job.str.contains(rules.pref_re.pattern, regex=True).to_numpy(dtype=bool)
+    job_place = ((job.str.len() >= 3) & job.str.contains(PLACE_INNER_COL_RE.pattern, regex=True)).to_numpy(dtype=bool)
+    job_tokens = rules.job_condition_matcher.hits_col(job)
+    job_token = job_tokens != ""
+    job_digit = job.str.contains(r"\d", regex=True).to_numpy(dtype=bool)
+    job_cases = [
+        ((job == "").to_numpy(), STATUS_NG, "職種が空欄"),
+        (job_pref, STATUS_NG, "職種に地域名（都道府県）が含まれている"),
+        (job_place, STATUS_NG, "職種に地名形式（○○区／市／町／村／駅）が含まれている"),
+        (job_token, STATUS_CHECK, "職種に募集条件・雇用形態・勤務条件等が混在している可能性: " + job_tokens),
+        (job_digit, STATUS_CHECK, "職種に数字が含まれている（管理番号等の可能性）"),
+    ]
+    return _status(n, [(c, s) for c, s, _ in job_cases]), _select(n, [(c, r) for c, _, r in job_cases])
+
+def _company_mark_checks(work: pd.Series, rules: RuleConfig):
+    n = len(work)
+    work_blank = (work == "").to_numpy()
+    marks = rules.special_mark_matcher.hits_col(work)
+    has_mark = marks != ""
+    return (
+        _status(n, [(work_blank | has_mark, STATUS_NG)]),
+        _select(n, [
+            (work_blank, "採用先会社名空欄"),
+            (has_mark, "採用先に特殊記号を含む(㈱): " + marks),
+        ]),
+    )
+
+def _intro_mark_checks(intro: pd.Series, rules: RuleConfig):
+    n = len(intro)
+    marks = rules.special_mark_matcher.hits_col(intro)
+    has_mark = marks != ""
+    return (
+        _status(n, [(has_mark, STATUS_NG)]),
+        _select(n, [(has_mark, "紹介元に特殊記号を含む(㈱): " + marks)]),
+    )
+
+def _city_checks(city: pd.Series):
+    n = len(city)
+    city_blank = (city == "").to_numpy()
+    garbled = CITY_GARBLED_DETECTOR.garbled_col(city)
+    return (
+        _status(n, [(city_blank | garbled, STATUS_NG)]),
+        _select(n, [
+            (city_blank, "市区町村が空欄"),
+            (garbled, "市区町村に文字化けの可能性"),
+        ]),
+    )
+
+def _lap_timer(enabled: bool, sink: dict):
+    """lap(name): 직전 lap 이후 경과 시간을 sink[name] 에 누적 (enabled=False 면 아무것도 안 함)"""
+    if not enabled:
+        return lambda name: None
+    last = [time.perf_counter()]
+
+    def lap(name):
+        now = time.perf_counter()
+        sink[name] = sink.get(name, 0.0) + now - last[0]
+        last[0] = now
+    return lap
+
+def screen_columns(df: pd.DataFrame, timings: bool = False, lang: str = "jp",
+                   rules: Optional[RuleConfig] = None) -> pd.DataFrame:
+    """
+    timings=True 면 체크별 소요 시간을 out.attrs["check_sec"] 에 기록 (이름은 행 단위 check_* 와 맞춤)
+    lang: 理由 표시 언어 (REASON_LANGS)
+    rules: 판정 규칙 (생략 시 current_rules())
+    """
+    rules = rules or current_rules()
+    table = rules.min_wage_table
+    n = len(df)
+    check_sec = {}
+    lap = _lap_timer(timings, check_sec)
+    dist = {c: _distinct_text(df, c) for c in SCREEN_INPUT_COLS}
+    txt = {c: pd.Series(u.to_numpy()[codes], index=df.index, dtype=object) for c, (codes, u) in dist.items()}
+    blank = {c: (s == "").to_numpy() for c, s in txt.items()}
+    lap("normalize")
+
+    def per_value(col, checks, *args):
+        # 서로 다른 값마다 한 번만 판정 → 행으로 펼침
+        codes, u = dist[col]
+        return tuple(r[codes] for r in checks(u, *args))
+
+    # 필수 항목
+    req_r = _join_nonempty(n, [np.where(blank[c], c, "") for c in REQUIRED_COLS_BASE], ", ")
+    req_ng = req_r != ""
+    req_r[req_ng] = "必須項目が空欄: " + req_r[req_ng]
+    req_s = np.where(req_ng, STATUS_NG, STATUS_OK).astype(np.int8)
+    lap("check_required")
+
+    email_s, email_r = per_value(col_email, _email_checks)
+    lap("check_email")
+    emp_s, emp_r = per_value(col_employment, _employment_checks, rules)
+    lap("check_employment")
+    job_s, job_r = per_value(col_job, _job_checks, rules)
+    lap("check_job_title")
+    comp_s, comp_r = per_value(col_work_company, _company_mark_checks, rules)
+    lap("check_company_special")
+    intro_s, intro_r = per_value(col_intro_company, _intro_mark_checks, rules)
+    lap("check_intro_company_special")
+    # 문자 깨짐: 문자열 컬럼 전체의 서로 다른 값을 모아 한 번에 스캔 (市区町村 은 _city_checks 에서 지명용 표로)
+    scan_cols = garbled_scan_cols(df)
+    scan = {c: dist[c] if c in dist else _distinct_text(df, c) for c in scan_cols}
+    detected = GARBLED_DETECTOR.garbled_values({c: u.to_numpy() for c, (_, u) in scan.items()})
+    garbled_cols = _join_nonempty(n, [np.where(detected[c][scan[c][0]], str(c), "")
+                                      for c in scan_cols if detected[c].any()], ", ")
+    garbled_any = garbled_cols != ""
+    garbled_s = _status(n, [(garbled_any, STATUS_CHECK)])
+    garbled_r = np.where(garbled_any, "文字化けの可能性: " + garbled_cols, "").astype(object)
+    lap("check_text_garbled")
+    city_s, city_r = per_value(col_city, _city_checks)
+    lap("check_city_garbled")
+
+    work = txt[col_work_company]
+    intro = txt[col_intro_company]
+
+    # 非公開 → 紹介元会社名
+    is_private = (work == "非公開").to_numpy()
+    intro_private = (intro == "非公開").to_numpy()
+    haken = (txt[col_employment] == "派遣社員").to_numpy()
+    priv_cases = [
+        (is_private & blank[col_intro_company], "就業先会社名が非公開かつ紹介元会社名が空欄"),
+        (is_private & haken & intro_private, "就業先会社名が非公開かつ雇用形態が派遣社員(紹介元会社名が未入力・非公開)"),
+        (is_private & intro_private, "就業先会社名が非公開かつ雇用形態が派遣社員以外(紹介元会社名が非公開)"),
+    ]
+    priv_s = _status(n, [(c, STATUS_NG) for c, _ in priv_cases])
+    priv_r = _select(n, priv_cases)
+    lap("check_private_intro")
+
+    # 최저임금: 都道府県 보완 (GFJ → 住所 → 市区町村 → 職種 → 会社名)
+    # 住所/市区町村 은 都道府県명이 없으면 市区町村名 사전으로 보완 (서로 다른 값 단위)
+    pref_raw = txt[col_pref].to_numpy()
+    pref = np.where(txt[col_pref].isin(table.codes).to_numpy(), pref_raw, "").astype(object)
+    pref_basis = np.where(pref != "", "GFJ都道府県を使用", "都道府県不明(補完失敗)").astype(object)
+    for i, c in enumerate([col_address, col_city, col_job, col_work_company], start=1):
+        need = np.flatnonzero(pref == "")
+        if len(need) == 0:
+            break
+        found = txt[c].iloc[need].str.extract(f"({rules.pref_re.pattern})", expand=False)
+        hit = found.notna().to_numpy()
+        pref[need[hit]] = found.to_numpy()[hit]
+        pref_basis[need[hit]] = f"テキスト#{i}から都道府県を抽出"
+
+        if c in (col_address, col_city):
+            need = need[~hit]
+            codes, u = dist[c]
+            u_text = u.to_numpy()
+            for code in np.unique(codes[need]):
+                name, p = find_municipality(u_text[code])
+                if p:
+                    rows = need[codes[need] == code]
+                    pref[rows] = p
+                    pref_basis[rows] = f"テキスト#{i}の市区町村名({name})から都道府県を推定"
+    has_pref = pref != ""
+
+    # 최저임금 표 버전: (都道府県 코드, 掲載開始日) → 표 위치 (掲載開始日 은 서로 다른 값 단위로 변환, 없으면 실행일)
+    day_codes, day_u = dist[col_posted]
+    today = to_day(date.today())
+    u_days = np.array([today if d is None else d for d in map(parse_posted_day, day_u)], dtype=np.int64)
+    pref_code = pd.Series(pref).map(table.codes).fillna(-1).to_numpy(dtype=np.int64)
+    wage_idx = table.lookup(pref_code, u_days[day_codes])
+    minw = np.where(has_pref, table.wage[wage_idx], np.nan)
+    version_label = np.array([f"最低賃金{table.effective(i)}発効分" for i in range(len(table.wage))], dtype=object)
+    version_basis = np.where(has_pref, version_label[wage_idx], "")
+
+    lap("resolve_pref")
+
+    # 최저임금: unitText/minValue → 시급 환산
+    unit_f, unit_ok = _float_col(df, col_wage_unit)
+    unit_ok &= np.isfinite(unit_f)          # int(float(x)) 실패(inf/nan) → None
+    unit = np.where(unit_ok, np.trunc(unit_f), 0.0)
+    lower, lower_ok = _float_col(df, col_wage_lower)
+
+    divisors = rules.unit_hours
+    convertible = np.isin(unit, list(divisors)) & unit_ok
+    hourly = np.full(n, np.nan)
+    unit_basis = np.full(n, hourly_from_unit(0, 0.0, rules)[1], dtype=object)
+    for code in UNIT_MAP:
+        m = unit_ok & (unit == code)
+        unit_basis[m] = hourly_from_unit(code, 0.0, rules)[1]
+        if code in divisors:
+            hourly[m] = lower[m] if code == 1 else lower[m] / divisors[code]
+
+    judged = has_pref & unit_ok & lower_ok
+    week = judged & (unit == 5)
+    no_conv = judged & ~convertible & ~week
+    conv = judged & convertible
+    # 환산 시급과 비교 (행 단위 judge_min_wage 와 같은 식)
+    mw_ok = conv & (hourly >= minw)
+    mw_low = conv & ~mw_ok
+
+    low_r = np.full(n, "", dtype=object)
+    low_r[mw_low] = [f"最低賃金未満(換算時給{h:.2f} < {w})" for h, w in zip(hourly[mw_low], minw[mw_low])]
+    mw_s = _status(n, [(mw_ok, STATUS_OK), (week, STATUS_CHECK)], STATUS_NG)
+    mw_r = _select(n, [
+        (~has_pref, "最低賃金判定不可(都道府県不明)"),
+        (~unit_ok, "最低賃金判定不可(給与形態unitText不明)"),
+        (~lower_ok, "最低賃金判定不可(給与下限minValue不明)"),
+        (week, "最低賃金要確認(週給は想定外)"),
+        (no_conv, "最低賃金判定不可(時給換算不可)"),
+        (mw_low, low_r),
+    ])
+    # 換算根拠 = 都道府県 근거 / 표 버전 / 환산 근거 (서로 다른 조합마다 한 번만 연결)
+    mw_basis = _joined_categorical([pref_basis, version_basis, np.where(judged, unit_basis, "")], " / ")
+    mw_pref = pd.Categorical(np.where(has_pref, pref, pref_raw).astype(object))
+
+    lap("judge_min_wage")
+
+    # 종합 판정 (상태 코드의 최대값 = NG > 要確認 > OK)
+    statuses = [req_s, email_s, emp_s, job_s, comp_s, intro_s, priv_s, city_s, garbled_s, mw_s]
+    total = np.maximum.reduce(statuses)
+    reasons = [mw_r, req_r, email_r, emp_r, job_r, comp_r, intro_r, priv_r, city_r, garbled_r]
+    if lang == REASON_CODE:
+        reason = _joined_categorical(reasons, ",", reason_entry).rename_categories(lambda x: f"[{x}]")
+    else:
+        render = None if lang == "jp" else (lambda x: render_reason(x, lang))
+        reason = _joined_categorical(reasons, " / ", render)
+
+    unit_out = pd.arrays.IntegerArray(np.where(unit_ok, unit, 0).astype(np.int64), ~unit_ok)
+
+    out = pd.DataFrame({
+        "判定(総合)": status_categorical(total),
+        "理由(要約)": reason,
+
+        "必須項目": status_categorical(req_s),
+        "応募先メール": status_categorical(email_s),
+        "雇用形態": status_categorical(emp_s),
+        "職種": status_categorical(job_s),
+        "就業先会社名表記": status_categorical(comp_s),
+        "紹介元会社名表記": status_categorical(intro_s),
+        "非公開→紹介元会社名": status_categorical(priv_s),
+        "GFJ市区町村": status_categorical(city_s),
+        "文字化け(全項目)": status_categorical(garbled_s),
+        "最低賃金判定": status_categorical(mw_s),
+
+        "最低賃金_都道府県": mw_pref,
+        "最低賃金_基準値(円/時)": _nullable_float(minw, has_pref),
+        UNIT_RESULT_COL: unit_out,
+        "給与下限(minValue)": _nullable_float(lower, lower_ok),
+        "時給換算値(円/時)": _nullable_float(hourly, conv),
+        "最低賃金_換算根拠": mw_basis,
+
+        # 디버그용
+        "勤務地住所": txt[col_address].to_numpy(),
+        "市区町村（addressLocality）": txt[col_city].to_numpy(),
+        "勤務時間/月平均所定労働時間": txt[col_worktime].to_numpy(),
+        "職種(原文)": txt[col_job].to_numpy(),
+    }, index=df.index)
+
+    # 값 단위 메모이제이션 통계 (컬럼별 행 수 / 실제로 판정한 서로 다른 값 수)
+    out.attrs["memo"] = {c: {"rows": n, "distinct": len(dist[c][1])} for c in SCREEN_INPUT_COLS if c in df.columns}
+    lap("assemble")
+    if timings:
+        out.attrs["check_sec"] = check_sec
+    return out
+
+SCREEN_ENGINES = {
+    "columnar": screen_columns,  # 기본 (벡터화)
+    "row": screen_rows,          # 기존 iterrows (기준 구현)
+}
+
+# ============================================================
+# [진행 상황 / 취소]
+# progress(dict) 콜백은 run_filter 를 실행 중인 스레드에서 호출됨
+# (GUI 에서는 큐 등을 통해 메인 스레드로 넘겨서 표시할 것)
+# ============================================================
+SCREEN_BLOCK_ROWS = 20000   # 진행 상황 보고/취소 확인 단위 (행)
+
+class FilterCancelled(Exception):
+    """cancel_event 로 실행이 중단됨 (결과 파일은 만들어지지 않음)"""
+
+class ProgressReporter:
+    def __init__(self, callback=None, cancel_event=None, profiler: Optional[RunProfiler] = None):
+        self.callback = callback
+        self.cancel_event = cancel_event
+        self.profiler = profiler
+        self.phase = ""
+        self.total = None
+        self.t0 = time.perf_counter()
+
+    def check_cancel(self):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise FilterCancelled("❌ 사용자에 의해 취소됨")
+
+    def start(self, phase: str, total: Optional[int] = None):
+        self.check_cancel()
+        self.phase, self.total, self.t0 = phase, total, time.perf_counter()
+        if self.profiler is not None:
+            self.profiler.phase_start(phase)
+        self.update(0)
+
+    def update(self, done: int, fraction: Optional[float] = None):
+        """
+        done: 이 단계에서 처리한 행 수
+        fraction: 진행률(0~1). 생략하면 done / total
+        """
+        self.check_cancel()
+        if self.profiler is not None:
+            self.profiler.phase_rows(done)
+        if self.callback is None:
+            return
+        if fraction is None and self.total:
+            fraction = done / self.total
+        elapsed = time.perf_counter() - self.t0
+        eta = elapsed * (1 - fraction) / fraction if fraction and elapsed > 0 else None
+        self.callback({
+            "phase": self.phase,              # load / screen / write / save
+            "rows_done": done,
+            "rows_total": self.total,
+            "fraction": fraction,
+            "rows_per_sec": done / elapsed if elapsed > 0 else None,
+            "eta_sec": eta,
+        })
+
+# ============================================================
+# [병렬 판정] 프로세스 풀 (workers=N)
+# 체크 함수는 행 + 규칙(RuleConfig, 워커로 함께 전달)만 참조하는 순수 함수이므로
+# 행을 연속 구간으로 나눠 각 프로세스에서 판정한 뒤 원래 순서대로 합친다
+# ============================================================
+def _screen_input(df: pd.DataFrame) -> pd.DataFrame:
+    # 판정 컬럼 + 문자 깨짐을 검사하는 문자열 컬럼 (입력 순서 유지 → 理由 의 컬럼 순서가 같음)
+    keep = set(SCREEN_INPUT_COLS).union(garbled_scan_cols(df))
+    return df[[c for c in df.columns if c in keep]]
+
+NUMERIC_RESULT_COLS = ["最低賃金_基準値(円/時)", "給与形態(unitText)", "給与下限(minValue)", "時給換算値(円/時)"]
+
+def _restore_dtypes(out: pd.DataFrame) -> pd.DataFrame:
+    # 구간별로 결과 dtype 이 갈릴 수 있음 (예: 전부 None 인 구간 → object,
+    # categories 가 다른 Categorical 끼리 합치면 object) → 직렬 실행과 같은 dtype 으로 맞춤
+    for c in NUMERIC_RESULT_COLS:
+        if c in out.columns and out[c].dtype == object and out[c].notna().any():
+            out[c] = out[c].astype(float)
+    return compact_result(out)
+
+def _add_nested(total: dict, src: dict):
+    for k, v in src.items():
+        if isinstance(v, dict):
+            _add_nested(total.setdefault(k, {}), v)
+        else:
+            total[k] = total.get(k, 0) + v
 
-    # 저장
+def add_screen_stats(total: dict, outs) -> dict:
+    """
+    판정 결과에 붙은 통계(out.attrs)를 total 에 합산
+    (memo: 값 단위 메모이제이션 / check_sec: 체크별 소요 시간. 프로세스 풀 결과도 그대로 합산 가능)
+    """
+    for out in outs:
+        _add_nested(total, out.attrs)
+    return total
+
+def memo_summary(total: dict) -> dict:
+    """컬럼별 {rows, distinct, hits(재사용 행 수), hit_rate}"""
+    summary = {}
+    for col, t in total.items():
+        hits = max(t["rows"] - t["distinct"], 0)
+        summary[col] = dict(t, hits=hits, hit_rate=round(hits / t["rows"], 4) if t["rows"] else 0.0)
+    return summary
+
+def screen_parallel(df: pd.DataFrame, screen, workers: int, executor=None) -> pd.DataFrame:
+    """df 를 workers 개의 연속 구간으로 나눠 프로세스 풀에서 판정 → 원래 행 순서대로 합침"""
+    if workers <= 1 or len(df) < 2:
+        return screen(df)
+
+    # 판정에 필요한 컬럼만 워커로 전달 (프로세스 간 복사량 감소)
+    df = _screen_input(df)
+    bounds = np.linspace(0, len(df), min(workers, len(df)) + 1, dtype=int)
+    parts = [df.iloc[a:b] for a, b in zip(bounds[:-1], bounds[1:])]
+    if executor is not None:
+        results = list(executor.map(screen, parts))
+    else:
+        with ProcessPoolExecutor(max_workers=len(parts)) as ex:
+            results = list(ex.map(screen, parts))
+    out = _restore_dtypes(pd.concat(results))
+    out.attrs = add_screen_stats({}, results)
+    return out
+
+def _read_chunks(fh, encoding: str, chunksize: int, load: str):
+    """
+    CSV 를 chunksize 행씩 읽음. 파싱 오류만 "CSV 읽기 실패" 로 바꿈
+    (소비하는 쪽의 판정 / 기록 오류는 이 제너레이터를 거치지 않으므로 그대로 전달됨. UnicodeDecodeError 는 코덱 재시도용으로 그대로)
+    """
+    try:
+        with pd.read_csv(fh, encoding=encoding, chunksize=chunksize, **LOAD_MODES[load]) as reader:
+            yield from reader
+    except (pd.errors.ParserError, pd.errors.EmptyDataError, OSError) as err:
+        raise RuntimeError(f"❌ CSV 읽기 실패: {err}") from err
+
+def _screen_chunks(reader, screen, executor, window: int, cache: Optional[VerdictCache] = None):
+    """
+    청크 판정 결과를 (판정 결과, 원본 청크) 로 입력 순서대로 반환.
+    executor 가 있으면 최대 window 개 청크를 동시에 처리 (메모리 상한 유지)
+    cache 가 있으면 캐시에 없는 행만 판정
+    """
+    pending = deque()
+
+    def finish():
+        job, chunk, lookup = pending.popleft()
+        out = job.result() if isinstance(job, Future) else job
+        if lookup is not None:
+            out = _cache_merge(chunk, lookup, out, cache)
+        return out, chunk
+
+    for chunk in reader:
+        lookup = _cache_lookup(chunk, cache) if cache is not None else None
+        todo = chunk if lookup is None else chunk[~lookup[2]]
+        if len(todo) == 0 and lookup is not None:
+            job = None
+        elif executor is None:
+            job = screen(todo)
+        else:
+            job = executor.submit(screen, _screen_input(todo))
+        pending.append((job, chunk, lookup))
+        if len(pending) >= (window if executor is not None else 1):
+            yield finish()
+    while pending:
+        yield finish()
+
+# ============================================================
+# [판정 캐시] 행 내용 해시 + 규칙 지문 → 이전 판정 결과 재사용
+# 매일 누적 CSV(審査データ_YYYYMMDD分まで.csv)를 다시 돌릴 때
+# 바뀌지 않은 행은 판정을 건너뛰고 새 행/바뀐 행만 판정
+# ============================================================
+RULES_VERSION = 7   # check_* / screen_columns 의 판정 로직을 바꾸면 올릴 것 (이전 캐시 무효화)
+
+CACHE_DIR = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache"),
+                         "FilteredTool")
+VERDICT_CACHE_DB = os.path.join(CACHE_DIR, "verdict_cache.sqlite3")
+INPUT_SNAPSHOT_DIR = os.path.join(CACHE_DIR, "input_snapshots")   # 읽어 들인 CSV 스냅샷 (input_snapshot.py)
+RESULTS_DB = os.path.join(CACHE_DIR, "results.sqlite3")            # 실행별 판정 결과 기록 (results_store.py)
+
+RESULT_COLS = [
+    "判定(総合)", "理由(要約)",
+    "必須項目", "応募先メール", "雇用形態", "職種", "就業先会社名表記", "紹介元会社名表記",
+    "非公開→紹介元会社名", "GFJ市区町村", "文字化け(全項目)", "最低賃金判定",
+    "最低賃金_都道府県", "最低賃金_基準値(円/時)", "給与形態(unitText)", "給与下限(minValue)",
+    "時給換算値(円/時)", "最低賃金_換算根拠",
+    "勤務地住所", "市区町村（addressLocality）", "勤務時間/月平均所定労働時間", "職種(原文)",
+]
+# 입력값을 그대로 옮긴 디버그용 컬럼 → 캐시에 저장하지 않고 입력에서 다시 만듦
+PASSTHROUGH_COLS = {
+    "勤務地住所": col_address,
+    "市区町村（addressLocality）": col_city,
+    "勤務時間/月平均所定労働時間": col_worktime,
+    "職種(原文)": col_job,
+}
+CACHED_COLS = [c for c in RESULT_COLS if c not in PASSTHROUGH_COLS]
+DEBUG_RESULT_COLS = list(PASSTHROUGH_COLS)   # slim 출력에서 빼는 컬럼 (원본 컬럼과 내용이 같음)
+
+_NA_TOKEN = "\x00"       # 빈 셀
+_ABSENT_TOKEN = "\x01"   # 컬럼 자체가 없음
+
+def rules_fingerprint(rules: Optional[RuleConfig] = None) -> str:
+    """
+    판정 결과에 영향을 주는 규칙의 해시
+    (RuleConfig.key(최저임금 표 / 토큰 목록 / 환산 시간) + 실행일에 유효한 표 위치 + 고정 규칙)
+    理由 는 언어와 무관한 코드로 저장하므로 표시 언어는 포함하지 않음 (jp / kr 실행이 같은 항목을 공유)
+    """
+    rules = rules or current_rules()
+    parts = {
+        "version": RULES_VERSION,
+        "rules": rules.key,
+        "min_wage_in_force": rules.min_wage_table.fingerprint(date.today())["in_force"],
+        "municipalities": [MUNICIPALITIES, sorted(SHARED_WARD_NAMES)],
+        "garbled": [GARBLED_CHAR_TABLE, CITY_GARBLED_CHAR_TABLE, ROUNDTRIP_ENCODINGS],
+        "email_re": EMAIL_RE.pattern,
+        "unit_map": {str(k): v for k, v in UNIT_MAP.items()},
+    }
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+def _cache_tokens(s: pd.Series) -> np.ndarray:
+    """
+    셀 값 → 해시용 문자열 (dtype 종류 + str(값)).
+    체크 함수는 값을 str() / float() 로만 보므로 표현이 같으면 판정도 같음.
+    1 과 1.0 처럼 표현이 다른 값은 다른 키가 됨 (캐시 미스일 뿐 결과는 항상 정확)
+    """
+    na = s.isna().to_numpy()
+    if s.dtype == object:
+        tok = s.astype(str).to_numpy(dtype=object)   # object 는 값 비교(1 == 1.0)로 묶으면 안 되므로 원소별 변환
+    else:
+        codes, uniques = pd.factorize(s)               # 같은 값은 한 번만 문자열로 변환
+        tok = np.array([str(u) for u in uniques] + [""], dtype=object)[codes]
+    tok = s.dtype.kind + tok
+    return np.where(na, _NA_TOKEN, tok)
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    판정에 쓰는 컬럼 값으로 계산한 행별 64bit 해시 (int64)
+    = SCREEN_INPUT_COLS + 문자 깨짐만 검사하는 나머지 문자열 컬럼 (理由 에 컬럼명이 나오므로 컬럼명도 해시에 포함)
+    """
+    tokens = {
+        c: (_cache_tokens(df[c]) if c in df.columns else np.full(len(df), _ABSENT_TOKEN, dtype=object))
+        for c in SCREEN_INPUT_COLS
+    }
+    hashes = pd.util.hash_pandas_object(pd.DataFrame(tokens), index=False).to_numpy()
+    extra = [c for c in garbled_scan_cols(df) if c not in SCREEN_INPUT_COLS]
+    if extra:
+        # 깨짐 검사는 str(값) 만 보므로 dtype 구분 없이 값 그대로 해시 (긴 자유 기술도 문자열 변환 없이)
+        extra_hashes = pd.util.hash_pandas_object(df[extra], index=False).to_numpy()
+        hashes = pd.util.hash_pandas_object(pd.DataFrame({0: hashes, 1: extra_hashes}), index=False).to_numpy()
+    names = hashlib.blake2b(json.dumps(list(map(str, extra)), ensure_ascii=False).encode("utf-8"), digest_size=8)
+    return (hashes ^ np.frombuffer(names.digest(), dtype=np.uint64)[0]).view(np.int64)
+
+def _render_cached(out: pd.DataFrame, lang: str) -> pd.DataFrame:
+    """REASON_CODE 형식의 理由(要約) → lang 표기 (서로 다른 값마다 한 번만 변환)"""
+    codes, uniques = pd.factorize(out["理由(要約)"])
+    out["理由(要約)"] = _categorical(codes, [render_reason_entries(u, lang) for u in uniques])
+    return out
+
+def _cache_lookup(df: pd.DataFrame, cache: VerdictCache):
+    hashes = row_hashes(df)
+    ids = cache.lookup(hashes)
+    return hashes, ids, ids >= 0
+
+def _cache_merge(df: pd.DataFrame, lookup, miss_out: Optional[pd.DataFrame], cache: VerdictCache) -> pd.DataFrame:
+    """
+    캐시 적중 행 + 새로 판정한 행(miss_out) → df 행 순서대로 합침. 새 판정은 캐시에 기록
+    miss_out 의 理由 는 REASON_CODE 형식 (그대로 저장) → 합친 뒤 cache.lang 으로 표시
+    """
+    hashes, ids, hit = lookup
+    n_hit = int(hit.sum())
+    cache.hits += n_hit
+    cache.misses += len(hit) - n_hit
+    if miss_out is not None and len(miss_out):
+        cache.store(hashes[~hit], miss_out[CACHED_COLS])
+    if n_hit == 0:
+        return _render_cached(miss_out, cache.lang)
+
+    # 서로 다른 판정 결과만 복원 → 행으로 펼침
+    uniq, inverse = np.unique(ids[hit], return_inverse=True)
+    hit_out = pd.DataFrame(cache.results(uniq.tolist()), columns=CACHED_COLS).iloc[inverse]
+    hit_out.index = df.index[hit]
+    hit_df = df[hit]
+    for out_col, in_col in PASSTHROUGH_COLS.items():
+        hit_out[out_col] = _text_col(hit_df, in_col).to_numpy()
+    hit_out = hit_out[RESULT_COLS]
+
+    if n_hit == len(hit):
+        return _restore_dtypes(_render_cached(hit_out, cache.lang))
+    order = np.argsort(np.concatenate([np.flatnonzero(hit), np.flatnonzero(~hit)]), kind="stable")
+    out = _restore_dtypes(_render_cached(pd.concat([hit_out, miss_out]).iloc[order], cache.lang))
+    out.attrs = dict(miss_out.attrs)
+    return out
+
+def screen_cached(df: pd.DataFrame, screen, cache: Optional[VerdictCache]) -> pd.DataFrame:
+    """
+    캐시에 없는 행만 screen(df) 으로 판정
+    cache 가 있으면 screen 은 理由 를 REASON_CODE 형식으로 반환해야 함 (결과는 cache.lang 으로 표시)
+    """
+    if cache is None:
+        return screen(df)
+    if len(df) == 0:
+        return _render_cached(screen(df), cache.lang)
+    lookup = _cache_lookup(df, cache)
+    hit = lookup[2]
+    miss_out = screen(df[~hit]) if not hit.all() else None
+    return _cache_merge(df, lookup, miss_out, cache)
+
+# ============================================================
+# [실행 모드] 전체 로드 / 청크 스트리밍
+# ============================================================
+def load_input(csv_path: str, load: str, snapshots: Optional[InputSnapshotCache] = None):
+    """
+    CSV → (DataFrame, 인코딩, 신뢰도, 스냅샷 적중 여부)
+    snapshots 가 있으면 같은 파일(경로/크기/수정 시각/내용)의 이전 파싱 결과를 재사용, 없으면 파싱 후 저장
+    """
+    key = snapshots.key(csv_path, load) if snapshots is not None else None
+    if key is not None:
+        found = snapshots.get(key)
+        if found is not None:
+            df, entry = found
+            return df, entry["encoding"], entry["encoding_confidence"], True
+
+    # CSV 인코딩 자동감지 (샘플로 판별 → 한 번만 파싱)
+    df, enc, confidence = read_csv_auto(csv_path, **LOAD_MODES[load])
+    if key is not None:
+        snapshots.put(key, df, encoding=enc, encoding_confidence=confidence, csv_path=os.path.abspath(csv_path))
+    return df, enc, confidence, False
+
+def output_frame(out: pd.DataFrame, chunk: pd.DataFrame, slim: bool = False) -> pd.DataFrame:
+    """판정 결과 + 원본 컬럼 → 저장할 DataFrame (slim=True 면 디버그용 컬럼 제외)"""
+    if slim:
+        out = out.drop(columns=[c for c in DEBUG_RESULT_COLS if c in out.columns])
+    return pd.concat([out, chunk], axis=1)
+
+def _run_filter_full(csv_path: str, out_xlsx: str, screen, open_writer, slim: bool, executor, workers: int,
+                     cache: Optional[VerdictCache], reporter: ProgressReporter, stats: Optional[dict],
+                     load: str, snapshots: Optional[InputSnapshotCache]):
+    reporter.start("load")
+    df, enc, confidence, snapshot_hit = load_input(csv_path, load, snapshots)
+    reporter.update(len(df))
+    if stats is not None:
+        stats.update(encoding=enc, encoding_confidence=confidence, rows=len(df), workers=workers, load=load)
+        if snapshots is not None:
+            stats["input_snapshot"] = {"path": snapshots.folder, "format": snapshots.format, "hit": snapshot_hit}
+
+    # 판정 (SCREEN_BLOCK_ROWS 단위로 진행 상황 보고 / 취소 확인)
+    n = len(df)
+    reporter.start("screen", n)
+    outs = []
+    for a in range(0, n, SCREEN_BLOCK_ROWS):
+        block = df.iloc[a:a + SCREEN_BLOCK_ROWS]
+        outs.append(screen_cached(block, lambda d: screen_parallel(d, screen, workers, executor), cache))
+        reporter.update(a + len(block))
+    out = _restore_dtypes(pd.concat(outs)) if outs else screen_cached(df, screen, cache)
+    if stats is not None:
+        screen_stats = add_screen_stats({}, outs)
+        stats["memo"] = memo_summary(screen_stats.get("memo", {}))
+        stats["check_sec"] = screen_stats.get("check_sec", {})
+    df_out = output_frame(out, df, slim)
+
+    # 저장 (審査結果 / NGのみ / 要確認のみ)
+    reporter.start("write", n)
+    writer = open_writer(out_xlsx)
+    try:
+        for a in range(0, n, SCREEN_BLOCK_ROWS):
+            writer.append(df_out.iloc[a:a + SCREEN_BLOCK_ROWS])
+            reporter.update(min(a + SCREEN_BLOCK_ROWS, n))
+        if n == 0:
+            writer.append(df_out)
+        reporter.start("save")
+        writer.close()   # 여기서 XLSX 를 직렬화/압축 → 실패(디스크 부족 / 중단)해도 임시 파일을 지움
+    except BaseException:
+        writer.discard()
+        raise
+    if stats is not None:
+        stats["sheet_rows"] = dict(writer.counts)
+
+def _run_filter_chunked(csv_path: str, out_xlsx: str, screen, chunksize: int, open_writer, slim: bool, executor,
+                        workers: int, cache: Optional[VerdictCache], reporter: ProgressReporter,
+                        stats: Optional[dict], load: str):
+    """CSV 를 chunksize 행씩 읽어 판정 → 바로 XLSX 에 기록 (메모리 사용량이 파일 크기와 무관)"""
+    enc, confidence = detect_csv_encoding(csv_path)
+    candidates = [enc] + [e for e in CSV_ENCODINGS if e != enc]
+    size = os.path.getsize(csv_path)
+
+    last_err = None
+    for i, e in enumerate(candidates):
+        writer = open_writer(out_xlsx)
+        rows = 0
+        screen_stats = {}
+        if cache is not None:
+            cache.hits = cache.misses = 0
+        reporter.start("screen")   # 전체 행 수는 모름 → 읽은 바이트 비율로 진행률 계산
+        try:
+            with open(csv_path, "rb") as fh:
+                for out, chunk in _screen_chunks(_read_chunks(fh, e, chunksize, load), screen, executor, workers * 2,
+                                                 cache):
+                    writer.append(output_frame(out, chunk, slim))
+                    add_screen_stats(screen_stats, [out])
+                    rows += len(chunk)
+                    reporter.update(rows, fraction=(min(fh.tell() / size, 1.0) if size else None))
+            reporter.start("save")
+            writer.close()
+        except UnicodeDecodeError as err:
+            # 샘플 이후에서 판별이 틀린 경우 → 다음 코덱으로 처음부터 다시
+            writer.discard()
+            last_err = err
+            continue
+        except BaseException:   # 읽기 실패(_read_chunks) / 판정 / 기록 오류 / 취소 / KeyboardInterrupt
+            writer.discard()
+            raise
+
+        if stats is not None:
+            stats.update(encoding=e, encoding_confidence=(confidence if i == 0 else 0.0),
+                         rows=rows, chunksize=chunksize, workers=workers, load=load,
+                         memo=memo_summary(screen_stats.get("memo", {})), check_sec=screen_stats.get("check_sec", {}),
+                         sheet_rows=dict(writer.counts))
+        return
+
+    raise RuntimeError(f"❌ CSV 읽기 실패: {last_err}")
+
+def _partial_path(out_xlsx: str) -> str:
+    # 저장이 끝나기 전까지는 임시 파일에 기록 → 완료 시 교체 (중단/오류 시 반쯤 쓰인 xlsx 를 남기지 않음)
+    root, ext = os.path.splitext(out_xlsx)
+    return f"{root}.part{ext or '.xlsx'}"
+
+# ============================================================
+# [핵심 실행 함수] GUI에서 이 함수만 호출하면 됨
+# ============================================================
+def run_filter(csv_path: str, out_xlsx: str, engine: str = "columnar",
+               stats: Optional[dict] = None, chunksize: Optional[int] = None,
+               writer: str = "stream", workers: int = 1,
+               progress: Optional[Callable[[dict], None]] = None,
+               cancel_event: Optional[threading.Event] = None,
+               verdict_cache: Optional[str] = None,
+               profile: Optional[RunProfiler] = None, load: str = "infer", lang: str = "jp",
+               input_snapshot: Optional[str] = None, layout: str = "sheets", slim: bool = False,
+               companion: Optional[str] = None, rules: Optional[RuleConfig] = None,
+               results_db: Optional[str] = None) -> str:
+    """
+    csv_path: 입력 CSV 경로
+    out_xlsx: 출력 XLSX 경로
+    engine: 판정 엔진 ("columnar": 컬럼 단위 벡터화(기본) / "row": 기존 행 단위)
+    stats: dict 를 넘기면 실행 정보를 채워서 돌려줌
+           (encoding: 사용한 인코딩 / encoding_confidence: 판별 신뢰도 / rows: 행 수)
+    chunksize: 지정하면 스트리밍 모드 (CSV 를 chunksize 행씩 읽고 결과를 바로 기록)
+               → 메모리 사용량이 파일 크기와 무관. 시트 구성은 동일
+               ※ 항상 load="text" 로 읽음 (청크마다 타입을 추론하면 청크 경계에 따라 같은 컬럼이 3 / 3.0 으로 갈림)
+                 → 결과는 chunksize 없이 load="text" 로 실행한 것과 같음
+    writer: XLSX 저장 방식 ("stream": openpyxl write-only(기본) / "xlsxwriter" / "pandas": 기존 to_excel x3)
+    layout: 시트 구성 ("sheets": NGのみ/要確認のみ 에도 행 전체 복사(기본) /
+            "single": 審査結果 에만 행 전체 + 자동 필터, NGのみ/要確認のみ 는 행 번호 링크 색인 → result_writer 참고)
+    slim: True 면 디버그용 컬럼(DEBUG_RESULT_COLS)을 출력하지 않음
+    ※ 시트가 엑셀 최대 행 수(1,048,576)를 넘으면 審査結果_2, 審査結果_3 … 으로 나눠서 기록 (각 시트에 헤더)
+    companion: "csv" / "parquet" 를 지정하면 XLSX 와 같은 내용 전체를 같은 이름 + 확장자 파일로도 저장
+               (parquet 은 pyarrow 필요 / stats["companion"] 에 경로)
+    workers: 2 이상이면 프로세스 풀로 병렬 판정 (행 순서/결과는 직렬 실행과 동일)
+    progress: 진행 상황 콜백 progress(dict)
+              (phase / rows_done / rows_total / fraction / rows_per_sec / eta_sec)
+    cancel_event: set() 되면 다음 확인 시점에 FilterCancelled 발생 (결과 파일은 만들지 않음)
+    verdict_cache: 판정 캐시(SQLite) 경로. 지정하면 이전 실행과 내용이 같은 행은 판정을 건너뜀
+                   (기본 위치: VERDICT_CACHE_DB / stats["verdict_cache"] 에 적중/미적중 행 수)
+    profile: RunProfiler 를 넘기면 단계별 시간/행 수/최대 메모리, 체크별 누적 시간을 기록
+             (profile.save(path) → JSON 보고서 / profile.summary() → 한 줄 요약)
+    load: 입력 로드 방식 ("infer": pandas 타입 추론(기본) /
+          "text": 모든 컬럼을 문자열로 읽음. 판정 안 하는 컬럼은 원문 그대로 결과에 실림 → LOAD_MODES 참고)
+    lang: 理由(要約) 표시 언어 ("jp": 일본어(기본) / "kr": 한국어). 판정 자체는 같고 문장만 바뀜
+    rules: 판정 규칙 (RuleConfig). 생략 시 current_rules() = 설정 파일의 현재 내용 (저장 직후에도 재시작 없이 반영)
+    results_db: 결과 DB(SQLite) 경로. 지정하면 판정 결과(공고 키 / 체크별 상태 / 理由 코드 / 時給換算値 / 규칙 지문)를
+                실행 단위로 기록 (기본 위치: RESULTS_DB / 조회는 results_store 참고. stats["results_db"] 에 실행 번호)
+    input_snapshot: 입력 스냅샷 폴더. 지정하면 같은 CSV 를 다시 열 때 파싱을 건너뜀
+                    (기본 위치: INPUT_SNAPSHOT_DIR / 전체 로드 모드만. stats["input_snapshot"]["hit"] 에 적중 여부)
+    ※ stats["sheet_rows"]: 시트별 기록 행 수 {審査結果: 전체, NGのみ: NG 행 수, 要確認のみ: 要確認 행 수}
+    ※ stats["memo"]: 컬럼 단위 엔진의 값 단위 메모이제이션 통계
+       (컬럼별 rows / distinct(실제로 판정한 값 수) / hits / hit_rate)
+    return: 생성된 XLSX 경로
+    """
+    if engine not in SCREEN_ENGINES:
+        raise ValueError(f"❌ 알 수 없는 엔진: {engine} (사용 가능: {', '.join(SCREEN_ENGINES)})")
+    if writer not in WRITER_BACKENDS:
+        raise ValueError(f"❌ 알 수 없는 저장 방식: {writer} (사용 가능: {', '.join(WRITER_BACKENDS)})")
+    if layout not in LAYOUTS:
+        raise ValueError(f"❌ 알 수 없는 시트 구성: {layout} (사용 가능: {', '.join(LAYOUTS)})")
+    if companion is not None and companion not in COMPANIONS:
+        raise ValueError(f"❌ 알 수 없는 동반 파일 형식: {companion} (사용 가능: {', '.join(COMPANIONS)})")
+    if chunksize is not None and chunksize <= 0:
+        raise ValueError(f"❌ chunksize 는 1 이상이어야 함: {chunksize}")
+    if workers < 1:
+        raise ValueError(f"❌ workers 는 1 이상이어야 함: {workers}")
+    if load not in LOAD_MODES:
+        raise ValueError(f"❌ 알 수 없는 로드 방식: {load} (사용 가능: {', '.join(LOAD_MODES)})")
+    if lang not in REASON_LANGS:
+        raise ValueError(f"❌ 알 수 없는 언어: {lang} (사용 가능: {', '.join(REASON_LANGS)})")
+    if chunksize:
+        load = "text"    # 전체를 보지 않고는 컬럼 타입을 정할 수 없음 → 추론하지 않고 모든 청크를 문자열로
+
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"❌ CSV 파일 없음: {csv_path}")
+
+    # 저장 폴더
     out_dir = os.path.dirname(out_xlsx)
     if out_dir and not os.path.exists(out_dir):
         os.makedirs(out_dir, exist_ok=True)
 
-    with pd.ExcelWriter(out_xlsx, engine="openpyxl") as writer:
-        df_out.to_excel(writer, sheet_name="審査結果", index=False)
-        df_out[df_out["判定(総合)"] == "NG"].to_excel(writer, sheet_name="NGのみ", index=False)
-        df_out[df_out["判定(総合)"] == "要確認"].to_excel(writer, sheet_name="要確認のみ", index=False)
+    rules = rules or current_rules()
+    # 판정 캐시를 쓰면 理由 를 코드 형식으로 판정 / 저장하고 출력 직전에 lang 으로 표시 (jp / kr 가 캐시 공유)
+    screen = functools.partial(SCREEN_ENGINES[engine], lang=(REASON_CODE if verdict_cache else lang), rules=rules)
+    if profile is not None:
+        screen = functools.partial(screen, timings=True)   # 프로세스 풀에도 그대로 넘길 수 있음
+        if stats is None:
+            stats = {}
+        profile.start(csv_path=csv_path, out_xlsx=out_xlsx, engine=engine, workers=workers,
+                      chunksize=chunksize, writer=writer, load=load, lang=lang, layout=layout, slim=slim,
+                      companion=companion, rules=rules.key)
+    reporter = ProgressReporter(progress, cancel_event, profile)
+    part_xlsx = _partial_path(out_xlsx)
+    side_path = f"{os.path.splitext(out_xlsx)[0]}.{companion}" if companion else None
+    part_side = _partial_path(side_path) if companion else None
+    open_writer = functools.partial(open_result_writer, backend=writer, layout=layout,
+                                    companion=companion, companion_path=part_side)
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    cache = VerdictCache(verdict_cache, rules_fingerprint(rules), lang=lang) if verdict_cache else None
+    store = ResultsStore(results_db, reason_codes) if results_db else None
+    if store is not None:
+        # 결과 저장과 같은 블록을 DB 에도 기록 (재시도로 writer 를 다시 열면 기록도 처음부터)
+        open_writer = functools.partial(store.recording, open_writer, csv_path=os.path.abspath(csv_path),
+                                        out_xlsx=os.path.abspath(out_xlsx), rules=rules.key, lang=lang)
+    try:
+        if chunksize:
+            _run_filter_chunked(csv_path, part_xlsx, screen, chunksize, open_writer, slim, executor, workers, cache,
+                                reporter, stats, load)
+        else:
+            snapshots = InputSnapshotCache(input_snapshot) if input_snapshot else None
+            _run_filter_full(csv_path, part_xlsx, screen, open_writer, slim, executor, workers, cache, reporter, stats,
+                             load, snapshots)
+        os.replace(part_xlsx, out_xlsx)
+        if companion:
+            os.replace(part_side, side_path)
+            if stats is not None:
+                stats["companion"] = side_path
+        if store is not None:
+            store.commit()    # 출력 파일이 확정된 뒤에만 기록을 남김
+            if stats is not None:
+                stats["results_db"] = {"path": store.path, "run_id": store.run_id}
+        if cache is not None and stats is not None:
+            stats["verdict_cache"] = {"path": cache.path, "hits": cache.hits, "misses": cache.misses}
+    except BaseException:
+        for path in (part_xlsx, part_side):
+            if path and os.path.exists(path):
+                os.remove(path)
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        if cache is not None:
+            cache.close()
+        if store is not None:
+            store.close()
+        if profile is not None:
+            profile.stop()
+            profile.add_checks(stats.get("check_sec", {}))
+            profile.info.update({k: stats[k] for k in ("rows", "encoding", "verdict_cache") if k in stats})
 
     return out_xlsx
 
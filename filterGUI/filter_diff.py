@@ -0,0 +1,246 @@
+# filter_diff.py
+# -*- coding: utf-8 -*-
+"""
+filter_diff.py - 실행 간 차이 보고서 (같은 누적 CSV 를 매일 심사할 때 바뀐 행만 보기)
+
+사용법:
+    python -m filter_diff 20260301.xlsx 20260302.xlsx -o diff.xlsx      # 결과 파일 2개
+    python -m filter_diff run:previous run:latest -o diff.xlsx          # 결과 DB 에 기록된 실행 2개
+    python -m filter_diff run:12 out/20260302.csv -o diff.csv           # 섞어서도 가능
+
+- 실행 지정
+  - 결과 파일: run_filter 의 XLSX (審査結果 시트. 분할 시트 審査結果_2 … 포함) / 동반 파일(.csv / .parquet)
+    ※ 수십만 행이면 XLSX 읽기가 가장 느림 → 동반 파일이나 결과 DB 권장
+  - run:<번호> / run:latest / run:previous: 결과 DB(--db, 기본 RESULTS_DB)의 실행 (results_store 참고)
+- 공고 키(仕事ID → お仕事No.)로 두 실행을 해시 조인 → 新規 / 削除 / 判定変更 행만 출력 (理由 전후 포함)
+  - 같은 키가 여러 번 나오면 나온 순서대로 짝지음
+  - 키가 빈 행은 비교 대상에서 제외 (요약의 no_key 에 건수)
+- 출력: .csv 면 CSV (UTF-8 BOM), 그 외는 XLSX (差分 시트 + 概要 시트)
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from filter_core_v2 import RESULTS_DB
+from result_writer import SHEET_ALL, shard_title
+from results_store import COMPANY_COL, JOB_KEY_COLS, REASON_COL, VERDICT_COL, ResultsStore, job_keys
+
+RUN_PREFIX = "run:"
+CHANGE_NEW, CHANGE_CHANGED, CHANGE_REMOVED = "新規", "判定変更", "削除"
+CHANGE_ORDER = [CHANGE_NEW, CHANGE_CHANGED, CHANGE_REMOVED]
+KEY_COL = "求人キー"
+DIFF_SHEET = "差分"
+SUMMARY_SHEET = "概要"
+DIFF_COLS = ["区分", KEY_COL, COMPANY_COL, "判定(前)", "判定(後)", "理由(前)", "理由(後)"]
+
+# ============================================================
+# [실행 읽기] → DataFrame(job_key / company / verdict / reason), 행 순서 유지
+# ============================================================
+def _frame(raw: pd.DataFrame, source: str) -> pd.DataFrame:
+    keys = job_keys(raw)
+    if keys is None:
+        raise ValueError(f"❌ 공고 키 컬럼({' / '.join(JOB_KEY_COLS)}) 없음: {source}")
+    if VERDICT_COL not in raw.columns:
+        raise ValueError(f"❌ 심사 결과가 아님({VERDICT_COL} 컬럼 없음): {source}")
+    missing = pd.Series([None] * len(raw), index=raw.index, dtype="string")
+    return pd.DataFrame({
+        # 동반 파일은 모든 값이 문자열 (infer 로드의 정수 ID 는 "12345.0")
+        "job_key": pd.Series(keys, dtype="string").str.replace(r"^(\d+)\.0$", r"\1", regex=True),
+        "company": raw[COMPANY_COL].astype("string") if COMPANY_COL in raw.columns else missing,
+        "verdict": raw[VERDICT_COL].astype("string"),
+        "reason": (raw[REASON_COL].astype("string") if REASON_COL in raw.columns else missing).fillna(""),
+    })
+
+def _read_xlsx(path: str) -> pd.DataFrame:
+    """審査結果 (분할 시트 포함)에서 필요한 컬럼만 읽음"""
+    from openpyxl import load_workbook
+
+    wanted = [VERDICT_COL, REASON_COL, COMPANY_COL] + JOB_KEY_COLS
+    wb = load_workbook(path, read_only=True)
+    try:
+        columns = {c: [] for c in wanted}
+        k = 1
+        while shard_title(SHEET_ALL, k) in wb.sheetnames:
+            rows = wb[shard_title(SHEET_ALL, k)].iter_rows(values_only=True)
+            header = next(rows, ())
+            # 결과 컬럼과 원본 컬럼의 이름이 같으면 앞쪽 = 판정 결과
+            pos = {}
+            for i, name in enumerate(header):
+                pos.setdefault(name, i)
+            picks = [(c, pos[c]) for c in wanted if c in pos]
+            for row in rows:
+                for c, i in picks:
+                    columns[c].append(row[i] if i < len(row) else None)
+            k += 1
+        if k == 1:
+            raise ValueError(f"❌ {SHEET_ALL} 시트 없음: {path}")
+    finally:
+        wb.close()
+    return pd.DataFrame({c: pd.Series(v) for c, v in columns.items() if v})
+
+def read_result_file(path: str) -> pd.DataFrame:
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"❌ 결과 파일 없음: {path}")
+    wanted = {VERDICT_COL, REASON_COL, COMPANY_COL, *JOB_KEY_COLS}
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        try:
+            raw = pd.read_csv(path, encoding="utf-8-sig", dtype=str, keep_default_na=False, na_values=[""],
+                              usecols=lambda c: c in wanted)
+        except UnicodeDecodeError:
+            # 동반 CSV 는 항상 UTF-8 → 입력 CSV(cp932 등)를 잘못 지정한 경우
+            raise ValueError(f"❌ 심사 결과가 아님(UTF-8 결과 CSV 아님): {path}") from None
+    elif ext == ".parquet":
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("❌ pyarrow 미설치: pip install pyarrow") from e
+        names = pq.read_schema(path).names
+        raw = pd.read_parquet(path, columns=[c for c in names if c in wanted])
+    else:
+        raw = _read_xlsx(path)
+    return _frame(raw, path)
+
+def read_stored_run(store: ResultsStore, spec: str) -> tuple:
+    """run:<번호> / run:latest / run:previous → (실행 번호, DataFrame)"""
+    which = spec[len(RUN_PREFIX):]
+    ids = store.runs()["run_id"].tolist()   # 새 것부터
+    if which in ("latest", "previous"):
+        k = 0 if which == "latest" else 1
+        if len(ids) <= k:
+            raise ValueError(f"❌ 결과 DB 에 실행 기록이 부족함: {spec} ({store.path})")
+        run_id = ids[k]
+    else:
+        try:
+            run_id = int(which)
+        except ValueError:
+            raise ValueError(f"❌ 실행 지정 오류: {spec} (run:<번호> / run:latest / run:previous)") from None
+    if run_id not in ids:
+        raise ValueError(f"❌ 결과 DB 에 없는 실행: {spec} ({store.path})")
+    df = store.run_verdicts(run_id).astype("string")
+    df["reason"] = df["reason"].fillna("")
+    return run_id, df
+
+def load_run(spec: str, db: str = RESULTS_DB) -> tuple:
+    """실행 지정(결과 파일 경로 / run:…) → (표시 이름, DataFrame)"""
+    if not spec.startswith(RUN_PREFIX):
+        return os.path.abspath(spec), read_result_file(spec)
+    if not os.path.exists(db):
+        raise FileNotFoundError(f"❌ 결과 DB 없음: {db}")
+    store = ResultsStore(db)
+    try:
+        run_id, df = read_stored_run(store, spec)
+    finally:
+        store.close()
+    return f"{RUN_PREFIX}{run_id}", df
+
+# ============================================================
+# [비교]
+# ============================================================
+def diff_runs(before: pd.DataFrame, after: pd.DataFrame) -> tuple:
+    """
+    공고 키로 해시 조인 → (차이 DataFrame(DIFF_COLS), 요약 dict)
+    같은 키가 여러 번 나오면 각 실행에서 나온 순서(1번째끼리, 2번째끼리 …)로 짝지음
+    """
+    sides = []
+    for df in (before, after):
+        df = df[df["job_key"].notna()]
+        sides.append(df.assign(nth=df.groupby("job_key", sort=False).cumcount()))
+    m = sides[0].merge(sides[1], on=["job_key", "nth"], how="outer", suffixes=("_before", "_after"),
+                       indicator=True, sort=False)
+    new = (m["_merge"] == "right_only").to_numpy()
+    removed = (m["_merge"] == "left_only").to_numpy()
+    changed = ((m["_merge"] == "both") & (m["verdict_before"] != m["verdict_after"]).fillna(True)).to_numpy()
+
+    keep = new | removed | changed
+    m = m[keep]
+    kind = np.select([new[keep], removed[keep]], [CHANGE_NEW, CHANGE_REMOVED], CHANGE_CHANGED)
+    out = pd.DataFrame({
+        "区分": pd.Categorical(kind, categories=CHANGE_ORDER),
+        KEY_COL: m["job_key"],
+        COMPANY_COL: m["company_after"].fillna(m["company_before"]),
+        "判定(前)": m["verdict_before"],
+        "判定(後)": m["verdict_after"],
+        "理由(前)": m["reason_before"],
+        "理由(後)": m["reason_after"],
+    }).sort_values("区分", kind="stable").reset_index(drop=True)
+
+    summary = {
+        "before_rows": len(before),
+        "after_rows": len(after),
+        "new": int(new.sum()),
+        "removed": int(removed.sum()),
+        "changed": int(changed.sum()),
+        "no_key": {"before": int(before["job_key"].isna().sum()), "after": int(after["job_key"].isna().sum())},
+    }
+    return out, summary
+
+def write_diff(diff: pd.DataFrame, out_path: str, summary: dict) -> str:
+    folder = os.path.dirname(out_path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    if out_path.lower().endswith(".csv"):
+        diff.to_csv(out_path, index=False, encoding="utf-8-sig")
+        return out_path
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+
+    # write-only 로 한 줄씩 기록 (to_excel 보다 빠름)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(DIFF_SHEET)
+    ws.freeze_panes = "A2"
+    ws.auto_filter.ref = f"A1:{get_column_letter(len(diff.columns))}{len(diff) + 1}"
+    ws.append(list(diff.columns))
+    for row in diff.astype(object).where(diff.notna(), None).itertuples(index=False, name=None):
+        ws.append(row)
+    overview = wb.create_sheet(SUMMARY_SHEET)
+    for row in [("項目", "値"), ("前", summary["before"]), ("後", summary["after"]),
+                ("前 行数", summary["before_rows"]), ("後 行数", summary["after_rows"]),
+                (CHANGE_NEW, summary["new"]), (CHANGE_CHANGED, summary["changed"]),
+                (CHANGE_REMOVED, summary["removed"])]:
+        overview.append(row)
+    wb.save(out_path)
+    return out_path
+
+def diff_results(before: str, after: str, out_path: str, db: str = RESULTS_DB) -> dict:
+    """
+    before / after: 결과 파일 경로 또는 run:<번호> / run:latest / run:previous
+    out_path: 차이 보고서 (.xlsx / .csv)
+    return: 요약 (건수 / 단계별 시간)
+    """
+    t0 = time.perf_counter()
+    before_name, before_df = load_run(before, db)
+    after_name, after_df = load_run(after, db)
+    t1 = time.perf_counter()
+    diff, summary = diff_runs(before_df, after_df)
+    t2 = time.perf_counter()
+    summary = {"before": before_name, "after": after_name, **summary, "output": out_path}
+    write_diff(diff, out_path, summary)
+    summary["seconds"] = {"load": round(t1 - t0, 3), "diff": round(t2 - t1, 3),
+                          "write": round(time.perf_counter() - t2, 3)}
+    return summary
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="filter_diff", description="審査結果の差分（新規／削除／判定変更）")
+    ap.add_argument("before", help="이전 실행 (결과 파일 또는 run:<번호> / run:latest / run:previous)")
+    ap.add_argument("after", help="이후 실행")
+    ap.add_argument("-o", "--out", required=True, help="차이 보고서 경로 (.xlsx / .csv)")
+    ap.add_argument("--db", default=RESULTS_DB, help="결과 DB 경로 (run:… 지정 시)")
+    args = ap.parse_args(argv)
+
+    try:
+        summary = diff_results(args.before, args.after, args.out, args.db)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(str(e), file=sys.stderr)
+        return 1
+    print(json.dumps(summary, ensure_ascii=False, indent=1))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
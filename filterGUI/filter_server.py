@@ -0,0 +1,472 @@
+# filter_server.py
+# -*- coding: utf-8 -*-
+"""
+filter_server.py - 상주 심사 서비스 (localhost HTTP / Unix 소켓)
+
+pandas/openpyxl import, 규칙(RuleConfig) 컴파일을 한 번만 해 두고 심사 작업을 큐로 받아서 처리.
+매번 exe 압축 해제 + import 하는 비용 없이 바로 판정을 시작함
+
+사용법:
+    python -m filter_server --port 8765 --jobs 2            # http://127.0.0.1:8765
+    python -m filter_server --unix /tmp/filter.sock        # Unix 소켓 (Windows 제외)
+    python -m filter_cli data/*.csv -o out/ --server http://127.0.0.1:8765   # CLI 에서 작업 제출
+
+API (JSON):
+    POST   /jobs        {"csv_path": ..., "out_xlsx"(생략 시 <파일명>_<작업ID>.xlsx), 옵션...}
+                        → 202 작업 정보. 옵션은 run_filter 인자와 같음 (JOB_OPTIONS / 값은 check_options 로 검사)
+                          out_xlsx 는 --out-dir 안의 .xlsx 만 (상대 경로는 --out-dir 기준)
+                          verdict_cache / input_snapshot / results_db 는 true/false 만 (true 면 기본 위치)
+                          Content-Type: application/json 필수
+    GET    /jobs        → 작업 목록
+    GET    /jobs/<id>   → 상태(queued/running/done/failed/cancelled) / 진행 상황 / 결과 파일 경로 / 요약
+    DELETE /jobs/<id>   → 취소 (대기 중이면 바로, 실행 중이면 다음 확인 시점에)
+    GET    /health      → 서비스 상태 (대기/실행 중 작업 수, 규칙 키)
+
+- 작업은 asyncio 큐에 쌓이고, 동시에 최대 --jobs 개를 스레드 풀에서 run_filter 로 실행
+  (작업 하나 안의 병렬 판정은 옵션 workers=N → 프로세스 풀)
+- 설정(最低賃金)을 저장하면 다음 작업부터 반영 (run_filter → current_rules())
+- 완료된 작업 정보는 최근 JOB_HISTORY 개만 보관
+- 인증이 없고 클라이언트가 준 csv_path 를 서비스 권한으로 읽음 (쓰는 곳은 --out-dir 과 기본 캐시/DB 위치뿐)
+  → 루프백이 아닌 주소(--host 0.0.0.0 등)는 --allow-remote 를 명시해야만 허용
+  → 브라우저 경유 요청(다른 사이트의 fetch / DNS rebinding) 차단: Origin 헤더가 있거나
+    Host 가 루프백 이름/주소가 아니면 403 (--allow-remote 면 Host 는 검사하지 않음)
+"""
+
+import argparse
+import asyncio
+import http.client
+import ipaddress
+import itertools
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional
+from urllib.parse import urlsplit
+
+from filter_cli import screen_file
+from filter_core_v2 import (INPUT_SNAPSHOT_DIR, LOAD_MODES, REASON_LANGS, RESULTS_DB, SCREEN_ENGINES,
+                            VERDICT_CACHE_DB, current_rules)
+from result_writer import COMPANIONS, LAYOUTS, WRITER_BACKENDS
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_SERVER = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+JOB_HISTORY = 1000                # 보관할 완료 작업 수
+MAX_BODY_BYTES = 1024 * 1024      # 요청 본문 최대 크기
+JOB_OPTIONS = {"engine", "writer", "layout", "slim", "lang", "load", "chunksize", "companion", "workers",
+               "verdict_cache", "input_snapshot", "results_db"}
+OPTION_CHOICES = {"engine": SCREEN_ENGINES, "writer": WRITER_BACKENDS, "layout": LAYOUTS, "lang": REASON_LANGS,
+                  "load": LOAD_MODES, "companion": COMPANIONS}
+OPTION_DEFAULT_PATHS = {"verdict_cache": VERDICT_CACHE_DB, "input_snapshot": INPUT_SNAPSHOT_DIR,
+                        "results_db": RESULTS_DB}
+FINISHED = ("done", "failed", "cancelled")
+
+HTTP_REASONS = {200: "OK", 202: "Accepted", 400: "Bad Request", 403: "Forbidden", 404: "Not Found",
+                405: "Method Not Allowed", 413: "Payload Too Large", 415: "Unsupported Media Type",
+                500: "Internal Server Error"}
+
+class JobError(Exception):
+    """요청 오류 (HTTP 상태 코드 포함)"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+def check_options(options: dict) -> dict:
+    """
+    요청 옵션 검사 → run_filter 인자. 잘못된 값은 JobError(400) (큐에 넣은 뒤 screen_file 에서 실패하지 않도록)
+    - engine / writer / layout / lang / load / companion: 정해진 값만 (companion 은 null = 사용 안 함)
+    - workers / chunksize: 양의 정수 (chunksize 는 null = 스트리밍 안 함)
+    - slim: true/false
+    - verdict_cache / input_snapshot / results_db: true/false 만 (경로는 받지 않음, true 면 기본 위치)
+    """
+    unknown = set(options) - JOB_OPTIONS
+    if unknown:
+        raise JobError(400, f"❌ 알 수 없는 옵션: {', '.join(sorted(unknown))}")
+    checked = {}
+    for k, v in options.items():
+        if k in OPTION_CHOICES:
+            if not ((isinstance(v, str) and v in OPTION_CHOICES[k]) or (v is None and k == "companion")):
+                raise JobError(400, f"❌ {k} 값이 잘못됨: {v!r} (가능한 값: {', '.join(OPTION_CHOICES[k])})")
+        elif k in ("workers", "chunksize"):
+            if not ((isinstance(v, int) and not isinstance(v, bool) and v > 0) or (v is None and k == "chunksize")):
+                raise JobError(400, f"❌ {k} 는 양의 정수여야 함: {v!r}")
+        elif not isinstance(v, bool):
+            raise JobError(400, f"❌ {k} 는 true/false 여야 함: {v!r}")
+        elif k in OPTION_DEFAULT_PATHS:
+            v = OPTION_DEFAULT_PATHS[k] if v else None
+        checked[k] = v
+    return checked
+
+def is_loopback_name(host: str) -> bool:
+    """Host 헤더의 호스트 부분이 루프백 이름/주소 그대로인지 (DNS 는 조회하지 않음 → rebinding 된 이름은 False)"""
+    if host.lower() in ("localhost", "localhost."):
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+# ============================================================
+# [작업]
+# ============================================================
+class Job:
+    def __init__(self, job_id: str, csv_path: str, out_xlsx: str, options: dict):
+        self.id = job_id
+        self.csv_path = csv_path
+        self.out_xlsx = out_xlsx
+        self.options = options
+        self.status = "queued"
+        self.progress = None          # run_filter progress 콜백의 마지막 값
+        self.result = None            # filter_cli.screen_file 요약 (rows / ng / check / phases ...)
+        self.error = None
+        self.cancel_event = threading.Event()
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+
+    def on_progress(self, info: dict):
+        # 작업 스레드에서 호출 → dict 를 통째로 바꿔 끼우기만 함
+        self.progress = info
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "csv_path": self.csv_path,
+            "out_xlsx": self.out_xlsx,
+            "options": self.options,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "submitted": self.submitted,
+            "started": self.started,
+            "finished": self.finished,
+        }
+
+# ============================================================
+# [서비스] asyncio 큐 + 스레드 풀
+# ============================================================
+class ScreeningService:
+    def __init__(self, jobs: int = 1, out_dir: Optional[str] = None, allow_remote: bool = False):
+        """allow_remote: True 면 Host 헤더를 검사하지 않음 (--allow-remote 로 루프백이 아닌 주소에서 받을 때)"""
+        if jobs < 1:
+            raise ValueError(f"❌ jobs 는 1 이상이어야 함: {jobs}")
+        self.jobs = jobs
+        self.out_dir = os.path.realpath(out_dir or os.getcwd())
+        self.allow_remote = allow_remote
+        self.executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="screen")
+        self.queue = None
+        self.workers = []
+        self.table = OrderedDict()    # 작업 ID → Job (제출 순서)
+        self._ids = itertools.count(1)
+
+    def warm_up(self) -> str:
+        """규칙을 미리 컴파일 (최저임금 표 / 都道府県 정규식 / 토큰 매처) → 규칙 키"""
+        rules = current_rules()
+        _ = rules.pref_re, rules.min_wage_table, rules.special_mark_matcher, rules.job_condition_matcher
+        return rules.key
+
+    async def start(self):
+        self.queue = asyncio.Queue()
+        self.workers = [asyncio.create_task(self._worker()) for _ in range(self.jobs)]
+
+    async def stop(self):
+        for job in self.table.values():
+            job.cancel_event.set()
+        for w in self.workers:
+            w.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    # --------------------------------------------------------
+    # 작업 제출 / 조회 / 취소
+    # --------------------------------------------------------
+    def submit(self, payload: dict) -> Job:
+        if not isinstance(payload, dict) or not payload.get("csv_path"):
+            raise JobError(400, "❌ csv_path 가 필요함")
+        if not isinstance(payload["csv_path"], str):
+            raise JobError(400, f"❌ csv_path 는 문자열이어야 함: {payload['csv_path']!r}")
+        options = check_options({k: v for k, v in payload.items() if k not in ("csv_path", "out_xlsx")})
+
+        csv_path = os.path.abspath(payload["csv_path"])
+        job_id = f"{datetime.now():%Y%m%d%H%M%S}-{next(self._ids)}"
+        out_xlsx = payload.get("out_xlsx")
+        if not out_xlsx:
+            stem = os.path.splitext(os.path.basename(csv_path))[0]
+            out_xlsx = f"{stem}_{job_id}.xlsx"
+        job = Job(job_id, csv_path, self.output_path(out_xlsx), options)
+        self.table[job_id] = job
+        self.queue.put_nowait(job)
+        self._trim()
+        return job
+
+    def output_path(self, out_xlsx) -> str:
+        """요청의 out_xlsx → --out-dir 안의 절대 경로 (밖을 가리키면 JobError(400))"""
+        if not isinstance(out_xlsx, str) or not out_xlsx.lower().endswith(".xlsx"):
+            raise JobError(400, f"❌ out_xlsx 는 .xlsx 파일 경로여야 함: {out_xlsx!r}")
+        path = os.path.realpath(os.path.join(self.out_dir, out_xlsx))
+        if os.path.commonpath([path, self.out_dir]) != self.out_dir:
+            raise JobError(400, f"❌ out_xlsx 는 결과 폴더({self.out_dir}) 안이어야 함: {out_xlsx}")
+        return path
+
+    def get(self, job_id: str) -> Job:
+        job = self.table.get(job_id)
+        if job is None:
+            raise JobError(404, f"❌ 작업 없음: {job_id}")
+        return job
+
+    def cancel(self, job_id: str) -> Job:
+        job = self.get(job_id)
+        if job.status in FINISHED:
+            return job
+        job.cancel_event.set()
+        if job.status == "queued":
+            job.status = "cancelled"       # 큐에서 꺼낼 때 건너뜀
+            job.finished = time.time()
+        return job
+
+    def _trim(self):
+        """완료된 작업이 JOB_HISTORY 개를 넘으면 오래된 것부터 삭제"""
+        done = [k for k, j in self.table.items() if j.status in FINISHED]
+        for k in done[:max(len(done) - JOB_HISTORY, 0)]:
+            del self.table[k]
+
+    def health(self) -> dict:
+        counts = {}
+        for job in self.table.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {"status": "ok", "jobs": self.jobs, "counts": counts, "rules": current_rules().key}
+
+    # --------------------------------------------------------
+    # 실행
+    # --------------------------------------------------------
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self.queue.get()
+            try:
+                if job.status != "queued":
+                    continue
+                job.status = "running"
+                job.started = time.time()
+                result = await loop.run_in_executor(self.executor, screen_file, job.csv_path, job.out_xlsx,
+                                                    job.options, job.on_progress, job.cancel_event)
+                job.result = result
+                job.error = result["error"]
+                if job.cancel_event.is_set() and not result["ok"]:
+                    job.status = "cancelled"
+                else:
+                    job.status = "done" if result["ok"] else "failed"
+            except Exception as e:
+                job.status = "failed"
+                job.error = str(e)
+            finally:
+                if job.status in FINISHED and job.finished is None:
+                    job.finished = time.time()
+                self.queue.task_done()
+                self._trim()
+
+    # --------------------------------------------------------
+    # HTTP (요청 1개 = 연결 1개, JSON 만 주고받음)
+    # --------------------------------------------------------
+    def check_headers(self, method: str, headers: dict):
+        """브라우저 경유 요청 차단: Origin 이 있거나 Host 가 루프백 이름/주소가 아니면 403 / POST 는 JSON 만"""
+        if "origin" in headers:
+            raise JobError(403, f"❌ 브라우저에서 보낸 요청은 받지 않음 (Origin: {headers['origin']})")
+        host = urlsplit("//" + headers.get("host", "")).hostname or ""
+        if not (self.allow_remote or is_loopback_name(host)):
+            raise JobError(403, f"❌ 허용하지 않는 Host: {headers.get('host', '(없음)')}")
+        if method == "POST":
+            content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+            if content_type != "application/json":
+                raise JobError(415, f"❌ Content-Type 은 application/json 이어야 함: {content_type or '(없음)'}")
+
+    def route(self, method: str, path: str, body: bytes, headers: dict):
+        """headers: 소문자 이름 → 값"""
+        self.check_headers(method, headers)
+        parts = [p for p in path.split("/") if p]
+        if parts == ["health"] and method == "GET":
+            return 200, self.health()
+        if parts == ["jobs"]:
+            if method == "GET":
+                return 200, {"jobs": [j.to_dict() for j in self.table.values()]}
+            if method == "POST":
+                try:
+                    payload = json.loads(body.decode("utf-8") or "{}")
+                except ValueError as e:
+                    raise JobError(400, f"❌ JSON 형식 오류: {e}") from e
+                return 202, self.submit(payload).to_dict()
+            raise JobError(405, f"❌ 지원하지 않는 메서드: {method}")
+        if len(parts) == 2 and parts[0] == "jobs":
+            if method == "GET":
+                return 200, self.get(parts[1]).to_dict()
+            if method == "DELETE":
+                return 200, self.cancel(parts[1]).to_dict()
+            raise JobError(405, f"❌ 지원하지 않는 메서드: {method}")
+        raise JobError(404, f"❌ 알 수 없는 경로: {path}")
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            try:
+                request_line = (await reader.readline()).decode("latin-1").strip()
+                method, target, _ = request_line.split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    k, _, v = line.decode("latin-1").partition(":")
+                    headers[k.strip().lower()] = v.strip()
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY_BYTES:
+                    raise JobError(413, f"❌ 요청 본문이 너무 큼: {length} bytes")
+                body = await reader.readexactly(length) if length else b""
+                status, payload = self.route(method.upper(), urlsplit(target).path, body, headers)
+            except JobError as e:
+                status, payload = e.status, {"error": str(e)}
+            except (ValueError, asyncio.IncompleteReadError) as e:
+                status, payload = 400, {"error": f"❌ 잘못된 요청: {e}"}
+            except Exception as e:
+                status, payload = 500, {"error": f"❌ 서버 오류: {e}"}
+
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            head = (f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+                    "Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    "Connection: close\r\n\r\n")
+            writer.write(head.encode("latin-1") + data)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+async def serve(service: ScreeningService, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                unix_path: Optional[str] = None, ready=None):
+    """서비스 실행 (취소될 때까지). ready: 연결을 받을 준비가 되면 ready(주소) 호출"""
+    await service.start()
+    if unix_path:
+        if os.path.exists(unix_path):
+            os.remove(unix_path)
+        server = await asyncio.start_unix_server(service.handle, path=unix_path)
+        address = f"unix:{unix_path}"
+    else:
+        server = await asyncio.start_server(service.handle, host=host, port=port)
+        address = f"http://{host}:{server.sockets[0].getsockname()[1]}"
+    if ready is not None:
+        ready(address)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+        if unix_path and os.path.exists(unix_path):
+            os.remove(unix_path)
+
+# ============================================================
+# [클라이언트] gui_app / filter_cli 등에서 작업 제출용
+# server: "http://127.0.0.1:8765" 또는 "unix:/tmp/filter.sock"
+# ============================================================
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.unix_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.unix_path)
+
+def request(server: str, method: str, path: str, payload: Optional[dict] = None, timeout: float = 30.0) -> dict:
+    """서비스에 요청 1개 → 응답 JSON. 오류 응답이면 RuntimeError"""
+    if server.startswith("unix:"):
+        conn = _UnixHTTPConnection(server[len("unix:"):], timeout)
+    else:
+        u = urlsplit(server)
+        conn = http.client.HTTPConnection(u.hostname or DEFAULT_HOST, u.port or DEFAULT_PORT, timeout=timeout)
+    try:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else None
+        conn.request(method, path, body=body, headers={"Content-Type": "application/json"})
+        resp = conn.getresponse()
+        data = json.loads(resp.read().decode("utf-8") or "{}")
+    except (OSError, http.client.HTTPException) as e:
+        raise RuntimeError(f"❌ 심사 서비스에 연결할 수 없음 ({server}): {e}") from e
+    finally:
+        conn.close()
+    if resp.status >= 400:
+        raise RuntimeError(data.get("error") or f"❌ 심사 서비스 오류: HTTP {resp.status}")
+    return data
+
+def submit_job(csv_path: str, out_xlsx: Optional[str] = None, server: str = DEFAULT_SERVER, **options) -> dict:
+    """
+    작업 제출 → 작업 정보 (id / status ...). options: JOB_OPTIONS
+    out_xlsx: 서비스 --out-dir 기준 경로 (생략 시 서비스가 정함 / 실제 경로는 작업 정보의 out_xlsx)
+    """
+    payload = dict(options, csv_path=os.path.abspath(csv_path))
+    if out_xlsx:
+        payload["out_xlsx"] = out_xlsx
+    return request(server, "POST", "/jobs", payload)
+
+def get_job(job_id: str, server: str = DEFAULT_SERVER) -> dict:
+    return request(server, "GET", f"/jobs/{job_id}")
+
+def cancel_job(job_id: str, server: str = DEFAULT_SERVER) -> dict:
+    return request(server, "DELETE", f"/jobs/{job_id}")
+
+def wait_job(job_id: str, server: str = DEFAULT_SERVER, poll_sec: float = 0.5, on_progress=None) -> dict:
+    """작업이 끝날 때까지 기다림 → 마지막 작업 정보. on_progress(작업 정보) 는 확인할 때마다 호출"""
+    while True:
+        job = get_job(job_id, server)
+        if on_progress is not None:
+            on_progress(job)
+        if job["status"] in FINISHED:
+            return job
+        time.sleep(poll_sec)
+
+def is_loopback(host: str) -> bool:
+    """host 가 가리키는 주소가 모두 루프백인지 ("" / 0.0.0.0 = 모든 인터페이스 → False)"""
+    if not host:
+        return False
+    try:
+        infos = socket.getaddrinfo(host, None)
+    except socket.gaierror:
+        return False
+    return all(ipaddress.ip_address(info[4][0].split("%")[0]).is_loopback for info in infos)
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="filter_server", description="求人CSV 審査サービス (常駐)")
+    ap.add_argument("--host", default=DEFAULT_HOST, help="접속을 받을 주소 (기본: localhost 만)")
+    ap.add_argument("--allow-remote", action="store_true",
+                    help="루프백이 아닌 --host 허용 (인증 없음: 접속한 누구나 서비스 권한으로 CSV 를 읽고 --out-dir 에 쓸 수 있음)")
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    ap.add_argument("--unix", default=None, help="Unix 소켓 경로 (지정하면 --host/--port 대신 사용)")
+    ap.add_argument("-j", "--jobs", type=int, default=1, help="동시에 실행할 작업 수")
+    ap.add_argument("-o", "--out-dir", default=None, help="결과 저장 폴더 (out_xlsx 는 이 안만 허용 / 기본: 현재 폴더)")
+    args = ap.parse_args(argv)
+
+    if args.jobs < 1:
+        ap.error(f"--jobs 는 1 이상이어야 함: {args.jobs}")
+    if args.unix is None and not is_loopback(args.host):
+        if not args.allow_remote:
+            ap.error(f"--host {args.host} 는 루프백 주소가 아님 (인증 없이 CSV 경로를 받으므로 --allow-remote 를 명시해야 함)")
+        print(f"⚠️ {args.host} で待ち受け: 認証なし・接続元はサービスの権限で任意の CSV を読み取り可能", file=sys.stderr)
+    if args.out_dir:
+        os.makedirs(args.out_dir, exist_ok=True)
+    service = ScreeningService(args.jobs, args.out_dir, args.allow_remote)
+    key = service.warm_up()
+    ready = lambda address: print(f"✅ 審査サービス起動: {address} (jobs={args.jobs}, rules={key})", file=sys.stderr)
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.unix, ready))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
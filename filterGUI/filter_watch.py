@@ -0,0 +1,353 @@
+# filter_watch.py
+# -*- coding: utf-8 -*-
+"""
+filter_watch.py - 감시 폴더 자동 심사 (Downloads 등에 떨어진 CSV 를 바로 판정)
+
+사용법:
+    python -m filter_watch                       # ~/Downloads 감시 (JobMasterList_*.csv / 審査データ_*.csv)
+    python -m filter_watch D:/exports --jobs 2 --layout single
+    python -m filter_watch D:/exports --once     # 지금 있는 파일만 처리하고 종료 (작업 스케줄러용)
+                                                 # → --once-timeout 초 안에 처리하지 못한 파일이 있으면 종료 코드 1
+
+- 파일 변경 감지: watchdog 설치 시 OS 이벤트(inotify / ReadDirectoryChangesW 등), 없으면 폴더를 주기적으로 스캔
+  (pip install watchdog 은 선택. 이벤트 방식이어도 시작 시 한 번은 전체 스캔 → 꺼져 있던 동안 들어온 파일도 처리)
+- 쓰는 중인 파일은 건너뜀: 크기 / 수정 시각이 settle 초 동안 바뀌지 않고 읽기로 열 수 있을 때 판정 시작
+- 결과: 입력 파일과 같은 폴더에 Filtered_list_<입력 파일명>.xlsx
+- 동시에 판정하는 파일 수는 --jobs 개까지 (프로세스 풀)
+- 처리한 파일은 상태 파일(WATCH_STATE_JSON)에 (크기, 수정 시각)과 함께 기록
+  → 재시작해도 같은 파일은 다시 판정하지 않음. 같은 이름으로 내용이 바뀌면 다시 판정. 실패한 파일도 바뀔 때까지 재시도 안 함
+  - 판정 결과가 없는 파일(종료 시 취소 / 워커 프로세스 강제 종료)은 기록하지 않음 → 다시 대기열에 넣고 재시작 시에도 다시 판정
+  - 단, 워커가 같은 파일(같은 크기 / 수정 시각)에서 --max-attempts 번 이상 죽으면 실패로 기록 (메모리 부족 / 라이브러리 크래시 등)
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Optional
+
+from filter_cli import screen_file
+from filter_core_v2 import CACHE_DIR, LOAD_MODES, REASON_LANGS, RESULTS_DB, SCREEN_ENGINES, VERDICT_CACHE_DB
+from result_writer import LAYOUTS, WRITER_BACKENDS
+
+WATCH_PATTERNS = ["JobMasterList_*.csv", "審査データ_*.csv"]
+WATCH_STATE_JSON = os.path.join(CACHE_DIR, "watch_state.json")
+OUTPUT_PREFIX = "Filtered_list_"
+SETTLE_SEC = 5.0      # 크기/수정 시각이 이 시간 동안 그대로면 다 쓰인 것으로 봄
+POLL_SEC = 2.0        # 확인 주기 (폴링 방식의 스캔 주기)
+MAX_ATTEMPTS = 3      # 워커가 이 횟수만큼 죽은 파일은 실패로 기록
+ONCE_TIMEOUT_SEC = 300.0    # --once: 이 시간이 지나도 대기 중(쓰는 중 / 열 수 없음)인 파일은 포기
+
+def output_path(csv_path: str) -> str:
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return os.path.join(os.path.dirname(csv_path), f"{OUTPUT_PREFIX}{stem}.xlsx")
+
+def file_stamp(path: str) -> Optional[list]:
+    """(크기, 수정 시각 ns). 파일이 없으면 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+def can_open(path: str) -> bool:
+    # Windows 에서는 다른 프로세스가 쓰는 중이면 열 수 없음
+    try:
+        with open(path, "rb"):
+            return True
+    except OSError:
+        return False
+
+# ============================================================
+# [처리 기록] 재시작해도 같은 파일을 다시 판정하지 않도록
+# ============================================================
+class WatchState:
+    def __init__(self, path: str = WATCH_STATE_JSON):
+        self.path = path
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def processed(self, csv_path: str, stamp: list) -> bool:
+        entry = self.entries.get(os.path.abspath(csv_path))
+        return entry is not None and entry["stamp"] == stamp
+
+    def record(self, csv_path: str, stamp: list, result: dict):
+        self.entries[os.path.abspath(csv_path)] = {
+            "stamp": stamp,
+            "output": result.get("output"),
+            "ok": result.get("ok"),
+            "error": result.get("error"),
+            "rows": result.get("rows"),
+            "finished": datetime.now().isoformat(timespec="seconds"),
+        }
+        self._save()
+
+    def _save(self):
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.path)
+
+# ============================================================
+# [변경 감지] watchdog 이 있으면 OS 이벤트, 없으면 None (→ 폴링)
+# ============================================================
+def start_event_source(folder: str, on_path):
+    """folder 의 파일 생성/변경/이동 이벤트마다 on_path(경로) 호출 → observer (watchdog 미설치 시 None)"""
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            if event.is_directory:
+                return
+            for path in (getattr(event, "dest_path", None), event.src_path):
+                if path:
+                    on_path(os.fsdecode(path))
+
+    observer = Observer()
+    observer.schedule(Handler(), folder, recursive=False)
+    observer.start()
+    return observer
+
+# ============================================================
+# [감시 루프]
+# ============================================================
+class FolderWatcher:
+    def __init__(self, folder: str, patterns=WATCH_PATTERNS, jobs: int = 1, options: Optional[dict] = None,
+                 state: Optional[WatchState] = None, settle_sec: float = SETTLE_SEC, poll_sec: float = POLL_SEC,
+                 use_events: bool = True, on_result=None, log=None, max_attempts: int = MAX_ATTEMPTS,
+                 once_timeout: float = ONCE_TIMEOUT_SEC):
+        """
+        options: run_filter 인자 (layout / slim / lang 등)
+        max_attempts: 워커 이상 종료로 판정이 중단된 파일을 다시 시도하는 최대 횟수 (넘으면 실패로 기록)
+        once_timeout: run(once=True) 에서 대기 중인 파일을 기다리는 최대 시간(초)
+        on_result(요약): 파일 하나의 판정이 끝날 때마다 호출 (filter_cli.screen_file 요약)
+        log(문자열): 상태 메시지
+        """
+        if jobs < 1:
+            raise ValueError(f"❌ jobs 는 1 이상이어야 함: {jobs}")
+        if max_attempts < 1:
+            raise ValueError(f"❌ max_attempts 는 1 이상이어야 함: {max_attempts}")
+        if not os.path.isdir(folder):
+            raise FileNotFoundError(f"❌ 감시 폴더 없음: {folder}")
+        self.folder = os.path.abspath(folder)
+        self.patterns = list(patterns)
+        self.jobs = jobs
+        self.options = dict(options or {})
+        self.state = state or WatchState()
+        self.settle_sec = settle_sec
+        self.poll_sec = poll_sec
+        self.use_events = use_events
+        self.on_result = on_result
+        self.log = log or (lambda msg: None)
+        self.max_attempts = max_attempts
+        self.once_timeout = once_timeout
+
+        self.pending = {}        # 경로 → [stamp, stamp 가 처음 관측된 시각]
+        self.running = {}        # 경로 → (future, stamp)
+        self.attempts = {}       # (경로, stamp) → 워커 이상 종료로 중단된 횟수
+        self.events = set()      # 이벤트로 들어온 경로 (이벤트 스레드 → 감시 루프)
+        self.events_lock = threading.Lock()
+
+    def matches(self, path: str) -> bool:
+        name = os.path.basename(path)
+        return (os.path.dirname(os.path.abspath(path)) == self.folder
+                and not name.startswith(OUTPUT_PREFIX)
+                and any(fnmatch.fnmatch(name, p) for p in self.patterns))
+
+    def scan(self) -> list:
+        with os.scandir(self.folder) as it:
+            return [e.path for e in it if e.is_file() and self.matches(e.path)]
+
+    def _on_event(self, path: str):
+        if self.matches(path):
+            with self.events_lock:
+                self.events.add(os.path.abspath(path))
+
+    def _take_events(self) -> list:
+        with self.events_lock:
+            paths, self.events = list(self.events), set()
+        return paths
+
+    def _observe(self, paths, now: float):
+        """후보 경로를 pending 에 등록 / 갱신 (처리 기록과 같으면 무시)"""
+        for path in paths:
+            path = os.path.abspath(path)
+            stamp = file_stamp(path)
+            if stamp is None or path in self.running or self.state.processed(path, stamp):
+                self.pending.pop(path, None)
+                continue
+            seen = self.pending.get(path)
+            if seen is None or seen[0] != stamp:
+                self.pending[path] = [stamp, now]    # 새 파일 / 아직 쓰는 중 → 시각 다시 잼
+
+    def _ready(self, now: float) -> list:
+        """settle 초 동안 바뀌지 않았고 열 수 있는 파일"""
+        ready = []
+        for path, (stamp, since) in list(self.pending.items()):
+            if now - since < self.settle_sec:
+                continue
+            current = file_stamp(path)
+            if current is None:
+                del self.pending[path]
+            elif current != stamp:
+                self.pending[path] = [current, now]
+            elif can_open(path):
+                ready.append((path, stamp))
+        return ready
+
+    def _collect(self) -> bool:
+        """끝난 작업의 결과를 기록 → 워커 풀이 깨졌으면 True"""
+        broken = False
+        for path, (future, stamp) in list(self.running.items()):
+            if not future.done():
+                continue
+            del self.running[path]
+            if future.cancelled():
+                self.pending[path] = [stamp, time.monotonic()]
+                continue
+            try:
+                result = future.result()
+            except Exception as e:
+                # screen_file 은 판정 실패를 요약으로 돌려줌 → 여기 오는 것은 워커 프로세스 이상 종료 등
+                # 판정 결과가 아니므로 기록하지 않고 대기열로 되돌림 (max_attempts 번째면 실패로 기록)
+                broken |= isinstance(e, BrokenProcessPool)
+                key = (path, tuple(stamp))
+                self.attempts[key] = self.attempts.get(key, 0) + 1
+                if self.attempts[key] < self.max_attempts:
+                    self.pending[path] = [stamp, time.monotonic()]
+                    self.log(f"⚠️ {os.path.basename(path)} 審査中断 ({type(e).__name__}) → 再試行待ち "
+                             f"({self.attempts[key]}/{self.max_attempts})")
+                    continue
+                result = {"input": path, "output": None, "ok": False, "rows": None, "ng": None, "check": None,
+                          "error": f"❌ 審査中断 {self.attempts[key]}回 → 失敗として記録 ({type(e).__name__}: {e})"}
+            self.attempts.pop((path, tuple(stamp)), None)
+            self.state.record(path, stamp, result)
+            if result["ok"]:
+                self.log(f"✅ {os.path.basename(path)} → {os.path.basename(result['output'])} "
+                         f"({result['rows']}行 NG={result['ng']} 要確認={result['check']})")
+            else:
+                self.log(f"{result['error']} ({path})")
+            if self.on_result is not None:
+                self.on_result(result)
+        return broken
+
+    def run(self, stop_event: Optional[threading.Event] = None, once: bool = False) -> list:
+        """
+        stop_event 가 set() 될 때까지 감시 (once=True 면 지금 있는 파일을 모두 처리한 뒤 종료)
+        → once=True 에서 once_timeout 초가 지나도 판정을 시작하지 못해 포기한 파일 목록 (기록하지 않음)
+        """
+        stop_event = stop_event or threading.Event()
+        started = time.monotonic()
+        abandoned = []
+        observer = start_event_source(self.folder, self._on_event) if self.use_events and not once else None
+        self.log(f"👀 {self.folder} を監視中 ({'イベント' if observer else 'ポーリング'}, "
+                 f"{', '.join(self.patterns)})")
+        executor = ProcessPoolExecutor(max_workers=self.jobs)
+        last_scan = None
+        try:
+            while True:
+                now = time.monotonic()
+                if observer is None:
+                    if last_scan is None or now - last_scan >= self.poll_sec:
+                        self._observe(self.scan(), now)
+                        last_scan = now
+                else:
+                    if last_scan is None:
+                        self._observe(self.scan(), now)     # 시작 시 한 번
+                        last_scan = now
+                    self._observe(self._take_events(), now)
+                    self._observe(list(self.pending), now)   # 이벤트 이후 변화 확인
+
+                for path, stamp in self._ready(now):
+                    if len(self.running) >= self.jobs:
+                        break
+                    del self.pending[path]
+                    self.log(f"⏳ {os.path.basename(path)} 審査開始")
+                    future = executor.submit(screen_file, path, output_path(path), self.options)
+                    self.running[path] = (future, stamp)
+                if self._collect():
+                    # 깨진 풀에는 더 제출할 수 없음 → 새로 만듦
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    executor = ProcessPoolExecutor(max_workers=self.jobs)
+
+                if once and self.pending and time.monotonic() - started >= self.once_timeout:
+                    # 계속 쓰는 중 / 열 수 없는 파일 때문에 끝나지 않는 것을 막음
+                    for path in sorted(self.pending):
+                        self.log(f"⚠️ {os.path.basename(path)} {self.once_timeout:g}秒以内に審査を開始できず → 未処理")
+                    abandoned.extend(sorted(self.pending))
+                    self.pending.clear()
+                if once and not self.pending and not self.running:
+                    break
+                if stop_event.wait(min(self.poll_sec, 0.5)):
+                    break
+        finally:
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._collect()
+        return abandoned
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(prog="filter_watch", description="監視フォルダの求人CSVを自動審査")
+    ap.add_argument("folder", nargs="?", default=os.path.join(os.path.expanduser("~"), "Downloads"),
+                    help="감시 폴더 (기본: Downloads)")
+    ap.add_argument("--pattern", action="append", default=None,
+                    help=f"대상 파일명 패턴 (여러 번 지정 가능 / 기본: {' '.join(WATCH_PATTERNS)})")
+    ap.add_argument("-j", "--jobs", type=int, default=1, help="동시에 판정할 파일 수")
+    ap.add_argument("--settle", type=float, default=SETTLE_SEC, help="파일이 다 쓰인 것으로 볼 때까지 기다리는 시간(초)")
+    ap.add_argument("--poll", type=float, default=POLL_SEC, help="확인 주기(초)")
+    ap.add_argument("--polling", action="store_true", help="watchdog 이 있어도 폴링 방식 사용")
+    ap.add_argument("--once", action="store_true", help="지금 있는 파일만 처리하고 종료")
+    ap.add_argument("--once-timeout", type=float, default=ONCE_TIMEOUT_SEC,
+                    help="--once 에서 쓰는 중 / 열 수 없는 파일을 기다리는 최대 시간(초). 넘으면 포기하고 종료 코드 1")
+    ap.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS,
+                    help="워커가 이상 종료된 파일을 다시 시도하는 최대 횟수 (넘으면 실패로 기록)")
+    ap.add_argument("--state", default=WATCH_STATE_JSON, help="처리 기록 파일")
+    ap.add_argument("--engine", default="columnar", choices=list(SCREEN_ENGINES))
+    ap.add_argument("--writer", default="stream", choices=list(WRITER_BACKENDS))
+    ap.add_argument("--layout", default="sheets", choices=LAYOUTS)
+    ap.add_argument("--slim", action="store_true", help="디버그용 컬럼 제외")
+    ap.add_argument("--lang", default="jp", choices=list(REASON_LANGS), help="理由(要約) 표시 언어")
+    ap.add_argument("--load", default="infer", choices=list(LOAD_MODES))
+    ap.add_argument("--verdict-cache", nargs="?", const=VERDICT_CACHE_DB, default=None,
+                    help="판정 캐시 사용 (경로 생략 시 기본 위치)")
+    ap.add_argument("--results-db", nargs="?", const=RESULTS_DB, default=None,
+                    help="판정 결과를 결과 DB 에 기록 (경로 생략 시 기본 위치)")
+    args = ap.parse_args(argv)
+
+    if args.jobs < 1:
+        ap.error(f"--jobs 는 1 이상이어야 함: {args.jobs}")
+    if args.max_attempts < 1:
+        ap.error(f"--max-attempts 는 1 이상이어야 함: {args.max_attempts}")
+    options = dict(engine=args.engine, writer=args.writer, layout=args.layout, slim=args.slim, lang=args.lang,
+                   load=args.load, verdict_cache=args.verdict_cache,
+                   results_db=args.results_db)
+    log = lambda msg: print(f"[{datetime.now():%H:%M:%S}] {msg}", file=sys.stderr, flush=True)
+    watcher = FolderWatcher(args.folder, args.pattern or WATCH_PATTERNS, args.jobs, options,
+                            WatchState(args.state), args.settle, args.poll, not args.polling, log=log,
+                            max_attempts=args.max_attempts, once_timeout=args.once_timeout)
+    try:
+        abandoned = watcher.run(once=args.once)
+    except KeyboardInterrupt:
+        return 0
+    return 1 if abandoned else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
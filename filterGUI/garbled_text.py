@@ -0,0 +1,100 @@
+# garbled_text.py
+# -*- coding: utf-8 -*-
+"""
+garbled_text.py - 문자 깨짐(文字化け) 검출 (표 기반)
+
+- 문자 표(GARBLED_CHAR_TABLE)의 모든 문자를 하나의 문자 클래스로 컴파일 → 값마다 정규식 스캔 1번
+  - "direct"  : 정상적인 일본어 텍스트에 나오지 않는 문자 (U+FFFD / 제어문자 / C1 제어문자 / 사용자 정의 영역)
+                → 나오면 바로 깨짐으로 판정
+  - "suspect" : 잘못된 인코딩으로 읽었을 때 자주 나오는 문자
+                (UTF-8 을 cp932 로 읽은 경우의 첫 글자 / UTF-8 을 Latin-1·cp1252 로 읽은 경우의 첫 글자)
+                → 왕복 변환(cp932 등으로 다시 인코딩 → UTF-8 디코드)으로 일본어가 복원될 때만 깨짐으로 판정
+- 컬럼 단위: 여러 컬럼의 서로 다른 값을 하나로 모아 한 번에 스캔 (같은 값은 컬럼이 달라도 한 번만)
+- 市区町村 은 CITY_GARBLED_CHAR_TABLE (기본 표 + 지명 전용 문자) 로 만든 검출기를 따로 씀
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+# UTF-8 일본어(3바이트: 선두 E3~E9 / 전각 기호 EF)를 잘못 읽었을 때 첫 글자가 되는 문자
+_UTF8_LEADS = [*range(0xE3, 0xEA), 0xEF]
+
+def _misread_as_cp932() -> str:
+    """UTF-8 선두 바이트 + 후속 바이트(80~BF) 를 cp932 2바이트 문자로 읽은 결과 (例: 縺, 繧, 譁)"""
+    chars = []
+    for lead in _UTF8_LEADS:
+        for trail in range(0x80, 0xC0):
+            try:
+                chars.append(bytes([lead, trail]).decode("cp932"))
+            except UnicodeDecodeError:
+                pass
+    return "".join(chars)
+
+GARBLED_CHAR_TABLE = {
+    # 분류: (종류, 문자 클래스 내용)
+    "置換文字": ("direct", "\ufffd"),
+    "制御文字": ("direct", "\x00-\x08\x0b\x0c\x0e-\x1f\x7f"),
+    "C1制御文字": ("direct", "\x80-\x9f"),
+    "外字(私用領域)": ("direct", "\ue000-\uf8ff"),
+    "UTF-8→cp932誤読": ("suspect", re.escape(_misread_as_cp932())),
+    "UTF-8→Latin-1誤読": ("suspect", "".join(re.escape(bytes([b]).decode("latin-1")) for b in _UTF8_LEADS)),
+}
+# 市区町村 전용: 짧은 지명에는 나오지 않는 문자 → 왕복 변환 없이 바로 깨짐 (기존 市区町村 규칙을 표로 옮김)
+# 闖 / 驥 는 UTF-8 을 cp932 로 읽었을 때의 첫 글자 (다른 컬럼에서는 suspect), 伴 / 반각 공백은 깨진 지명에서 자주 보이는 문자
+CITY_GARBLED_CHAR_TABLE = dict(GARBLED_CHAR_TABLE, **{
+    "市区町村の空白・誤読漢字": ("direct", " 闖驥伴"),
+})
+ROUNDTRIP_ENCODINGS = ["cp932", "cp1252", "latin-1"]   # 잘못 읽었을 가능성이 있는 인코딩 (왕복 변환 순서)
+JP_TEXT_RE = re.compile(r"[ぁ-ヿ一-鿿]")                  # 복원 결과에 가나/한자가 있어야 깨짐으로 인정
+NON_ASCII_RUN_RE = re.compile(r"[^\x00-\x7f]+")          # 왕복 변환 단위 (깨진 부분은 ASCII 를 포함하지 않음)
+
+class GarbledTextDetector:
+    def __init__(self, table: dict = GARBLED_CHAR_TABLE, encodings=ROUNDTRIP_ENCODINGS):
+        self.table = dict(table)
+        self.encodings = list(encodings)
+        direct = "".join(chars for kind, chars in self.table.values() if kind == "direct")
+        suspect = "".join(chars for kind, chars in self.table.values() if kind == "suspect")
+        self.direct_re = re.compile(f"[{direct}]")
+        self.scan_re = re.compile(f"[{direct}{suspect}]")   # 1차 스캔 (direct + suspect 한 번에)
+
+    def roundtrip(self, s: str) -> bool:
+        """
+        s 를 잘못 읽은 텍스트로 보고 원래 바이트로 되돌렸을 때 UTF-8 일본어가 되는지.
+        정상 텍스트와 섞인 경우(例: "株式会社 譬ｪ蠑丈ｼ夂､ｾ")도 잡도록 비ASCII 구간마다 확인
+        """
+        return any(self._roundtrip_run(run) for run in NON_ASCII_RUN_RE.findall(s) if self.scan_re.search(run))
+
+    def _roundtrip_run(self, s: str) -> bool:
+        for enc in self.encodings:
+            try:
+                fixed = s.encode(enc).decode("utf-8")
+            except UnicodeError:
+                continue
+            if fixed != s and JP_TEXT_RE.search(fixed):
+                return True
+        return False
+
+    def is_garbled(self, s: str) -> bool:
+        if not isinstance(s, str) or not self.scan_re.search(s):
+            return False
+        return self.direct_re.search(s) is not None or self.roundtrip(s)
+
+    def garbled_col(self, s: pd.Series) -> np.ndarray:
+        """is_garbled 의 컬럼 버전 (s 는 문자열 object Series). 1차 스캔에 걸린 값만 다시 확인"""
+        out = np.array(s.str.contains(self.scan_re), dtype=bool)
+        hit = np.flatnonzero(out)
+        out[hit] = [self.is_garbled(v) for v in s.to_numpy()[hit]]
+        return out
+
+    def garbled_values(self, values) -> dict:
+        """
+        여러 컬럼의 서로 다른 값 목록 {컬럼: 값 배열} → {컬럼: 값별 깨짐 여부 배열}.
+        모든 컬럼의 값을 합쳐 중복을 없앤 뒤 한 번만 스캔
+        """
+        values = {c: np.asarray(v, dtype=object) for c, v in values.items()}
+        pooled = pd.unique(np.concatenate(list(values.values()))) if values else np.array([], dtype=object)
+        flags = self.garbled_col(pd.Series(pooled, dtype=object))
+        index = pd.Index(pooled)
+        return {c: flags[index.get_indexer(v)] for c, v in values.items()}
@@ -4,12 +4,37 @@
 # 현재 filter_core_v2.py 모듈을 사용하는 GUI 애플리케이션
 
 import os
-from datetime import datetime
+import queue
+import threading
+from datetime import date, datetime
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, ttk
 import subprocess
-
-from filter_core_v2 import run_filter, load_min_wage, save_min_wage
+import multiprocessing
+
+from filter_core_v2 import (run_filter, load_min_wage, save_min_wage, latest_min_wage_effective, FilterCancelled,
+                            VERDICT_CACHE_DB, INPUT_SNAPSHOT_DIR)
+from run_profiler import RunProfiler
+
+PHASE_LABELS = {"load": "読み込み中", "screen": "審査中", "write": "書き込み中", "save": "保存中"}
+POLL_MS = 100   # 작업 스레드 → 화면 갱신 주기
+
+def format_progress(p: dict) -> str:
+    """run_filter 진행 상황 dict → 상태 표시 문자열"""
+    text = PHASE_LABELS.get(p["phase"], "処理中") + "…"
+    if p["rows_done"]:
+        text += f" {p['rows_done']:,}"
+        if p["rows_total"]:
+            text += f"/{p['rows_total']:,}"
+        text += "行"
+        extra = []
+        if p["rows_per_sec"]:
+            extra.append(f"{p['rows_per_sec']:,.0f}行/秒")
+        if p["eta_sec"] is not None:
+            extra.append(f"残り約{int(p['eta_sec']) + 1}秒")
+        if extra:
+            text += f" ({', '.join(extra)})"
+    return text
 
 def default_output_path():
     downloads = os.path.join(os.path.expanduser("~"), "Downloads")
@@ -24,10 +49,16 @@ class App(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("求人審査ツール (Filtered Tool)")
-        self.geometry("560x260")
+        self.geometry("560x440")
         self.resizable(False, False)
 
         self.csv_path = tk.StringVar(value="")
+        self.measure = tk.BooleanVar(value=False)   # 処理時間の計測 (opt-in)
+        self.lang = tk.StringVar(value="jp")        # 理由(要約) の表示言語
+        self.compact = tk.BooleanVar(value=False)   # 軽量出力 (1シート + フィルタ / デバッグ列なし)
+        self.worker = None                  # 실행 중인 작업 스레드
+        self.cancel_event = threading.Event()
+        self.events = queue.Queue()         # 작업 스레드 → 메인 스레드 (Tk 는 메인 스레드에서만 조작)
 
         tk.Label(self, text="CSVファイルを選択してください:").pack(anchor="w", padx=12, pady=(12, 4))
 
@@ -42,12 +73,33 @@ class App(tk.Tk):
         self.run_btn = tk.Button(self, text="実行", command=self.run, height=2)
         self.run_btn.pack(fill="x", padx=12, pady=(16, 6))
 
+        self.cancel_btn = tk.Button(self, text="キャンセル", command=self.cancel, state="disabled")
+        self.cancel_btn.pack(fill="x", padx=12, pady=(0, 6))
+
         self.setting_btn = tk.Button(self, text="設定(最低賃金)", command=self.open_min_wage_editor)
         self.setting_btn.pack(fill="x", padx=12, pady=(0, 6))
 
+        tk.Checkbutton(self, text="処理時間を計測する（結果と同じフォルダにレポートを保存）",
+                       variable=self.measure).pack(anchor="w", padx=8)
+
+        tk.Checkbutton(self, text="軽量出力（全行は審査結果シートのみ＋フィルタ、確認用の列を省略）",
+                       variable=self.compact).pack(anchor="w", padx=8)
+
+        lang_frame = tk.Frame(self)
+        lang_frame.pack(anchor="w", padx=12)
+        tk.Label(lang_frame, text="理由の表示言語:").pack(side="left")
+        for value, label in (("jp", "日本語"), ("kr", "한국어")):
+            tk.Radiobutton(lang_frame, text=label, value=value, variable=self.lang).pack(side="left")
+
+        self.progress = ttk.Progressbar(self, mode="determinate", maximum=1.0)
+        self.progress.pack(fill="x", padx=12, pady=(4, 0))
+
         self.status = tk.Label(self, text="待機中", anchor="w")
         self.status.pack(fill="x", padx=12, pady=(4, 0))
 
+        self.detail = tk.Label(self, text="", anchor="w", fg="gray30")   # 계측 요약 (한 줄)
+        self.detail.pack(fill="x", padx=12)
+
     def pick_csv(self):
         path = filedialog.askopenfilename(
             title="CSVを選択",
@@ -64,33 +116,124 @@ class App(tk.Tk):
 
         out_xlsx = default_output_path()
 
+        self.run_btn.config(state="disabled")
+        self.cancel_btn.config(state="normal")
+        self.status.config(text="処理中…")
+        self.detail.config(text="")
+        self.progress.config(mode="indeterminate")
+        self.progress.start()
+        self.cancel_event.clear()
+
+        # 심사는 별도 스레드에서 실행 (창이 멈추지 않도록)
+        profiler = RunProfiler() if self.measure.get() else None
+        self.worker = threading.Thread(target=self._work, args=(csv_path, out_xlsx, profiler, self.lang.get(), self.compact.get()),
+                                       daemon=True)
+        self.worker.start()
+        self.after(POLL_MS, self._poll)
+
+    def _work(self, csv_path, out_xlsx, profiler, lang, compact):
+        # 작업 스레드: Tk 를 직접 건드리지 않고 결과를 큐로만 전달
         try:
-            self.run_btn.config(state="disabled")
-            self.status.config(text="処理中…")
-            self.update_idletasks()
-
-            result_path = run_filter(csv_path, out_xlsx)
+            stats = {}
+            result_path = run_filter(csv_path, out_xlsx, stats=stats,
+                                     progress=lambda p: self.events.put(("progress", p)),
+                                     cancel_event=self.cancel_event,
+                                     verdict_cache=VERDICT_CACHE_DB,
+                                     input_snapshot=INPUT_SNAPSHOT_DIR,
+                                     profile=profiler, lang=lang,
+                                     layout="single" if compact else "sheets", slim=compact)
+            if profiler is not None:
+                profiler.save(os.path.splitext(result_path)[0] + "_profile.json")
+                stats["profile_summary"] = profiler.summary()
+            self.events.put(("done", (result_path, stats)))
+        except FilterCancelled:
+            self.events.put(("cancelled", None))
+        except Exception as e:
+            self.events.put(("error", e))
+
+    def _poll(self):
+        finished = None
+        latest = None
+        while True:
+            try:
+                kind, value = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                latest = value
+            else:
+                finished = (kind, value)
+
+        if latest is not None and finished is None:
+            self._show_progress(latest)
+        if finished is None:
+            self.after(POLL_MS, self._poll)
+            return
 
-            self.status.config(text=f"完了: {result_path}")
+        self.worker = None
+        self.progress.stop()
+        self.progress.config(mode="determinate", value=0)
+        self.run_btn.config(state="normal")
+        self.cancel_btn.config(state="disabled")
+
+        kind, value = finished
+        if kind == "done":
+            result_path, stats = value
+            self.progress.config(value=1.0)
+            text = f"完了: {result_path}"
+            cache = stats.get("verdict_cache")
+            if cache:
+                text += f"（前回結果の再利用 {cache['hits']:,}行 / 新規審査 {cache['misses']:,}行）"
+            if stats.get("input_snapshot", {}).get("hit"):
+                text += "（CSV読み込み済みデータを再利用）"
+            self.status.config(text=text)
+            self.detail.config(text=stats.get("profile_summary", ""))
             if messagebox.askyesno("完了", "処理が完了しました。フォルダを開きますか？"):
                 open_folder(result_path)
-
-        except Exception as e:
-            messagebox.showerror("エラー", str(e))
+        elif kind == "cancelled":
+            self.status.config(text="キャンセルしました")
+        else:
+            messagebox.showerror("エラー", str(value))
             self.status.config(text="エラー発生")
 
-        finally:
-            self.run_btn.config(state="normal")
+    def _show_progress(self, p: dict):
+        if p["fraction"] is None:
+            if str(self.progress.cget("mode")) != "indeterminate":
+                self.progress.config(mode="indeterminate")
+                self.progress.start()
+        else:
+            if str(self.progress.cget("mode")) != "determinate":
+                self.progress.stop()
+                self.progress.config(mode="determinate")
+            self.progress.config(value=p["fraction"])
+        self.status.config(text=format_progress(p))
+
+    def cancel(self):
+        if self.worker is not None:
+            self.cancel_event.set()
+            self.cancel_btn.config(state="disabled")
+            self.status.config(text="キャンセル中…")
 
     def open_min_wage_editor(self):
-        data = load_min_wage()  # 현재 적용값(기본/저장값)
+        # 가장 최근 버전의 발효일 시점 값(기본/저장값). 발효일을 바꿔 저장하면 새 버전으로 추가
+        # (저장 시에는 고친 都道府県만 입력한 발효일 시점의 값 위에 적용 → save_min_wage(base=))
+        effective = latest_min_wage_effective()
+        data = load_min_wage(date.fromisoformat(effective))
 
         win = tk.Toplevel(self)
         win.title("最低賃金 設定")
-        win.geometry("420x520")
+        win.geometry("420x560")
 
         tk.Label(win, text="各都道府県の最低賃金(円/時)を編集して、保存してください。").pack(anchor="w", padx=10, pady=(10, 6))
-        tk.Label(win, text="形式: 都道府県=数字（例: 東京=1226）").pack(anchor="w", padx=10, pady=(0, 10))
+        tk.Label(win, text="形式: 都道府県=数字（例: 東京=1226）").pack(anchor="w", padx=10, pady=(0, 6))
+
+        eff_frame = tk.Frame(win)
+        eff_frame.pack(fill="x", padx=10)
+        tk.Label(eff_frame, text="発効日 (YYYY-MM-DD):").pack(side="left")
+        eff_var = tk.StringVar(value=effective)
+        tk.Entry(eff_frame, textvariable=eff_var, width=12).pack(side="left", padx=(6, 0))
+        tk.Label(win, text="※ 新しい発効日で保存すると、掲載開始日がその日以降の求人にだけ適用されます。",
+                 fg="gray30").pack(anchor="w", padx=10, pady=(4, 0))
 
         txt = tk.Text(win, height=25)
         txt.pack(fill="both", expand=True, padx=10, pady=10)
@@ -100,6 +243,13 @@ class App(tk.Tk):
         txt.insert("1.0", "\n".join(lines))
 
         def on_save():
+            eff = eff_var.get().strip()
+            try:
+                date.fromisoformat(eff)
+            except ValueError:
+                messagebox.showerror("エラー", f"発効日の形式が不正です: {eff}\n例: 2026-10-01")
+                return
+
             raw_lines = txt.get("1.0", "end").strip().splitlines()
             new_map = dict(data)
 
@@ -126,11 +276,13 @@ class App(tk.Tk):
                     messagebox.showerror("エラー", f"数値が不正です: {pref}={val}")
                     return
 
-            path = save_min_wage(new_map)
+            path = save_min_wage(new_map, eff, base=data)
             messagebox.showinfo("保存完了", f"保存しました。\n次回以降も反映されます。\n保存先: {path}")
             win.destroy()
 
         tk.Button(win, text="保存", command=on_save, height=2).pack(fill="x", padx=10, pady=(0, 10))
 
 if __name__ == "__main__":
+    # exe(PyInstaller) 에서 run_filter(workers=N) 프로세스 풀 사용 시 필요
+    multiprocessing.freeze_support()
     App().mainloop()
@@ -0,0 +1,207 @@
+# input_snapshot.py
+# -*- coding: utf-8 -*-
+"""
+input_snapshot.py - 읽어 들인 CSV 의 컬럼 스냅샷 캐시
+
+같은 CSV 를 (최저임금 설정만 바꿔서) 다시 실행할 때 인코딩 판별 / read_csv 를 건너뛰기 위한 캐시.
+- 키: (CSV 절대 경로, 파일 크기, 수정 시각, 내용 해시, 로드 방식)
+  → 파일 내용이 바뀌면 항상 미스 (수정 시각을 되돌려도 내용 해시로 구분)
+- 형식
+  - "arrow"  : Arrow IPC 파일 (pip install pyarrow 필요). 읽을 때 메모리 맵으로 열어서 복사 없이 컬럼을 로드
+  - "pickle" : pyarrow 가 없을 때. DataFrame 을 그대로 저장 (파싱/타입 추론은 건너뜀)
+- 폴더 전체 크기 상한(max_bytes)을 넘으면 가장 오래 안 쓰인 스냅샷부터 삭제 (LRU)
+- 항목 정보는 스냅샷마다 옆에 두는 <키>.json 에 기록 (파일명 / 크기 / 인코딩 등. 마지막 사용 시각 = 이 파일의 수정 시각)
+  → 여러 실행(GUI / CLI / 서비스 / 감시)이 같은 폴더를 써도 공유 목록을 덮어쓰지 않음.
+  쓰기는 임시 파일 + os.replace, 정리는 매번 폴더를 다시 읽어서 판단 (다른 실행이 지운 파일은 무시)
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+import uuid
+from typing import Optional, Tuple
+
+import pandas as pd
+
+SNAPSHOT_VERSION = 1                      # 저장 형식을 바꾸면 올릴 것 (이전 스냅샷은 키가 달라져 자연히 삭제됨)
+SNAPSHOT_MAX_BYTES = 2 * 1024 ** 3        # 폴더 전체 크기 상한 (2GB)
+HASH_BLOCK_BYTES = 4 * 1024 * 1024        # 내용 해시 계산 시 한 번에 읽는 크기
+ORPHAN_GRACE_SEC = 3600                   # 항목 정보 없는 스냅샷 / 임시 파일을 지우기까지의 유예 (저장 중인 파일 보호)
+ENTRY_EXT = ".json"
+LEGACY_INDEX_FILE = "index.json"          # 이전 버전의 공유 목록 (열 때 삭제)
+_CACHE_FILE_RE = re.compile(r"[0-9a-f]{32}\.")
+
+def file_digest(path: str) -> str:
+    """파일 내용 해시 (blake2b 128bit)"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_BYTES), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def _arrow():
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError:
+        return None
+
+def _unlink(path: str):
+    # 다른 실행이 먼저 지웠거나 사용 중(Windows 의 메모리 맵)이면 건너뜀 → 다음 정리 때 다시 시도
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def _tmp_path(path: str) -> str:
+    return f"{path}.{uuid.uuid4().hex[:8]}.tmp"   # 같은 키를 동시에 저장해도 임시 파일이 겹치지 않음
+
+class InputSnapshotCache:
+    def __init__(self, folder: str, max_bytes: int = SNAPSHOT_MAX_BYTES):
+        os.makedirs(folder, exist_ok=True)
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.format = "arrow" if _arrow() is not None else "pickle"
+        _unlink(os.path.join(folder, LEGACY_INDEX_FILE))
+
+    # --------------------------------------------------------
+    # 항목 정보 (<키>.json)
+    # --------------------------------------------------------
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.folder, key + ENTRY_EXT)
+
+    def _read_entry(self, key: str) -> Optional[dict]:
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_entry(self, key: str, entry: dict):
+        path = self._entry_path(key)
+        tmp = _tmp_path(path)
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False, indent=1)
+            os.replace(tmp, path)
+        except OSError:
+            _unlink(tmp)
+            raise
+
+    def entries(self) -> dict:
+        """키 → 항목 정보 (last_used 포함). 호출할 때마다 폴더를 다시 읽음"""
+        found = {}
+        for name in os.listdir(self.folder):
+            key, ext = os.path.splitext(name)
+            if ext != ENTRY_EXT or not _CACHE_FILE_RE.match(name):
+                continue
+            entry = self._read_entry(key)
+            try:
+                last_used = os.path.getmtime(self._entry_path(key))
+            except OSError:
+                continue
+            if entry is not None:
+                found[key] = dict(entry, last_used=last_used)
+        return found
+
+    def key(self, csv_path: str, load: str) -> str:
+        st = os.stat(csv_path)
+        raw = json.dumps([SNAPSHOT_VERSION, self.format, os.path.abspath(csv_path), st.st_size, st.st_mtime_ns,
+                          file_digest(csv_path), load], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+    # --------------------------------------------------------
+    # 조회 / 저장
+    # --------------------------------------------------------
+    def get(self, key: str) -> Optional[Tuple[pd.DataFrame, dict]]:
+        """스냅샷이 있으면 (DataFrame, 항목 정보), 없거나 읽을 수 없으면 None"""
+        entry = self._read_entry(key)
+        if entry is None:
+            return None
+        path = os.path.join(self.folder, entry["file"])
+        try:
+            df = self._load(path, entry["format"])
+        except Exception:
+            self._remove(key, entry)        # 깨진 스냅샷(또는 다른 실행이 방금 지움) → 지우고 다시 파싱
+            return None
+        try:
+            os.utime(self._entry_path(key))  # 마지막 사용 시각 갱신
+        except OSError:
+            pass
+        return df, entry
+
+    def put(self, key: str, df: pd.DataFrame, **info) -> Optional[dict]:
+        """df 를 스냅샷으로 저장 (info: encoding 등 함께 기록할 값). 저장하지 못하면 None"""
+        name = f"{key}.{self.format}"
+        path = os.path.join(self.folder, name)
+        tmp = _tmp_path(path)
+        try:
+            self._save(df, tmp)
+            os.replace(tmp, path)
+        except Exception:
+            _unlink(tmp)
+            return None
+        size = os.path.getsize(path)
+        if size > self.max_bytes:
+            _unlink(path)
+            return None
+        # 스냅샷 → 항목 정보 순으로 기록 (항목 정보가 있으면 스냅샷은 항상 완성본)
+        entry = dict(info, file=name, format=self.format, bytes=size)
+        try:
+            self._write_entry(key, entry)
+        except OSError:
+            _unlink(path)
+            return None
+        self._evict(keep=key)
+        return entry
+
+    def _evict(self, keep: str):
+        """전체 크기가 상한을 넘으면 마지막 사용 시각이 오래된 것부터 삭제 + 오래된 고아 파일 정리"""
+        entries = self.entries()
+        total = sum(e["bytes"] for e in entries.values())
+        for k in sorted(entries, key=lambda k: entries[k]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if k != keep:
+                total -= entries[k]["bytes"]
+                self._remove(k, entries[k])
+
+        # 항목 정보가 없는 스냅샷 / 남은 임시 파일 (저장 중 강제 종료 등). 저장 중일 수 있는 새 파일은 남김
+        live = {e["file"] for e in entries.values()}
+        cutoff = time.time() - ORPHAN_GRACE_SEC
+        for name in os.listdir(self.folder):
+            if not _CACHE_FILE_RE.match(name) or name in live or name.endswith(ENTRY_EXT):
+                continue
+            path = os.path.join(self.folder, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    _unlink(path)
+            except OSError:
+                pass
+
+    def _remove(self, key: str, entry: dict):
+        # 항목 정보를 먼저 지움 → 다른 실행은 스냅샷이 지워지는 도중의 항목을 보지 않음
+        _unlink(self._entry_path(key))
+        _unlink(os.path.join(self.folder, entry["file"]))
+
+    # --------------------------------------------------------
+    # 형식별 입출력
+    # --------------------------------------------------------
+    def _save(self, df: pd.DataFrame, path: str):
+        if self.format == "arrow":
+            pa = _arrow()
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        else:
+            df.to_pickle(path)
+
+    @staticmethod
+    def _load(path: str, fmt: str) -> pd.DataFrame:
+        if fmt == "arrow":
+            pa = _arrow()
+            with pa.memory_map(path, "r") as source:
+                return pa.ipc.open_file(source).read_all().to_pandas()
+        return pd.read_pickle(path)
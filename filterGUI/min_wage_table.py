@@ -0,0 +1,91 @@
+# min_wage_table.py
+# -*- coding: utf-8 -*-
+"""
+min_wage_table.py - 발효일별 최저임금 표
+
+- 버전: {発効日("YYYY-MM-DD"): {都道府県: 円/時}}
+  한 버전에는 그 날짜에 바뀐 都道府県 만 있어도 됨 (매년 10월 개정 → 都道府県마다 발효일이 다름)
+- 행마다 (都道府県, 기준일) 로 그날 유효한 값을 고름
+  - 기준일 이전 버전 중 가장 최근 것. 모든 버전보다 이전이면 가장 오래된 버전
+- 판정은 "정수 都道府県 코드 + 기준일 → 표 위치 → 円/時" 로 고른 값과 환산 시급(minValue ÷ 환산 시간)을 비교
+  - minValue 를 "최저임금 × 환산 시간" 과 비교하지 않음: 환산 시간이 정수가 아니면(설정 변경)
+    부동소수 반올림 때문에 경계값에서 시급 비교와 결과가 다를 수 있음 → 理由 에 표시하는 換算時給 와 같은 식으로 판정
+"""
+
+from datetime import date
+from typing import Tuple
+
+import numpy as np
+
+_EPOCH = date(1970, 1, 1)
+_DAY_OFFSET = 1 << 31   # 음수 일수(1970년 이전)도 정렬 키에 넣기 위한 보정
+
+def to_day(d: date) -> int:
+    """date → 1970-01-01 기준 일수"""
+    return (d - _EPOCH).days
+
+def wages_in_force(versions: dict, as_of: date) -> dict:
+    """as_of 시점에 유효한 {都道府県: 円/時} (버전에 한 번이라도 나온 都道府県만)"""
+    found = {}
+    for eff in sorted(versions):
+        if found and date.fromisoformat(eff) > as_of:
+            # 아직 발효 전 → 그 버전에만 있는 都道府県만 채움 (가장 오래된 값 사용)
+            for pref, wage in versions[eff].items():
+                found.setdefault(pref, wage)
+            continue
+        found.update(versions[eff])
+    return found
+
+class MinWageTable:
+    def __init__(self, versions: dict, prefs: list):
+        """
+        versions: {発効日: {都道府県: 円/時}}
+        prefs: 都道府県 목록 (순서 = 정수 코드). 모든 都道府県이 최소 한 버전에 있어야 함
+        """
+        self.prefs = list(prefs)
+        self.codes = {p: i for i, p in enumerate(self.prefs)}
+        entries = sorted(
+            (self.codes[pref], to_day(date.fromisoformat(eff)), int(wage))
+            for eff, wages in versions.items() for pref, wage in wages.items() if pref in self.codes
+        )
+        missing = set(self.prefs) - {self.prefs[c] for c, _, _ in entries}
+        if missing:
+            raise ValueError(f"❌ 최저임금 표에 없는 都道府県: {', '.join(sorted(missing))}")
+
+        self.entry_pref = np.array([c for c, _, _ in entries], dtype=np.int64)
+        self.entry_day = np.array([d for _, d, _ in entries], dtype=np.int64)
+        self.wage = np.array([w for _, _, w in entries], dtype=float)
+        self._keys = self.entry_pref * (1 << 32) + (self.entry_day + _DAY_OFFSET)
+        self._first = np.searchsorted(self.entry_pref, np.arange(len(self.prefs)), side="left")
+
+    def lookup(self, pref_codes: np.ndarray, days: np.ndarray) -> np.ndarray:
+        """(都道府県 코드, 기준일 일수) 배열 → 표 위치 배열 (코드 < 0 이면 -1)"""
+        pref_codes = np.asarray(pref_codes, dtype=np.int64)
+        known = pref_codes >= 0
+        codes = np.where(known, pref_codes, 0)
+        keys = codes * (1 << 32) + (np.asarray(days, dtype=np.int64) + _DAY_OFFSET)
+        pos = np.searchsorted(self._keys, keys, side="right") - 1
+        pos = np.maximum(pos, self._first[codes])   # 모든 버전보다 이전 → 가장 오래된 버전
+        return np.where(known, pos, -1)
+
+    def effective(self, i: int) -> str:
+        """표 위치 → 発効日 문자열"""
+        return date.fromordinal(_EPOCH.toordinal() + int(self.entry_day[i])).isoformat()
+
+    def entry(self, pref: str, day: int) -> Tuple[int, float]:
+        """행 단위 판정용: (표 위치, 円/時)"""
+        i = int(self.lookup(np.array([self.codes[pref]]), np.array([day]))[0])
+        return i, float(self.wage[i])
+
+    def fingerprint(self, as_of: date) -> dict:
+        """
+        판정 결과에 영향을 주는 내용 (판정 캐시 지문용).
+        기준일이 없는 행은 as_of(실행일) 기준 → as_of 에 유효한 표 위치를 포함 (날짜 자체는 넣지 않음:
+        새 버전이 발효되는 날에만 지문이 바뀌도록)
+        """
+        in_force = self.lookup(np.arange(len(self.prefs)), np.full(len(self.prefs), to_day(as_of)))
+        return {
+            "entries": [[self.prefs[c], int(d), float(w)]
+                        for c, d, w in zip(self.entry_pref, self.entry_day, self.wage)],
+            "in_force": in_force.tolist(),
+        }
@@ -0,0 +1,450 @@
+# result_writer.py
+# -*- coding: utf-8 -*-
+"""
+result_writer.py - 심사 결과 XLSX 저장 (백엔드 교체 가능)
+
+- 시트 구성 (layout)
+  - "sheets" : 審査結果 / NGのみ / 要確認のみ 에 행 전체를 기록 (기존 run_filter 출력과 동일)
+  - "single" : 행 전체는 審査結果 에 한 번만 기록 (자동 필터 + 헤더 고정).
+               NGのみ / 要確認のみ 는 색인 시트 (審査結果 의 행 번호 링크 + 判定 + 理由 만) → 파일 크기/저장 시간 약 절반
+- 시트 분할: 한 시트가 엑셀 최대 행 수(1,048,576)를 넘으면 같은 이름 + 번호의 시트로 이어서 기록
+  (審査結果 → 審査結果_2 → 審査結果_3 …, 각 시트에 헤더 포함. 분할 시트는 통합 문서 끝에 추가됨)
+- 동반 파일 (companion): XLSX 와 같은 내용 전체를 CSV / Parquet 으로도 저장 (행 수 제한 없음)
+- 백엔드
+  - "stream"     : openpyxl write-only 모드 (기본). 행을 한 번만 순회하며 시트별로 흘려 씀
+  - "xlsxwriter" : xlsxwriter constant_memory 모드 (pip install xlsxwriter 필요)
+  - "pandas"     : 기존 방식 (df_out.to_excel 을 3번 호출, openpyxl 일반 모드)
+- stream / xlsxwriter 는 메모리 사용량이 전체 행 수와 무관함 (청크 단위 처리용)
+- 공통 인터페이스: append(df_out) 반복 → close() 로 저장 / discard() 로 저장 없이 중단
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, Side
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.exceptions import WorkbookAlreadySaved
+from openpyxl.worksheet.hyperlink import Hyperlink
+
+# ============================================================
+# [시트 구성]
+# ============================================================
+SHEET_ALL = "審査結果"
+SHEET_NG = "NGのみ"
+SHEET_CHECK = "要確認のみ"
+SHEET_NAMES = [SHEET_ALL, SHEET_NG, SHEET_CHECK]
+TOTAL_COL = "判定(総合)"
+REASON_COL = "理由(要約)"
+ROW_COL = "行番号"
+
+# 판정별로 추가 기록할 시트 (審査結果 에는 모든 행)
+ROUTES = {"NG": SHEET_NG, "要確認": SHEET_CHECK}
+
+LAYOUTS = ["sheets", "single"]
+# "single" 의 색인 시트 컬럼 (行番号 = 審査結果 의 엑셀 행 번호. 시트가 나뉘면 링크 대상 시트 안의 행 번호)
+INDEX_COLS = [ROW_COL, TOTAL_COL, REASON_COL]
+
+EXCEL_MAX_ROWS = 1_048_576   # 시트당 최대 행 수 (헤더 포함)
+
+def shard_title(name: str, k: int) -> str:
+    """논리 시트 name 의 k 번째(1부터) 분할 시트 이름"""
+    return name if k == 1 else f"{name}_{k}"
+
+def row_link(excel_row: int, sheet: str = SHEET_ALL) -> str:
+    """sheet 의 excel_row 행으로 가는 문서 내부 링크 위치"""
+    return f"'{sheet}'!A{excel_row}"
+
+def index_values(df_out: pd.DataFrame):
+    """색인 시트에 기록할 (判定, 理由) 튜플 (理由 컬럼이 없으면 빈칸)"""
+    totals = df_out[TOTAL_COL].to_numpy(dtype=object)
+    reasons = (df_out[REASON_COL].to_numpy(dtype=object) if REASON_COL in df_out.columns
+               else np.full(len(df_out), None, dtype=object))
+    return zip(totals, reasons)
+
+# pandas.to_excel 기본 헤더 서식과 맞춤 (굵게 + 테두리 + 가운데 정렬)
+_THIN = Side(style="thin")
+HEADER_FONT = Font(bold=True)
+HEADER_BORDER = Border(left=_THIN, right=_THIN, top=_THIN, bottom=_THIN)
+HEADER_ALIGN = Alignment(horizontal="center", vertical="top")
+
+def excel_rows(df: pd.DataFrame):
+    """
+    DataFrame → 셀 값 튜플
+    pandas.to_excel 과 같은 규칙: NaN/NA → 빈 셀, ±inf → "inf"/"-inf", numpy 스칼라 → Python 기본형
+    """
+    values = df.astype(object).where(df.notna(), None)
+    for i, dtype in enumerate(df.dtypes):
+        if pd.api.types.is_float_dtype(dtype):
+            col = df.iloc[:, i].to_numpy()
+            inf = np.isinf(col)
+            if inf.any():
+                values.iloc[inf, i] = np.where(col[inf] > 0, "inf", "-inf")
+    return values.itertuples(index=False, name=None)
+
+# ============================================================
+# [공통] 시트 분할 + 행 분배 (stream / xlsxwriter)
+# 백엔드는 _add_sheet / _write_header / _write_row / _finish_sheet 만 구현
+# ============================================================
+class _ShardedWriter:
+    def __init__(self, layout: str, max_rows: int):
+        self.layout = layout
+        self.max_rows = max_rows
+        self.columns = None
+        self.counts = {name: 0 for name in SHEET_NAMES}    # 논리 시트별 데이터 행 수 (분할 시트 합계)
+        self.shards = {name: [] for name in SHEET_NAMES}   # 논리 시트별 [[시트, 데이터 행 수], ...]
+        for name in SHEET_NAMES:
+            self._open_shard(name)
+
+    def _sheet_columns(self, name: str) -> list:
+        return self.columns if name == SHEET_ALL or self.layout == "sheets" else INDEX_COLS
+
+    def _open_shard(self, name: str):
+        ws = self._add_sheet(shard_title(name, len(self.shards[name]) + 1))
+        self.shards[name].append([ws, 0])
+        if self.columns is not None:
+            self._write_header(ws, self._sheet_columns(name))
+
+    def _put(self, name: str, values, link=None):
+        """논리 시트 name 에 한 행 기록 → (기록한 시트 이름, 엑셀 행 번호)"""
+        shard = self.shards[name][-1]
+        if shard[1] >= self.max_rows - 1:
+            self._open_shard(name)
+            shard = self.shards[name][-1]
+        shard[1] += 1
+        self.counts[name] += 1
+        self._write_row(shard[0], shard[1], values, link)   # shard[1] = 0 부터 센 행 위치 (0 = 헤더)
+        return shard_title(name, len(self.shards[name])), shard[1] + 1
+
+    def append(self, df_out: pd.DataFrame):
+        if self.columns is None:
+            self.columns = list(df_out.columns)
+            for name, shards in self.shards.items():
+                for ws, _ in shards:
+                    self._write_header(ws, self._sheet_columns(name))
+
+        single = self.layout == "single"
+        # 한 번의 순회로 審査結果 + (NGのみ 또는 要確認のみ) 에 기록
+        for row, (total, reason) in zip(excel_rows(df_out), index_values(df_out)):
+            sheet, excel_row = self._put(SHEET_ALL, row)
+            name = ROUTES.get(total)
+            if name is None:
+                continue
+            if single:
+                self._put(name, (excel_row, total, reason), link=row_link(excel_row, sheet))
+            else:
+                self._put(name, row)
+
+    def _finish(self):
+        """저장 직전: "single" 이면 시트마다 자동 필터 + 헤더 고정"""
+        if self.layout != "single" or self.columns is None:
+            return
+        for name, shards in self.shards.items():
+            width = len(self._sheet_columns(name))
+            for ws, rows in shards:
+                self._finish_sheet(ws, rows, width)
+
+# ============================================================
+# [백엔드 1] openpyxl write-only (기본)
+# ============================================================
+class StreamingResultWriter(_ShardedWriter):
+    """
+    결과 DataFrame 을 청크 단위로 받아서 3개 시트에 바로 기록.
+    append() 를 여러 번 호출한 뒤 close() 에서 파일로 저장.
+    """
+
+    def __init__(self, out_xlsx: str, layout: str = "sheets", max_rows: int = EXCEL_MAX_ROWS):
+        self.out_xlsx = out_xlsx
+        self.wb = Workbook(write_only=True)
+        self.saving = False   # close() 에서 out_xlsx 를 쓰기 시작했는지 (도중에 실패하면 discard 가 삭제)
+        super().__init__(layout, max_rows)
+
+    def _add_sheet(self, title: str):
+        ws = self.wb.create_sheet(title)
+        if self.layout == "single":
+            ws.freeze_panes = "A2"   # write-only 는 첫 행을 쓰기 전에 지정해야 함
+        return ws
+
+    def _write_header(self, ws, columns):
+        cells = []
+        for c in columns:
+            cell = WriteOnlyCell(ws, value=c)
+            cell.font = HEADER_FONT
+            cell.border = HEADER_BORDER
+            cell.alignment = HEADER_ALIGN
+            cells.append(cell)
+        ws.append(cells)
+
+    def _write_row(self, ws, r: int, values, link):
+        if link is not None:
+            cell = WriteOnlyCell(ws, value=values[0])
+            cell.hyperlink = Hyperlink(ref="", location=link)
+            cell.style = "Hyperlink"
+            values = (cell, *values[1:])
+        ws.append(values)
+
+    def _finish_sheet(self, ws, rows: int, width: int):
+        ws.auto_filter.ref = f"A1:{get_column_letter(width)}{rows + 1}"
+
+    def close(self) -> str:
+        self._finish()
+        self.saving = True
+        self.wb.save(self.out_xlsx)
+        return self.out_xlsx
+
+    def discard(self):
+        """저장하지 않고 중단 (시트별 임시 파일 / 쓰다 만 out_xlsx 정리)"""
+        for shards in self.shards.values():
+            for ws, _ in shards:
+                try:
+                    ws.close()
+                except WorkbookAlreadySaved:   # close() 의 저장 도중 실패 → 이미 닫힌 시트
+                    pass
+                # 시트별 임시 파일은 openpyxl 내부 속성 → 버전이 바뀌어 없으면 건너뜀 (openpyxl 이 종료 시 삭제)
+                tmp = getattr(getattr(ws, "_writer", None), "out", None)
+                if isinstance(tmp, str) and os.path.exists(tmp):
+                    os.remove(tmp)
+        if self.saving and os.path.exists(self.out_xlsx):
+            os.remove(self.out_xlsx)
+
+# ============================================================
+# [백엔드 2] xlsxwriter constant_memory
+# ============================================================
+class XlsxWriterResultWriter(_ShardedWriter):
+    def __init__(self, out_xlsx: str, layout: str = "sheets", max_rows: int = EXCEL_MAX_ROWS):
+        try:
+            import xlsxwriter
+        except ImportError as e:
+            raise RuntimeError("❌ xlsxwriter 미설치: pip install xlsxwriter") from e
+
+        self.out_xlsx = out_xlsx
+        self.wb = xlsxwriter.Workbook(out_xlsx, {"constant_memory": True})
+        self.saving = False
+        self.header_fmt = self.wb.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+        super().__init__(layout, max_rows)
+
+    def _add_sheet(self, title: str):
+        return self.wb.add_worksheet(title)
+
+    def _write_header(self, ws, columns):
+        ws.write_row(0, 0, columns, self.header_fmt)
+
+    def _write_row(self, ws, r: int, values, link):
+        # constant_memory 모드는 시트별로 행 번호가 증가하는 순서로만 기록 가능
+        if link is not None:
+            ws.write_url(r, 0, f"internal:{link}", string=str(values[0]))
+            ws.write_row(r, 1, values[1:])
+        else:
+            ws.write_row(r, 0, values)
+
+    def _finish_sheet(self, ws, rows: int, width: int):
+        ws.autofilter(0, 0, rows, width - 1)
+        ws.freeze_panes(1, 0)
+
+    def close(self) -> str:
+        self._finish()
+        self.saving = True
+        self.wb.close()
+        return self.out_xlsx
+
+    def discard(self):
+        # constant_memory 의 시트별 임시 파일은 자동 삭제되는 TemporaryFile → 쓰다 만 out_xlsx 만 정리
+        if self.saving and os.path.exists(self.out_xlsx):
+            os.remove(self.out_xlsx)
+
+# ============================================================
+# [백엔드 3] 기존 방식 (pandas.to_excel x3)
+# ============================================================
+class PandasResultWriter:
+    """기존 run_filter 저장 방식. 비교(벤치마크)용으로 유지 - 전체 결과를 메모리에 모아서 저장"""
+
+    def __init__(self, out_xlsx: str, layout: str = "sheets", max_rows: int = EXCEL_MAX_ROWS):
+        self.out_xlsx = out_xlsx
+        self.layout = layout
+        self.max_rows = max_rows
+        self.parts = []
+        self.counts = {}
+        self.saving = False
+
+    def append(self, df_out: pd.DataFrame):
+        self.parts.append(df_out)
+
+    def _to_excel(self, writer, name: str, frame: pd.DataFrame) -> list:
+        """frame 을 max_rows 단위로 나눠 name, name_2, … 시트에 기록 → 시트 목록"""
+        step = self.max_rows - 1
+        sheets = []
+        for k, a in enumerate(range(0, max(len(frame), 1), step), start=1):
+            title = shard_title(name, k)
+            frame.iloc[a:a + step].to_excel(writer, sheet_name=title, index=False)
+            sheets.append(writer.sheets[title])
+        return sheets
+
+    def close(self) -> str:
+        df_out = pd.concat(self.parts) if len(self.parts) != 1 else self.parts[0]
+        single = self.layout == "single"
+        step = self.max_rows - 1
+        self.saving = True
+        with pd.ExcelWriter(self.out_xlsx, engine="openpyxl") as writer:
+            self._to_excel(writer, SHEET_ALL, df_out)
+            for total, name in ROUTES.items():
+                hit = (df_out[TOTAL_COL] == total).to_numpy()
+                if single:
+                    pos = np.flatnonzero(hit)
+                    part = pd.DataFrame(list(index_values(df_out[hit])), columns=INDEX_COLS[1:])
+                    part.insert(0, ROW_COL, pos % step + 2)
+                    targets = [shard_title(SHEET_ALL, k) for k in pos // step + 1]
+                else:
+                    part = df_out[hit]
+                for ws in self._to_excel(writer, name, part):
+                    if single:
+                        for cell, target in zip(ws["A"][1:], targets[:ws.max_row - 1]):
+                            cell.hyperlink = Hyperlink(ref=cell.coordinate, location=row_link(cell.value, target))
+                            cell.style = "Hyperlink"
+                        targets = targets[ws.max_row - 1:]
+                self.counts[name] = len(part)
+            if single:
+                for ws in writer.sheets.values():
+                    ws.auto_filter.ref = ws.dimensions
+                    ws.freeze_panes = "A2"
+        self.counts[SHEET_ALL] = len(df_out)
+        return self.out_xlsx
+
+    def discard(self):
+        self.parts = []
+        if self.saving and os.path.exists(self.out_xlsx):
+            os.remove(self.out_xlsx)
+
+WRITER_BACKENDS = {
+    "stream": StreamingResultWriter,
+    "xlsxwriter": XlsxWriterResultWriter,
+    "pandas": PandasResultWriter,
+}
+
+# ============================================================
+# [동반 파일] XLSX 와 같은 내용 전체 (행 수 제한 없음)
+# ============================================================
+class CsvCompanion:
+    """UTF-8(BOM 포함) CSV. 청크마다 이어서 기록"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.f = open(path, "w", encoding="utf-8-sig", newline="")
+        self.header = True
+
+    def append(self, df_out: pd.DataFrame):
+        df_out.to_csv(self.f, index=False, header=self.header)
+        self.header = False
+
+    def close(self) -> str:
+        self.f.close()
+        return self.path
+
+    def discard(self):
+        self.f.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+class ParquetCompanion:
+    """
+    Parquet (pip install pyarrow 필요).
+    청크마다 컬럼 타입이 달라질 수 있으므로(전부 결측인 청크 등) 모든 컬럼을 문자열로 저장 (CSV 와 같은 내용)
+    """
+
+    def __init__(self, path: str):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise RuntimeError("❌ pyarrow 미설치: pip install pyarrow") from e
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = path
+        self.writer = None
+
+    def append(self, df_out: pd.DataFrame):
+        # 결과 컬럼과 원본 컬럼 이름이 겹침 (例: 職種) → Parquet 용으로 뒤에 나온 것에 ".1" 등을 붙임
+        names, seen = [], {}
+        for c in map(str, df_out.columns):
+            k = seen.get(c, 0)
+            seen[c] = k + 1
+            names.append(c if k == 0 else f"{c}.{k}")
+        arrays = []
+        for i in range(df_out.shape[1]):
+            s = df_out.iloc[:, i]
+            arrays.append(self.pa.array(s.astype(str).where(s.notna(), None).to_numpy(dtype=object),
+                                        type=self.pa.string()))
+        table = self.pa.Table.from_arrays(arrays, names=names)
+        if self.writer is None:
+            self.writer = self.pq.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table)
+
+    def close(self) -> str:
+        if self.writer is not None:
+            self.writer.close()
+        return self.path
+
+    def discard(self):
+        if self.writer is not None:
+            self.writer.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+COMPANIONS = {
+    "csv": CsvCompanion,
+    "parquet": ParquetCompanion,
+}
+
+class _WithCompanion:
+    """XLSX 저장 + 동반 파일 저장을 같은 append / close / discard 로 묶음"""
+
+    def __init__(self, writer, companion):
+        self.writer = writer
+        self.companion = companion
+
+    @property
+    def counts(self) -> dict:
+        return self.writer.counts
+
+    def append(self, df_out: pd.DataFrame):
+        self.writer.append(df_out)
+        self.companion.append(df_out)
+
+    def close(self) -> str:
+        self.companion.close()
+        return self.writer.close()
+
+    def discard(self):
+        self.companion.discard()
+        self.writer.discard()
+
+def open_result_writer(out_xlsx: str, backend: str = "stream", layout: str = "sheets",
+                       max_rows: int = EXCEL_MAX_ROWS, companion: str = None, companion_path: str = None):
+    """
+    companion: "csv" / "parquet" 를 지정하면 같은 내용 전체를 companion_path 에도 저장
+               (생략 시 out_xlsx 와 같은 이름 + 확장자)
+    """
+    if backend not in WRITER_BACKENDS:
+        raise ValueError(f"❌ 알 수 없는 저장 방식: {backend} (사용 가능: {', '.join(WRITER_BACKENDS)})")
+    if layout not in LAYOUTS:
+        raise ValueError(f"❌ 알 수 없는 시트 구성: {layout} (사용 가능: {', '.join(LAYOUTS)})")
+    if companion is not None and companion not in COMPANIONS:
+        raise ValueError(f"❌ 알 수 없는 동반 파일 형식: {companion} (사용 가능: {', '.join(COMPANIONS)})")
+    if companion is None:
+        return WRITER_BACKENDS[backend](out_xlsx, layout, max_rows)
+    if companion_path is None:
+        companion_path = f"{os.path.splitext(out_xlsx)[0]}.{companion}"
+    side = COMPANIONS[companion](companion_path)
+    try:
+        return _WithCompanion(WRITER_BACKENDS[backend](out_xlsx, layout, max_rows), side)
+    except BaseException:
+        side.discard()
+        raise
+
+def write_result_workbook(df_out: pd.DataFrame, out_xlsx: str, backend: str = "stream",
+                          layout: str = "sheets", **options) -> str:
+    """df_out(판정 결과 + 원본 컬럼) 전체를 한 번에 저장 (options: open_result_writer 의 max_rows / companion 등)"""
+    writer = open_result_writer(out_xlsx, backend, layout, **options)
+    writer.append(df_out)
+    return writer.close()
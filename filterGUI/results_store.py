@@ -0,0 +1,328 @@
+# results_store.py
+# -*- coding: utf-8 -*-
+"""
+results_store.py - 실행별 판정 결과 기록 (SQLite)
+
+XLSX 는 실행마다 따로 남기 때문에 "이 공고가 지난주에 NG 였나?" 를 보려면 예전 파일을 열어야 함
+→ run_filter(results_db=...) 로 판정 결과를 DB 에 쌓아 두고 SQL / 조회 함수로 바로 찾음
+
+- runs     : 실행 1회 = 1행 (시각 / 입력 / 출력 / 규칙 지문(RuleConfig.key) / 理由 언어 / 행 수)
+- verdicts : 판정 결과 1행 = 1행 (실행 번호 / 행 번호 / 공고 키 / 就業先会社名 / 総合 판정 / 체크별 상태 / 理由 번호 / 時給換算値)
+  - 상태는 정수 (0=OK / 1=要確認 / 2=NG, 없으면 NULL)
+  - 공고 키: JOB_KEY_COLS 중 입력에 있는 첫 컬럼 (없으면 NULL)
+  - 색인: 공고 키 / 회사명 / 판정
+- reasons  : 理由(要約) 문장 ↔ 번호 (같은 문장은 한 번만 저장) + 理由 코드 (REASON_TEXTS 의 번호, 쉼표 구분)
+- 심사 중에는 블록마다 연결별 임시 테이블에 executemany → 출력 확정 후 runs / reasons / verdicts 를
+  짧은 트랜잭션 하나(BEGIN IMMEDIATE)로 기록. 실패/취소 시 아무것도 남지 않고,
+  여러 실행(GUI / CLI --jobs / 서비스 / 감시)이 같은 DB 를 동시에 써도 심사 시간 동안 잠그지 않음
+"""
+
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+STATUS_LABELS = ["OK", "要確認", "NG"]
+VERDICT_COL = "判定(総合)"
+REASON_COL = "理由(要約)"
+HOURLY_COL = "時給換算値(円/時)"
+COMPANY_COL = "就業先会社名"
+BUSY_TIMEOUT_SEC = 60    # 다른 실행이 commit 중이면 이 시간까지 기다림
+JOB_KEY_COLS = ["仕事ID", "お仕事No."]   # 앞에서부터 입력에 있는 컬럼을 공고 키로 사용
+# 체크별 상태 컬럼 → DB 컬럼명
+CHECK_FIELDS = {
+    "必須項目": "required",
+    "応募先メール": "email",
+    "雇用形態": "employment",
+    "職種": "job_title",
+    "就業先会社名表記": "work_company_mark",
+    "紹介元会社名表記": "intro_company_mark",
+    "非公開→紹介元会社名": "private_intro",
+    "GFJ市区町村": "city",
+    "文字化け(全項目)": "garbled",
+    "最低賃金判定": "min_wage",
+}
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    run_id   INTEGER PRIMARY KEY,
+    started  TEXT NOT NULL,
+    finished TEXT,
+    csv_path TEXT,
+    out_xlsx TEXT,
+    rules    TEXT,
+    lang     TEXT,
+    rows     INTEGER
+);
+CREATE TABLE IF NOT EXISTS reasons (
+    id    INTEGER PRIMARY KEY,
+    text  TEXT NOT NULL UNIQUE,
+    codes TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS verdicts (
+    run_id    INTEGER NOT NULL,
+    row_no    INTEGER NOT NULL,
+    job_key   TEXT,
+    company   TEXT,
+    verdict   INTEGER,
+    {", ".join(f"{f} INTEGER" for f in CHECK_FIELDS.values())},
+    reason_id INTEGER,
+    hourly    REAL,
+    PRIMARY KEY (run_id, row_no)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS verdicts_job_key ON verdicts (job_key, run_id);
+CREATE INDEX IF NOT EXISTS verdicts_company ON verdicts (company, run_id);
+CREATE INDEX IF NOT EXISTS verdicts_verdict ON verdicts (verdict, run_id);
+"""
+# 기록 중인 실행의 verdicts (연결별 임시 테이블. 理由 는 번호 대신 문장 → commit 시 reasons 와 연결)
+PENDING_SCHEMA = f"""
+CREATE TEMP TABLE IF NOT EXISTS pending (
+    row_no  INTEGER PRIMARY KEY,
+    job_key TEXT,
+    company TEXT,
+    verdict INTEGER,
+    {", ".join(f"{f} INTEGER" for f in CHECK_FIELDS.values())},
+    reason  TEXT,
+    hourly  REAL
+);
+"""
+
+def first_column(df: pd.DataFrame, col: str) -> pd.Series:
+    # 결과 컬럼과 원본 컬럼의 이름이 같으면(職種 / 雇用形態 등) 앞쪽 = 판정 결과
+    s = df.loc[:, col]
+    return s.iloc[:, 0] if isinstance(s, pd.DataFrame) else s
+
+def _text_values(s: pd.Series) -> list:
+    """문자열 리스트 (빈 셀 → None). infer 로드의 12345.0 같은 정수 값은 12345 로"""
+    if pd.api.types.is_float_dtype(s.dtype):
+        vals = s.to_numpy(dtype=float)
+        finite = np.isfinite(vals)
+        if (vals[finite] == np.round(vals[finite])).all():
+            s = s.astype("Int64")
+    s = s.astype("string").str.strip().astype(object)     # 빈 셀이 pd.NA 로 남으면 sqlite3 에 바인딩할 수 없음
+    return s.where(pd.notna(s) & (s != ""), None).tolist()
+
+def job_key_column(df: pd.DataFrame) -> Optional[str]:
+    return next((c for c in JOB_KEY_COLS if c in df.columns), None)
+
+def job_keys(df: pd.DataFrame) -> Optional[list]:
+    """공고 키 리스트 (JOB_KEY_COLS 가 하나도 없으면 None)"""
+    col = job_key_column(df)
+    return _text_values(first_column(df, col)) if col is not None else None
+
+def status_codes(s: pd.Series) -> list:
+    """OK / 要確認 / NG → 0 / 1 / 2 (그 외 None)"""
+    codes = pd.Categorical(s.astype(object), categories=STATUS_LABELS).codes
+    return [None if c < 0 else c for c in codes.tolist()]
+
+class ResultsStore:
+    def __init__(self, path: str, reason_codes=None):
+        """
+        reason_codes: 理由(要約) 문장 → 理由 코드 리스트 (filter_core_v2.reason_codes). 생략 시 코드는 빈 문자열
+        """
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.path = path
+        self.reason_codes = reason_codes
+        self.run_id = None       # 마지막으로 기록한 실행 번호 (commit 시 결정)
+        self.run_info = None     # 기록 중인 실행의 runs 컬럼 값
+        self.rows = 0
+        self._reasons = set()    # 기록 중인 실행의 理由 문장
+
+        # 트랜잭션은 직접 BEGIN / COMMIT. 다른 실행이 commit 중이면 BUSY_TIMEOUT_SEC 까지 기다림
+        self.conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_SEC, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.executescript(PENDING_SCHEMA)
+
+    # --------------------------------------------------------
+    # 기록 (begin → add … → commit / rollback)
+    # 심사 중에는 연결별 임시 테이블(pending)에만 씀 → DB 파일의 쓰기 잠금은 commit 의 짧은 트랜잭션에서만 잡음
+    # (GUI / CLI / 서비스 / 감시가 같은 DB 에 동시에 기록해도 서로 막지 않음)
+    # --------------------------------------------------------
+    def begin(self, csv_path: str = None, out_xlsx: str = None, rules: str = None, lang: str = None):
+        self.rollback()
+        self.run_info = (datetime.now().isoformat(timespec="seconds"), csv_path, out_xlsx, rules, lang)
+
+    def add(self, df_out: pd.DataFrame):
+        """판정 결과 + 원본 컬럼(run_filter 의 저장 단위) → pending 에 추가"""
+        n = len(df_out)
+        if n == 0:
+            return
+        none = [None] * n
+        keys = job_keys(df_out) or none
+        company = _text_values(first_column(df_out, COMPANY_COL)) if COMPANY_COL in df_out.columns else none
+        checks = [status_codes(first_column(df_out, c)) if c in df_out.columns else none for c in CHECK_FIELDS]
+        reason = first_column(df_out, REASON_COL).astype(object)
+        reason = [t if isinstance(t, str) and t else None for t in reason.tolist()]   # 理由 없음(OK) / 빈 셀 → NULL
+        self._reasons.update(reason)
+        hourly = pd.to_numeric(first_column(df_out, HOURLY_COL), errors="coerce").astype(object)
+        hourly = hourly.where(hourly.notna(), None).tolist()
+
+        rows = zip(range(self.rows, self.rows + n), keys, company,
+                   status_codes(first_column(df_out, VERDICT_COL)), *checks, reason, hourly)
+        self.conn.execute("BEGIN")
+        self.conn.executemany(f"INSERT INTO temp.pending VALUES ({', '.join('?' * (6 + len(CHECK_FIELDS)))})", rows)
+        self.conn.execute("COMMIT")
+        self.rows += n
+
+    def commit(self) -> int:
+        """기록 중인 실행을 DB 에 확정 → 실행 번호 (runs / reasons / verdicts 를 한 트랜잭션으로)"""
+        self._reasons.discard(None)
+        fields = ", ".join(CHECK_FIELDS.values())
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            run_id = self.conn.execute(
+                "INSERT INTO runs (started, csv_path, out_xlsx, rules, lang, finished, rows)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*self.run_info, datetime.now().isoformat(timespec="seconds"), self.rows),
+            ).lastrowid
+            # 같은 문장을 다른 실행이 먼저 넣었으면 그 번호를 사용
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO reasons (text, codes) VALUES (?, ?)",
+                ((t, ",".join(map(str, self.reason_codes(t))) if self.reason_codes is not None else "")
+                 for t in self._reasons),
+            )
+            self.conn.execute(
+                f"INSERT INTO verdicts SELECT ?, p.row_no, p.job_key, p.company, p.verdict, {fields}, r.id, p.hourly"
+                f" FROM temp.pending p LEFT JOIN reasons r ON r.text = p.reason ORDER BY p.row_no",
+                (run_id,),
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.rollback()
+        self.run_id = run_id
+        return run_id
+
+    def rollback(self):
+        """기록 중인 실행을 버림"""
+        self.conn.execute("DELETE FROM temp.pending")
+        self.run_info = None
+        self.rows = 0
+        self._reasons = set()
+
+    def recording(self, open_writer, out_path: str, **run_info) -> "RecordingWriter":
+        """open_writer(out_path) 에 append 되는 결과를 그대로 기록 (run_info: begin 인자)"""
+        writer = open_writer(out_path)
+        self.begin(**run_info)
+        return RecordingWriter(writer, self)
+
+    def close(self):
+        self.conn.close()    # commit 안 된 기록(임시 테이블)은 같이 사라짐
+
+    # --------------------------------------------------------
+    # 조회
+    # --------------------------------------------------------
+    def _frame(self, where: str, params=(), order: str = "v.run_id, v.row_no") -> pd.DataFrame:
+        labels = " ".join(f"WHEN {i} THEN '{s}'" for i, s in enumerate(STATUS_LABELS))
+        fields = ", ".join(f"CASE v.{f} {labels} END AS \"{c}\"" for c, f in CHECK_FIELDS.items())
+        sql = (f"SELECT v.run_id, r.started, v.row_no, v.job_key, v.company,"
+               f" CASE v.verdict {labels} END AS verdict, {fields},"
+               f" t.text AS reason, t.codes AS reason_codes, v.hourly"
+               f" FROM verdicts v JOIN runs r ON r.run_id = v.run_id"
+               f" LEFT JOIN reasons t ON t.id = v.reason_id"
+               f" WHERE r.finished IS NOT NULL AND {where} ORDER BY {order}")
+        return pd.read_sql_query(sql, self.conn, params=params)
+
+    def runs(self) -> pd.DataFrame:
+        """기록된 실행 목록 (새 것부터)"""
+        return pd.read_sql_query("SELECT * FROM runs WHERE finished IS NOT NULL ORDER BY run_id DESC", self.conn)
+
+    def latest_run(self) -> Optional[int]:
+        row = self.conn.execute("SELECT MAX(run_id) FROM runs WHERE finished IS NOT NULL").fetchone()
+        return row[0]
+
+    def run_results(self, run_id: int) -> pd.DataFrame:
+        """실행 1회의 판정 결과 전체 (행 순서)"""
+        return self._frame("v.run_id = ?", (run_id,))
+
+    def run_verdicts(self, run_id: int) -> pd.DataFrame:
+        """실행 1회의 공고 키 / 회사명 / 総合 판정 / 理由 만 (행 순서. run_results 보다 가벼움 → filter_diff)"""
+        cur = self.conn.execute(
+            "SELECT v.job_key, v.company, v.verdict, t.text FROM verdicts v"
+            " LEFT JOIN reasons t ON t.id = v.reason_id WHERE v.run_id = ? ORDER BY v.row_no", (run_id,))
+        df = pd.DataFrame(cur.fetchall(), columns=["job_key", "company", "verdict", "reason"])
+        df["verdict"] = df["verdict"].map(dict(enumerate(STATUS_LABELS)))
+        return df
+
+    def job_history(self, job_key) -> pd.DataFrame:
+        """공고 1건의 실행별 판정 (오래된 것부터)"""
+        return self._frame("v.job_key = ?", (str(job_key),))
+
+    def company_history(self, company: str) -> pd.DataFrame:
+        return self._frame("v.company = ?", (company,))
+
+    def trend(self, since: str = None) -> pd.DataFrame:
+        """실행별 OK / 要確認 / NG 건수 (since: 이 시각(ISO 형식) 이후 실행만)"""
+        counts = ", ".join(f"SUM(v.verdict = {i}) AS \"{s}\"" for i, s in enumerate(STATUS_LABELS))
+        return pd.read_sql_query(
+            f"SELECT r.run_id, r.started, r.csv_path, r.rows, {counts}"
+            f" FROM runs r JOIN verdicts v ON v.run_id = r.run_id"
+            f" WHERE r.finished IS NOT NULL AND r.started >= ? GROUP BY r.run_id ORDER BY r.run_id",
+            self.conn, params=(since or "",),
+        )
+
+class RecordingWriter:
+    """결과 저장(writer) + DB 기록을 같은 append / close / discard 로 묶음 (commit 은 run_filter 가 출력 확정 후)"""
+
+    def __init__(self, writer, store: ResultsStore):
+        self.writer = writer
+        self.store = store
+
+    @property
+    def counts(self) -> dict:
+        return self.writer.counts
+
+    def append(self, df_out: pd.DataFrame):
+        self.writer.append(df_out)
+        self.store.add(df_out)
+
+    def close(self) -> str:
+        return self.writer.close()
+
+    def discard(self):
+        self.store.rollback()
+        self.writer.discard()
+
+def main(argv=None) -> int:
+    import argparse
+
+    from filter_core_v2 import RESULTS_DB
+
+    ap = argparse.ArgumentParser(prog="results_store", description="審査結果の履歴検索")
+    ap.add_argument("--db", default=RESULTS_DB, help="결과 DB 경로")
+    sub = ap.add_subparsers(dest="command", required=True)
+    sub.add_parser("runs", help="실행 목록")
+    sub.add_parser("trend", help="실행별 OK / 要確認 / NG 건수").add_argument("--since", default=None)
+    sub.add_parser("job", help="공고 1건의 판정 이력").add_argument("job_key")
+    sub.add_parser("company", help="회사별 판정 이력").add_argument("company")
+    args = ap.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"❌ 결과 DB 없음: {args.db}", file=sys.stderr)
+        return 1
+    store = ResultsStore(args.db)
+    try:
+        if args.command == "runs":
+            df = store.runs()
+        elif args.command == "trend":
+            df = store.trend(args.since)
+        elif args.command == "job":
+            df = store.job_history(args.job_key)
+        else:
+            df = store.company_history(args.company)
+    finally:
+        store.close()
+    print(df.to_csv(index=False), end="")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+# run_profiler.py
+# -*- coding: utf-8 -*-
+"""
+run_profiler.py - run_filter 계측 (opt-in)
+
+사용법:
+    prof = RunProfiler(cprofile_path="run.prof")
+    run_filter(csv_path, out_xlsx, profile=prof)
+    prof.save("run_profile.json")     # 구조화된 보고서 (JSON)
+    print(prof.summary())             # GUI 상태 표시용 한 줄 요약
+
+- 단계별(load / screen / write / save) 경과 시간, 처리 행 수, 최대 메모리
+- 체크 함수별 누적 시간 (workers=N 이면 모든 프로세스의 합계)
+- cprofile_path 를 지정하면 cProfile 결과를 덤프 (python -m pstats run.prof 로 확인)
+- 최대 메모리 (memory=)
+  - "rss"(기본)     : 메인 프로세스의 사용 메모리(RSS)를 백그라운드 스레드에서 주기적으로 측정. 부하 거의 없음
+  - "tracemalloc"   : Python/NumPy 할당량을 정확히 추적 (처리가 수 배 느려지므로 메모리 조사 시에만)
+  - None            : 측정 안 함
+"""
+
+import cProfile
+import ctypes
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from typing import Optional
+
+PHASE_LABELS = {"load": "読込", "screen": "審査", "write": "書込", "save": "保存"}
+RSS_SAMPLE_SEC = 0.05     # RSS 측정 주기
+
+def current_rss() -> Optional[int]:
+    """현재 프로세스의 사용 메모리(바이트). 측정할 수 없는 환경이면 None"""
+    if sys.platform == "win32":
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+        try:
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            kernel32 = ctypes.windll.kernel32
+            kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+            ok = ctypes.windll.psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters),
+                                                          counters.cb)
+            return counters.WorkingSetSize if ok else None
+        except Exception:
+            return None
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return None
+
+class _RssSampler(threading.Thread):
+    """RSS 를 주기적으로 읽어서 최대값을 기록 (reset() 으로 단계별 최대값 측정)"""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.peak = current_rss() or 0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(RSS_SAMPLE_SEC):
+            self.peak = max(self.peak, current_rss() or 0)
+
+    def reset(self) -> int:
+        self.peak = current_rss() or 0
+        return self.peak
+
+    def read(self) -> int:
+        self.peak = max(self.peak, current_rss() or 0)
+        return self.peak
+
+    def stop(self):
+        self._stop_event.set()
+
+class RunProfiler:
+    def __init__(self, memory: Optional[str] = "rss", cprofile_path: Optional[str] = None):
+        if memory not in ("rss", "tracemalloc", None):
+            raise ValueError(f"❌ 알 수 없는 메모리 측정 방식: {memory} (사용 가능: rss, tracemalloc, None)")
+        self.memory = memory
+        self.cprofile_path = cprofile_path
+        self.phases = []        # [{"phase", "sec", "rows", "peak_mb"}]
+        self.checks = {}        # {체크 함수명: 누적 초}
+        self.info = {}          # 실행 정보 (입력 경로 / 엔진 / 행 수 등)
+        self.total_sec = None
+        self._current = None
+        self._t0 = None
+        self._profiler = None
+        self._started_tracemalloc = False
+        self._sampler = None
+
+    # --------------------------------------------------------
+    # run_filter 에서 호출
+    # --------------------------------------------------------
+    def start(self, **info):
+        self.info.update(info)
+        self._t0 = time.perf_counter()
+        if self.memory == "tracemalloc" and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        elif self.memory == "rss" and current_rss() is not None:
+            self._sampler = _RssSampler()
+            self._sampler.start()
+        if self.cprofile_path:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def phase_start(self, name: str):
+        self.phase_end()
+        if self._started_tracemalloc:
+            tracemalloc.reset_peak()
+        elif self._sampler is not None:
+            self._sampler.reset()
+        self._current = {"phase": name, "t0": time.perf_counter(), "rows": 0}
+
+    def phase_rows(self, rows: int):
+        if self._current is not None:
+            self._current["rows"] = rows
+
+    def phase_end(self):
+        cur, self._current = self._current, None
+        if cur is None:
+            return
+        sec = time.perf_counter() - cur["t0"]
+        peak = None
+        if self._started_tracemalloc:
+            peak = tracemalloc.get_traced_memory()[1]
+        elif self._sampler is not None:
+            peak = self._sampler.read()
+        self.phases.append({
+            "phase": cur["phase"],
+            "sec": round(sec, 4),
+            "rows": cur["rows"],
+            "rows_per_sec": round(cur["rows"] / sec) if cur["rows"] and sec > 0 else None,
+            "peak_mb": None if peak is None else round(peak / 1024 / 1024, 1),
+        })
+
+    def add_checks(self, check_sec: dict):
+        for name, sec in check_sec.items():
+            self.checks[name] = self.checks.get(name, 0.0) + sec
+
+    def stop(self):
+        self.phase_end()
+        if self._t0 is not None:
+            self.total_sec = round(time.perf_counter() - self._t0, 4)
+        if self._profiler is not None:
+            self._profiler.disable()
+            self._profiler.dump_stats(self.cprofile_path)
+            self._profiler = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+
+    # --------------------------------------------------------
+    # 결과
+    # --------------------------------------------------------
+    def report(self) -> dict:
+        peaks = [p["peak_mb"] for p in self.phases if p["peak_mb"] is not None]
+        return {
+            **self.info,
+            "total_sec": self.total_sec,
+            "peak_mb": max(peaks) if peaks else None,
+            "memory": self.memory,
+            "phases": self.phases,
+            "checks": {k: round(v, 4) for k, v in sorted(self.checks.items(), key=lambda kv: -kv[1])},
+            "cprofile": self.cprofile_path,
+        }
+
+    def save(self, path: str) -> str:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        return path
+
+    def summary(self) -> str:
+        """例: 計12.3秒 (読込1.2/審査3.4/書込7.0/保存0.7) 100,000行 最大350MB 最遅: check_job_title 1.20秒"""
+        parts = "/".join(f"{PHASE_LABELS.get(p['phase'], p['phase'])}{p['sec']:.1f}" for p in self.phases)
+        text = f"計{self.total_sec or 0:.1f}秒 ({parts})"
+        rows = self.info.get("rows")
+        if rows is not None:
+            text += f" {rows:,}行"
+        peaks = [p["peak_mb"] for p in self.phases if p["peak_mb"] is not None]
+        if peaks:
+            text += f" 最大{max(peaks):,.0f}MB"
+        if self.checks:
+            name, sec = max(self.checks.items(), key=lambda kv: kv[1])
+            text += f" 最遅: {name} {sec:.2f}秒"
+        return text
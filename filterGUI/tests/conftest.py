@@ -0,0 +1,34 @@
+# conftest.py
+# -*- coding: utf-8 -*-
+"""
+filterGUI 테스트 공통 설정
+
+- filterGUI 의 모듈은 최상위 모듈로 import 함 (GUI / exe 와 같은 방식) → filterGUI 폴더를 sys.path 에 추가
+- 샘플 CSV: 저장소의 testdata(실제 내보내기 형식) + bench_jobdata 의 합성 데이터 (NG / 要確認 비율 높게)
+"""
+
+import os
+import sys
+
+import pytest
+
+GUI_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_DIR = os.path.dirname(GUI_DIR)
+sys.path.insert(0, GUI_DIR)
+
+TESTDATA_XLSX = os.path.join(REPO_DIR, "testdata", "v2", "test_jobdata_0119.xlsx")
+
+@pytest.fixture(scope="session")
+def sample_csvs(tmp_path_factory) -> dict:
+    """이름 → CSV 경로"""
+    import pandas as pd
+    from bench_jobdata import generate_csv
+
+    folder = tmp_path_factory.mktemp("samples")
+    paths = {}
+    if os.path.exists(TESTDATA_XLSX):
+        paths["testdata"] = str(folder / "testdata_0119.csv")
+        pd.read_excel(TESTDATA_XLSX, dtype=str).to_csv(paths["testdata"], index=False, encoding="utf-8-sig")
+    paths["synthetic"] = generate_csv(str(folder / "synthetic_cp932.csv"), 3000, encoding="cp932",
+                                      ng_ratio=0.3, check_ratio=0.2, seed=1)
+    return paths
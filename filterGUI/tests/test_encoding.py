@@ -0,0 +1,68 @@
+# test_encoding.py
+# -*- coding: utf-8 -*-
+"""
+CSV 인코딩 판별 (detect_csv_encoding): BOM / cp932 / ASCII 만 / 일본어 혼합 / 샘플 경계에서 잘린 문자
++ 샘플 이후에서 판별이 틀린 경우의 재시도 (read_csv_auto)
++ 단독 실행 스크립트(filter.py / filterV3-*.py)가 쓰는 저장소 최상위 csv_encoding.py 와 결과가 같은지
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+from filter_core_v2 import ENCODING_SAMPLE_BYTES, detect_csv_encoding, read_csv_auto
+
+TEXT = "勤務地,職種\n東京都渋谷区,介護スタッフ\n"
+
+def _detect(tmp_path, data: bytes, **kwargs):
+    path = tmp_path / "in.csv"
+    path.write_bytes(data)
+    return detect_csv_encoding(str(path), **kwargs)
+
+DETECT_CASES = [
+    (TEXT.encode("utf-8-sig"), ("utf-8-sig", 1.0)),
+    (b"\xef\xbb\xbfa,b\n1,2\n", ("utf-8-sig", 1.0)),               # BOM 뒤가 ASCII 만이어도 BOM 우선
+    (TEXT.encode("cp932"), ("cp932", 0.99)),
+    ("勤務地,職種\n東京,ｱﾙﾊﾞｲﾄ\n".encode("cp932"), ("cp932", 0.76)),  # 반각 가나 혼합 → 0.5 + 0.49 × 일본어 7 / 비ASCII 13
+    ("ｱﾙﾊﾞｲﾄ\n".encode("cp932"), ("cp932", 0.5)),
+    (TEXT.encode("utf-8"), ("utf-8", 0.99)),
+    (b"job_id,city\n1,Tokyo\n", ("utf-8", 0.6)),                   # ASCII 만 → cp932 일 수도 있으므로 낮은 신뢰도
+    (b"", ("utf-8", 0.6)),
+    (TEXT.encode("cp932") + b"\x81", ("cp932", 0.0)),               # 둘 다 실패 → 깨진 문자가 적은 쪽
+]
+
+@pytest.mark.parametrize("data, expected", DETECT_CASES)
+def test_detect(tmp_path, data, expected):
+    assert _detect(tmp_path, data) == expected
+
+@pytest.mark.parametrize("encoding", ["utf-8", "cp932"])
+def test_char_split_at_sample_end(tmp_path, encoding):
+    data = "あいう".encode(encoding)
+    cut = len("あ".encode(encoding)) + 1                            # 2번째 문자 중간에서 자름
+    assert _detect(tmp_path, data, sample_bytes=cut) == (encoding, 0.99)
+
+def test_retry_after_sample(tmp_path):
+    # 판별 샘플은 ASCII 만 (→ utf-8) / 그 뒤에 cp932 → 다른 코덱으로 다시 읽음 (신뢰도 0.0)
+    head = "city,n\n" + "Tokyo,1\n" * (ENCODING_SAMPLE_BYTES // 8 + 1)
+    path = tmp_path / "in.csv"
+    path.write_bytes(head.encode("ascii") + "東京,2\n".encode("cp932"))
+    df, enc, confidence = read_csv_auto(str(path))
+    assert (enc, confidence) == ("cp932", 0.0)
+    assert df["city"].iloc[-1] == "東京"
+
+def _script_module():
+    from conftest import REPO_DIR
+
+    spec = importlib.util.spec_from_file_location("csv_encoding", os.path.join(REPO_DIR, "csv_encoding.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.mark.parametrize("data, expected", DETECT_CASES)
+def test_script_module_matches_core(tmp_path, data, expected):
+    script = _script_module()
+    assert script.ENCODING_SAMPLE_BYTES == ENCODING_SAMPLE_BYTES
+    path = tmp_path / "in.csv"
+    path.write_bytes(data)
+    assert script.detect_csv_encoding(str(path)) == detect_csv_encoding(str(path)) == expected
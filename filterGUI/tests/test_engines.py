@@ -0,0 +1,33 @@
+# test_engines.py
+# -*- coding: utf-8 -*-
+"""
+컬럼 단위 엔진(screen_columns)과 기준 구현(screen_rows)의 판정 결과가 값 단위로 같은지 확인
+(infer / text 로드 x 理由 언어 jp / kr)
+"""
+
+import pandas as pd
+import pytest
+
+from filter_core_v2 import DEFAULT_RULES, LOAD_MODES, REASON_LANGS, load_input, screen_columns, screen_rows
+
+@pytest.mark.parametrize("load", list(LOAD_MODES))
+@pytest.mark.parametrize("sample", ["testdata", "synthetic"])
+def test_engines_agree(sample_csvs, sample, load):
+    if sample not in sample_csvs:
+        pytest.skip(f"샘플 없음: {sample}")
+    df = load_input(sample_csvs[sample], load)[0]
+    for lang in REASON_LANGS:
+        expected = screen_rows(df, lang=lang, rules=DEFAULT_RULES)
+        actual = screen_columns(df, lang=lang, rules=DEFAULT_RULES)
+        pd.testing.assert_frame_equal(actual, expected)
+
+def test_samples_cover_all_verdicts(sample_csvs):
+    # 판정이 모두 OK 인 샘플이면 위 비교가 의미 없음
+    df = load_input(sample_csvs["synthetic"], "infer")[0]
+    counts = screen_columns(df, rules=DEFAULT_RULES)["判定(総合)"].value_counts()
+    assert (counts[["OK", "要確認", "NG"]] > 0).all()
+
+def test_engines_agree_with_custom_rules(sample_csvs):
+    df = load_input(sample_csvs["synthetic"], "text")[0]
+    rules = DEFAULT_RULES.replace(allowed_employment=["正社員"], job_condition_tokens=["急募", "未経験"])
+    pd.testing.assert_frame_equal(screen_columns(df, rules=rules), screen_rows(df, rules=rules))
@@ -0,0 +1,72 @@
+# test_filter_diff.py
+# -*- coding: utf-8 -*-
+"""
+실행 간 차이 보고서 (filter_diff): 新規 / 判定変更 / 削除 분류, 같은 키가 여러 번 나올 때의 순서(nth) 조인,
+키 없는 행 제외, 결과 파일(동반 CSV / XLSX)에서 읽기
+"""
+
+import pandas as pd
+
+from filter_core_v2 import DEFAULT_RULES, run_filter
+from filter_diff import (
+    CHANGE_CHANGED, CHANGE_NEW, CHANGE_REMOVED, DIFF_COLS, KEY_COL, diff_results, diff_runs, read_result_file,
+)
+
+def _run(rows):
+    """(키, 판정, 理由) 목록 → diff_runs 입력 형식"""
+    df = pd.DataFrame(rows, columns=["job_key", "verdict", "reason"]).astype("string")
+    df.insert(1, "company", pd.Series([f"会社{k}" for k in df["job_key"]], dtype="string"))
+    return df
+
+BEFORE = _run([
+    ("1", "OK", ""),
+    ("2", "OK", ""),
+    ("3", "NG", "r3"),
+    ("5", "NG", "e1"),
+    ("5", "OK", ""),
+    (None, "NG", "x"),
+])
+AFTER = _run([
+    ("1", "OK", ""),
+    ("2", "NG", "r2"),        # 判定変更
+    ("4", "要確認", "r4"),    # 新規 (3 은 削除)
+    ("5", "NG", "e1"),        # 1번째끼리 같음
+    ("5", "NG", "e2"),        # 2번째: OK → NG
+    ("5", "OK", ""),          # 3번째: 新規
+    (None, "OK", ""),
+    (None, "OK", ""),
+])
+
+def test_diff_runs():
+    diff, summary = diff_runs(BEFORE, AFTER)
+    assert list(diff.columns) == DIFF_COLS
+    got = diff[["区分", KEY_COL, "判定(前)", "判定(後)", "理由(前)", "理由(後)"]].astype(object)
+    got = got.where(got.notna(), None).values.tolist()
+    assert got == [
+        [CHANGE_NEW, "4", None, "要確認", None, "r4"],
+        [CHANGE_NEW, "5", None, "OK", None, ""],
+        [CHANGE_CHANGED, "2", "OK", "NG", "", "r2"],
+        [CHANGE_CHANGED, "5", "OK", "NG", "", "e2"],
+        [CHANGE_REMOVED, "3", "NG", None, "r3", None],
+    ]
+    assert diff["就業先会社名"].tolist() == ["会社4", "会社5", "会社2", "会社5", "会社3"]
+    assert summary == {"before_rows": 6, "after_rows": 8, "new": 2, "removed": 1, "changed": 2,
+                       "no_key": {"before": 1, "after": 2}}
+
+def test_same_run_has_no_diff():
+    diff, summary = diff_runs(AFTER, AFTER)
+    assert diff.empty
+    assert (summary["new"], summary["removed"], summary["changed"]) == (0, 0, 0)
+
+def test_diff_results_from_files(sample_csvs, tmp_path):
+    # 같은 실행을 XLSX / 동반 CSV 로 저장 → 파일 형식이 달라도 같은 내용으로 읽고 차이 없음
+    out = tmp_path / "a.xlsx"
+    stats = {}
+    run_filter(sample_csvs["synthetic"], str(out), companion="csv", stats=stats, rules=DEFAULT_RULES)
+    from_xlsx, from_csv = read_result_file(str(out)), read_result_file(stats["companion"])
+    pd.testing.assert_frame_equal(from_xlsx, from_csv)
+    assert from_csv["job_key"].notna().all() and not from_csv["job_key"].str.endswith(".0").any()
+
+    summary = diff_results(str(out), stats["companion"], str(tmp_path / "diff.csv"))
+    assert (summary["new"], summary["removed"], summary["changed"]) == (0, 0, 0)
+    assert pd.read_csv(tmp_path / "diff.csv", encoding="utf-8-sig").empty
@@ -0,0 +1,110 @@
+# test_filter_server.py
+# -*- coding: utf-8 -*-
+"""
+상주 서비스: 인증이 없으므로
+- 루프백이 아닌 주소는 --allow-remote 없이는 거부
+- 브라우저 경유 요청(Origin / 루프백이 아닌 Host / JSON 이 아닌 POST)은 거부
+- 결과는 --out-dir 안에만 쓰고, 옵션 값은 제출할 때 검사 (잘못되면 큐에 넣지 않고 400)
+"""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from filter_core_v2 import VERDICT_CACHE_DB
+from filter_server import JobError, ScreeningService, is_loopback, main
+
+HEADERS = {"host": "127.0.0.1:8765", "content-type": "application/json"}
+
+@pytest.fixture
+def service(tmp_path):
+    s = ScreeningService(out_dir=str(tmp_path / "out"))
+    s.queue = asyncio.Queue()       # 워커 없이 제출 / 조회 / 취소만 확인
+    return s
+
+def _call(service, method, path, payload=None, **headers):
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    return service.route(method, path, body, dict(HEADERS, **headers))
+
+def _post(service, payload, **headers):
+    return _call(service, "POST", "/jobs", payload, **headers)
+
+def _status_of(call) -> int:
+    with pytest.raises(JobError) as e:
+        call()
+    return e.value.status
+
+@pytest.mark.parametrize("host, expected", [
+    ("127.0.0.1", True), ("localhost", True), ("::1", True),
+    ("0.0.0.0", False), ("", False), ("192.0.2.10", False),
+])
+def test_is_loopback(host, expected):
+    assert is_loopback(host) is expected
+
+def test_remote_host_requires_allow_remote(capsys):
+    with pytest.raises(SystemExit) as e:
+        main(["--host", "0.0.0.0"])
+    assert e.value.code == 2
+    assert "--allow-remote" in capsys.readouterr().err
+
+def test_submit_status_cancel(service):
+    status, job = _post(service, {"csv_path": "in/a.csv", "workers": 2, "layout": "single", "verdict_cache": True,
+                                  "results_db": False})
+    assert status == 202 and job["status"] == "queued"
+    assert os.path.dirname(job["out_xlsx"]) == service.out_dir
+    assert job["options"] == {"workers": 2, "layout": "single", "verdict_cache": VERDICT_CACHE_DB,
+                              "results_db": None}
+    assert service.queue.qsize() == 1
+
+    assert _call(service, "GET", f"/jobs/{job['id']}") == (200, job)
+    assert [j["id"] for j in _call(service, "GET", "/jobs")[1]["jobs"]] == [job["id"]]
+    status, cancelled = _call(service, "DELETE", f"/jobs/{job['id']}")
+    assert status == 200 and cancelled["status"] == "cancelled"
+    assert _status_of(lambda: _call(service, "GET", "/jobs/nope")) == 404
+
+def test_out_xlsx_inside_out_dir(service):
+    _, job = _post(service, {"csv_path": "a.csv", "out_xlsx": "sub/a.xlsx"})
+    assert job["out_xlsx"] == os.path.join(service.out_dir, "sub", "a.xlsx")
+    for out in ("../a.xlsx", "/tmp/a.xlsx", os.path.join(service.out_dir, "..", "a.xlsx"), "a.csv", 1):
+        assert _status_of(lambda: _post(service, {"csv_path": "a.csv", "out_xlsx": out})) == 400
+
+@pytest.mark.parametrize("options", [
+    {"colour": "red"},
+    {"verdict_cache": "/tmp/x.sqlite"}, {"results_db": "/tmp/r.sqlite"}, {"input_snapshot": 1},
+    {"workers": 0}, {"workers": "2"}, {"workers": True}, {"chunksize": -1}, {"chunksize": 1.5},
+    {"engine": "fast"}, {"writer": None}, {"layout": ["single"]}, {"lang": "en"}, {"load": "all"},
+    {"companion": "xls"}, {"slim": "yes"},
+])
+def test_bad_options_are_rejected(service, options):
+    assert _status_of(lambda: _post(service, dict(options, csv_path="a.csv"))) == 400
+    assert service.queue.empty() and not service.table
+
+def test_bad_payload_is_rejected(service):
+    assert _status_of(lambda: _post(service, {})) == 400
+    assert _status_of(lambda: _post(service, {"csv_path": ["a.csv"]})) == 400
+    assert _status_of(lambda: service.route("POST", "/jobs", b"{", HEADERS)) == 400
+
+@pytest.mark.parametrize("headers, expected", [
+    ({"origin": "https://example.com"}, 403),
+    ({"origin": "null"}, 403),
+    ({"host": "evil.example:8765"}, 403),          # DNS rebinding: 이름이 127.0.0.1 로 풀려도 거부
+    ({"host": "192.0.2.10"}, 403),
+    ({"content-type": "text/plain"}, 415),
+])
+def test_browser_requests_are_rejected(service, headers, expected):
+    assert _status_of(lambda: _post(service, {"csv_path": "a.csv"}, **headers)) == expected
+    assert not service.table
+
+def test_header_checks(service):
+    assert _call(service, "GET", "/health", host="localhost")[0] == 200
+    assert _call(service, "GET", "/health", host="[::1]:8765")[0] == 200
+    assert _status_of(lambda: _call(service, "GET", "/jobs", origin="https://example.com")) == 403
+    assert _status_of(lambda: service.route("GET", "/jobs", b"", {})) == 403      # Host 없음
+    assert _post(service, {"csv_path": "a.csv"}, **{"content-type": "application/json; charset=utf-8"})[0] == 202
+
+def test_allow_remote_skips_host_check(tmp_path):
+    s = ScreeningService(out_dir=str(tmp_path), allow_remote=True)
+    assert s.route("GET", "/health", b"", {"host": "192.0.2.10:8765"})[0] == 200
+    assert _status_of(lambda: s.route("GET", "/health", b"", {"host": "192.0.2.10", "origin": "null"})) == 403
@@ -0,0 +1,94 @@
+# test_filter_watch.py
+# -*- coding: utf-8 -*-
+"""
+감시 루프: 판정 결과가 없는 파일(취소 / 워커 풀 깨짐)은 처리 기록에 남기지 않고 다시 대기열로
+- 워커가 계속 죽는 파일은 max_attempts 번째에 실패로 기록
+- --once 는 열 수 없는 파일을 once_timeout 초까지만 기다리고 종료 코드 1
+"""
+
+import os
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import filter_watch
+from filter_watch import FolderWatcher, WatchState, file_stamp, main
+
+def _future(result=None, error=None, cancel=False):
+    f = Future()
+    if cancel:
+        f.cancel()
+    elif error is not None:
+        f.set_exception(error)
+    else:
+        f.set_result(result)
+    return f
+
+def test_interrupted_files_are_not_recorded(tmp_path):
+    paths = []
+    for name in ("done", "cancelled", "broken"):
+        p = tmp_path / f"JobMasterList_{name}.csv"
+        p.write_text("a\n1\n", encoding="utf-8")
+        paths.append(os.path.abspath(p))
+    state = WatchState(str(tmp_path / "state.json"))
+    watcher = FolderWatcher(str(tmp_path), state=state, use_events=False)
+    done = {"input": paths[0], "output": "x.xlsx", "ok": True, "error": None, "rows": 1, "ng": 0, "check": 0}
+    futures = [_future(done), _future(cancel=True), _future(error=BrokenProcessPool("killed"))]
+    for path, future in zip(paths, futures):
+        watcher.running[path] = (future, file_stamp(path))
+
+    assert watcher._collect() is True      # 풀이 깨졌음을 알림
+    assert not watcher.running
+    assert list(state.entries) == [paths[0]]
+    assert sorted(watcher.pending) == sorted(paths[1:])
+
+    # 재시작해도 기록된 파일만 건너뜀
+    again = FolderWatcher(str(tmp_path), state=WatchState(state.path), use_events=False)
+    again._observe(paths, 0.0)
+    assert sorted(again.pending) == sorted(paths[1:])
+
+class BrokenExecutor:
+    """제출할 때마다 워커가 죽는 프로세스 풀"""
+    submitted = []
+
+    def __init__(self, max_workers):
+        pass
+
+    def submit(self, fn, path, *args):
+        BrokenExecutor.submitted.append(path)
+        return _future(error=BrokenProcessPool("worker died"))
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+def _csv(tmp_path, name="JobMasterList_1.csv"):
+    p = tmp_path / name
+    p.write_text("a\n1\n", encoding="utf-8")
+    return os.path.abspath(p)
+
+def test_always_broken_worker_is_recorded_as_failed(tmp_path, monkeypatch):
+    monkeypatch.setattr(filter_watch, "ProcessPoolExecutor", BrokenExecutor)
+    BrokenExecutor.submitted = []
+    path = _csv(tmp_path)
+    results = []
+    state = WatchState(str(tmp_path / "state.json"))
+    watcher = FolderWatcher(str(tmp_path), state=state, settle_sec=0, poll_sec=0.01, use_events=False,
+                            on_result=results.append, max_attempts=3, once_timeout=30)
+
+    assert watcher.run(once=True) == []
+    assert BrokenExecutor.submitted == [path] * 3
+    assert state.processed(path, file_stamp(path))
+    assert state.entries[path]["ok"] is False and "BrokenProcessPool" in state.entries[path]["error"]
+    assert [r["ok"] for r in results] == [False]
+    assert not watcher.pending and not watcher.attempts
+
+def test_once_gives_up_on_unopenable_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(filter_watch, "can_open", lambda path: False)
+    path = _csv(tmp_path)
+    state = WatchState(str(tmp_path / "state.json"))
+    watcher = FolderWatcher(str(tmp_path), state=state, settle_sec=0, poll_sec=0.01, use_events=False,
+                            once_timeout=0.2)
+    assert watcher.run(once=True) == [path]
+    assert not state.entries                # 판정하지 않았으므로 다음 실행에서 다시 시도
+
+    assert main([str(tmp_path), "--once", "--polling", "--settle", "0", "--poll", "0.01", "--once-timeout", "0.2",
+                 "--state", str(tmp_path / "state2.json")]) == 1
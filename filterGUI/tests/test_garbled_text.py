@@ -0,0 +1,99 @@
+# test_garbled_text.py
+# -*- coding: utf-8 -*-
+"""
+문자 깨짐 검출: GarbledTextDetector 의 분류(direct / 왕복 변환) + 입력의 모든 문자열 컬럼 검사 (두 엔진 / 판정 캐시 키)
+"""
+
+import pandas as pd
+import pytest
+
+from filter_core_v2 import (
+    DEFAULT_RULES, REASON_CODE, garbled_scan_cols, load_input, row_hashes, rules_fingerprint, screen_cached, screen_columns,
+    screen_rows,
+)
+from garbled_text import CITY_GARBLED_CHAR_TABLE, GarbledTextDetector
+from verdict_cache import VerdictCache
+
+DETECTOR = GarbledTextDetector()
+CP932_MISREAD = "株式会社".encode("utf-8").decode("cp932")       # 譬ｪ蠑丈ｼ夂､ｾ
+CP1252_MISREAD = "日本".encode("utf-8").decode("cp1252")           # æ—¥æœ¬
+
+@pytest.mark.parametrize("text", ["�", "a\x07b", "\x85", "\ue000"])
+def test_direct_chars(text):
+    assert DETECTOR.direct_re.search(text)
+    assert DETECTOR.is_garbled(text)
+
+@pytest.mark.parametrize("text", [CP932_MISREAD, CP1252_MISREAD, f"株式会社 {CP932_MISREAD} 本社"])
+def test_roundtrip_restores_japanese(text):
+    assert not DETECTOR.direct_re.search(text)      # 1차 스캔의 suspect 문자 → 왕복 변환으로 확인
+    assert DETECTOR.is_garbled(text)
+
+@pytest.mark.parametrize("text", ["", "東京都渋谷区", "縺", "譜面", "Café", "株式会社ＡＢＣ", None, 1.5])
+def test_normal_text(text):
+    assert not DETECTOR.is_garbled(text)
+
+@pytest.mark.parametrize("text", ["渋谷 区", "闖", "驥区", "伴市"])
+def test_city_only_chars(text):
+    # 市区町村 에서만 바로 깨짐: 다른 컬럼에서는 공백 / 한자 하나만으로는 깨짐이 아님
+    assert GarbledTextDetector(CITY_GARBLED_CHAR_TABLE).is_garbled(text)
+    assert not DETECTOR.is_garbled(text)
+
+def test_garbled_values_pools_columns():
+    flags = DETECTOR.garbled_values({"a": ["東京", CP932_MISREAD], "b": [CP932_MISREAD, "", "�"]})
+    assert flags["a"].tolist() == [False, True]
+    assert flags["b"].tolist() == [True, False, True]
+
+# ------------------------------------------------------------
+# 입력의 모든 문자열 컬럼 (판정에 안 쓰는 자유 기술 컬럼 포함)
+# ------------------------------------------------------------
+def _frame(sample_csvs, load):
+    df = load_input(sample_csvs["synthetic"], load)[0].head(6).reset_index(drop=True)
+    df["職務内容"] = ["介護スタッフ", CP932_MISREAD, "", "調理補助", "�", "清掃"]
+    df["PR"] = ["未経験歓迎", "", CP1252_MISREAD, "駅近", "賞与あり", "週3日から"]
+    return df
+
+@pytest.mark.parametrize("load", ["infer", "text"])
+def test_free_text_columns_are_scanned(sample_csvs, load):
+    df = _frame(sample_csvs, load)
+    cols = garbled_scan_cols(df)
+    assert "職務内容" in cols and "PR" in cols
+    assert "市区町村（addressLocality）" not in cols
+
+    rows = screen_rows(df, rules=DEFAULT_RULES)
+    out = screen_columns(df, rules=DEFAULT_RULES)
+    pd.testing.assert_frame_equal(out, rows)
+    assert out["文字化け(全項目)"].astype(str).tolist()[:3] == ["OK", "要確認", "要確認"]
+    assert "文字化けの可能性: 職務内容" in out.loc[1, "理由(要約)"]
+    assert "文字化けの可能性: PR" in out.loc[2, "理由(要約)"]
+
+def test_row_hash_covers_free_text(sample_csvs):
+    df = _frame(sample_csvs, "infer")
+    base = row_hashes(df)
+    changed = df.copy()
+    changed.loc[0, "PR"] = CP932_MISREAD
+    assert (row_hashes(changed) != base).tolist() == [True] + [False] * 5
+    # 理由 에 컬럼명이 나오므로 컬럼명이 바뀌어도 다른 키
+    assert (row_hashes(df.rename(columns={"PR": "PR2"})) != base).all()
+
+def test_cache_does_not_hide_garbled_free_text(sample_csvs, tmp_path):
+    df = _frame(sample_csvs, "infer")
+    screen = lambda d: screen_columns(d, lang=REASON_CODE, rules=DEFAULT_RULES)
+    cache = VerdictCache(str(tmp_path / "cache.sqlite3"), rules_fingerprint(DEFAULT_RULES), lang="jp")
+    try:
+        screen_cached(df, screen, cache)
+        changed = df.copy()
+        changed.loc[0, "PR"] = CP932_MISREAD
+        out = screen_cached(changed, screen, cache)
+        pd.testing.assert_frame_equal(out, screen_columns(changed, rules=DEFAULT_RULES))
+        assert out.loc[0, "文字化け(全項目)"] == "要確認"
+    finally:
+        cache.close()
+
+def test_city_uses_city_table_in_both_engines(sample_csvs):
+    df = _frame(sample_csvs, "infer")
+    df["市区町村（addressLocality）"] = ["渋谷区", "渋谷 区", "闖", CP932_MISREAD, "伴市", "新宿区"]
+    df["PR"] = ["渋谷 区", "闖", "伴", "", "", ""]           # 같은 문자라도 자유 기술 컬럼에서는 OK
+    out = screen_columns(df, rules=DEFAULT_RULES)
+    pd.testing.assert_frame_equal(out, screen_rows(df, rules=DEFAULT_RULES))
+    assert out["GFJ市区町村"].astype(str).tolist() == ["OK", "NG", "NG", "NG", "NG", "OK"]
+    assert "文字化けの可能性: PR" not in "".join(out["理由(要約)"].astype(str))
@@ -0,0 +1,70 @@
+# test_input_snapshot.py
+# -*- coding: utf-8 -*-
+"""
+입력 스냅샷 캐시: 같은 폴더를 여러 실행(인스턴스)이 동시에 써도 서로의 항목을 덮어쓰지 않고,
+정리(LRU / 고아 파일)는 항상 폴더의 현재 상태로 판단하는지
+"""
+
+import os
+import time
+
+import pandas as pd
+
+import input_snapshot
+from input_snapshot import InputSnapshotCache
+
+DF = pd.DataFrame({"a": ["東京都", "大阪府"] * 50, "b": range(100)})
+KEYS = [f"{i:032x}" for i in range(1, 5)]
+
+def _age(cache, key, sec):
+    t = time.time() - sec
+    os.utime(cache._entry_path(key), (t, t))
+
+def test_instances_keep_each_others_entries(tmp_path):
+    a = InputSnapshotCache(str(tmp_path))
+    b = InputSnapshotCache(str(tmp_path))    # a 가 쓰기 전에 연 실행
+    a.put(KEYS[0], DF, encoding="cp932", encoding_confidence=1.0)
+    b.put(KEYS[1], DF, encoding="utf-8", encoding_confidence=0.5)
+
+    fresh = InputSnapshotCache(str(tmp_path))
+    assert sorted(fresh.entries()) == KEYS[:2]
+    for cache, key, enc in ((b, KEYS[0], "cp932"), (a, KEYS[1], "utf-8")):
+        df, entry = cache.get(key)
+        pd.testing.assert_frame_equal(df, DF)
+        assert entry["encoding"] == enc
+
+def test_evict_uses_current_state(tmp_path):
+    a = InputSnapshotCache(str(tmp_path))
+    size = a.put(KEYS[0], DF)["bytes"]
+    b = InputSnapshotCache(str(tmp_path), max_bytes=size * 2)
+    b.put(KEYS[1], DF)
+    _age(a, KEYS[0], 100)
+    _age(a, KEYS[1], 50)
+    assert a.get(KEYS[0]) is not None         # 다른 인스턴스에서 사용 → KEYS[0] 이 가장 최근
+
+    b.put(KEYS[2], DF)                         # 상한 초과 → 가장 오래 안 쓰인 KEYS[1] 삭제
+    assert sorted(a.entries()) == [KEYS[0], KEYS[2]]
+    assert not os.path.exists(tmp_path / f"{KEYS[1]}.{b.format}")
+
+def test_orphans_and_legacy_index(tmp_path):
+    old = tmp_path / f"{KEYS[0]}.pickle"
+    new = tmp_path / f"{KEYS[1]}.pickle.0123abcd.tmp"     # 다른 실행이 저장 중
+    other = tmp_path / "memo.txt"
+    for p in (old, new, other):
+        p.write_bytes(b"x")
+    t = time.time() - input_snapshot.ORPHAN_GRACE_SEC - 10
+    os.utime(old, (t, t))
+    os.utime(other, (t, t))
+    (tmp_path / "index.json").write_text("{}", encoding="utf-8")
+
+    cache = InputSnapshotCache(str(tmp_path))
+    cache.put(KEYS[2], DF)
+    assert sorted(os.listdir(tmp_path)) == sorted([new.name, other.name, f"{KEYS[2]}.json",
+                                                   f"{KEYS[2]}.{cache.format}"])
+
+def test_broken_snapshot_is_dropped(tmp_path):
+    cache = InputSnapshotCache(str(tmp_path))
+    entry = cache.put(KEYS[0], DF)
+    (tmp_path / entry["file"]).write_bytes(b"broken")
+    assert cache.get(KEYS[0]) is None
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,66 @@
+# test_min_wage.py
+# -*- coding: utf-8 -*-
+"""
+최저임금 판정의 경계값: minValue 가 "최저임금 × 환산 시간" 과 정확히 같으면 OK, 1円 모자라면 NG
+(두 엔진 모두 / 환산 시간이 정수가 아닐 때는 理由 에 표시하는 환산 시급과 같은 식으로 판정)
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from filter_core_v2 import (
+    DEFAULT_RULES, UNIT_HOURS, col_posted, col_pref, col_wage_lower, col_wage_unit, load_input,
+    screen_columns, screen_rows,
+)
+
+PREF = "東京"
+
+def _frame(sample_csvs, cases):
+    """synthetic 샘플 첫 행을 틀로 (unitText, minValue) 만 바꾼 DataFrame"""
+    base = load_input(sample_csvs["synthetic"], "infer")[0].iloc[[0] * len(cases)].reset_index(drop=True)
+    base[col_pref] = PREF
+    base[col_posted] = ""   # 실행일 기준 버전
+    base[col_wage_unit] = [str(u) for u, _ in cases]
+    base[col_wage_lower] = [repr(v) for _, v in cases]
+    return base
+
+def _verdicts(df, rules):
+    rows = screen_rows(df, rules=rules)
+    cols = screen_columns(df, rules=rules)
+    pd.testing.assert_frame_equal(cols, rows)
+    return cols["最低賃金判定"].astype(str).tolist()
+
+@pytest.mark.parametrize("unit", sorted(UNIT_HOURS))
+def test_boundary(sample_csvs, unit):
+    wage = DEFAULT_RULES.min_wage(date.today())[PREF]
+    at = wage * UNIT_HOURS[unit]
+    df = _frame(sample_csvs, [(unit, at), (unit, at - 1), (unit, at + 1)])
+    assert _verdicts(df, DEFAULT_RULES) == ["OK", "NG", "OK"]
+
+def test_fractional_hours_follow_hourly(sample_csvs):
+    # 환산 시간이 정수가 아니어도 판정 = "換算時給 >= 최저임금" (理由 의 換算時給 와 모순 없음)
+    hours = 173.8
+    rules = DEFAULT_RULES.replace(unit_hours={**UNIT_HOURS, 3: hours})
+    wage = rules.min_wage(date.today())[PREF]
+    values = [round(wage * hours, 1) + d for d in (-1.0, -0.1, 0.0, 0.1)]
+    df = _frame(sample_csvs, [(3, v) for v in values])
+    assert _verdicts(df, rules) == ["OK" if v / hours >= wage else "NG" for v in values]
+
+def test_backdated_save_keeps_later_version(tmp_path, monkeypatch):
+    # 설정 화면은 가장 최근 버전(10/1)을 보여 줌 → 더 이른 발효일(4/1)로 저장해도 10/1 의 東京 값이 앞당겨지지 않음
+    import filter_core_v2
+    from filter_core_v2 import DEFAULT_MIN_WAGE, load_min_wage, load_min_wage_versions, save_min_wage
+
+    monkeypatch.setattr(filter_core_v2, "MIN_WAGE_JSON", str(tmp_path / "min_wage.json"))
+    save_min_wage(dict(DEFAULT_MIN_WAGE, 東京=1300), "2026-10-01")
+
+    shown = load_min_wage(date(2026, 10, 1))
+    save_min_wage(dict(shown, 大阪=1200), "2026-04-01", base=shown)
+
+    versions = load_min_wage_versions()
+    assert versions["2026-04-01"] == {"大阪": 1200}
+    assert versions["2026-10-01"] == {"東京": 1300}
+    assert load_min_wage(date(2026, 4, 1))["東京"] == DEFAULT_MIN_WAGE["東京"]
+    assert load_min_wage(date(2026, 10, 1))["大阪"] == 1200
@@ -0,0 +1,43 @@
+# test_municipality.py
+# -*- coding: utf-8 -*-
+"""
+市区町村名 → 都道府県 색인 (MunicipalityIndex): 여러 都道府県에 있는 이름(府中市 / 伊達市 / 中央区 / 北区 / 港区)은
+판별 불가로 두고, 긴 이름 우선 / 단어 중간 무시 / 住所 에 都道府県名이 있으면 그쪽 우선
+"""
+
+import pytest
+
+from filter_core_v2 import DEFAULT_RULES, MUNICIPALITY_INDEX, MunicipalityIndex, find_pref_anywhere
+
+@pytest.mark.parametrize("text", ["府中市", "府中市宮西町1-1", "伊達市", "中央区銀座", "北区", "港区芝公園"])
+def test_shared_names_are_not_resolved(text):
+    assert MUNICIPALITY_INDEX.find(text) == ("", "")
+    assert find_pref_anywhere(text, municipal_texts=1, rules=DEFAULT_RULES)[0] == ""
+
+@pytest.mark.parametrize("text, expected", [
+    ("札幌市中央区", ("札幌市", "北海道")),          # 같은 이름의 区 앞에 있는 市 로 판별
+    ("神戸市中央区", ("神戸市", "兵庫")),
+    ("名古屋市港区", ("名古屋市", "愛知")),
+    ("北広島市", ("北広島市", "北海道")),            # 広島市 보다 긴 이름 우선
+    ("大和郡山市", ("大和郡山市", "奈良")),          # 郡山市(福島) 보다 긴 이름 우선
+    ("郡山市", ("郡山市", "福島")),
+    ("勤務地：柏市", ("柏市", "千葉")),
+    ("観光市場", ("", "")),                          # 단어 중간 (光市 X)
+])
+def test_find(text, expected):
+    assert MUNICIPALITY_INDEX.find(text) == expected
+
+def test_prefecture_in_text_wins():
+    assert find_pref_anywhere("東京都港区", municipal_texts=1, rules=DEFAULT_RULES)[0] == "東京"
+    assert find_pref_anywhere("広島県府中市", municipal_texts=1, rules=DEFAULT_RULES)[0] == "広島"
+    # 住所가 판별 불가면 다음 텍스트(市区町村)로
+    pref, basis = find_pref_anywhere("港区芝公園", "福島県伊達市", municipal_texts=2, rules=DEFAULT_RULES)
+    assert (pref, basis) == ("福島", "テキスト#2から都道府県を抽出")
+
+def test_index_marks_shared_names():
+    index = MunicipalityIndex({"東京": "府中市 中央区", "広島": "府中市", "大阪": "中市"}, ambiguous=["北区"])
+    assert index.index["府中市"] == "" and index.index["北区"] == ""
+    assert index.find("府中市") == ("", "")          # 판별 불가 이름 안의 짧은 이름(中市)으로 넘어가지 않음
+    assert index.find("中央区") == ("中央区", "東京")
+    assert index.find("新中市") == ("", "")
+    assert index.find("大阪 中市") == ("中市", "大阪")
@@ -0,0 +1,49 @@
+# test_parallel.py
+# -*- coding: utf-8 -*-
+"""
+프로세스 풀 병렬 판정(workers) / 청크 스트리밍(chunksize) 의 결과가 전체 로드 + 직렬 실행과 같은지
+(청크 스트리밍은 load="text" 전체 실행과 비교)
+(행 순서 / 값 / 시트별 행 수. 비교는 XLSX 와 내용이 같은 동반 CSV 로)
+"""
+
+import pandas as pd
+import pytest
+
+from bench_jobdata import generate_csv
+from filter_core_v2 import DEFAULT_RULES, SCREEN_ENGINES, run_filter
+
+def _run(src, tmp_path, name, **options):
+    stats = {}
+    run_filter(src, str(tmp_path / f"{name}.xlsx"), companion="csv", stats=stats, rules=DEFAULT_RULES, **options)
+    return pd.read_csv(stats["companion"], dtype=str, keep_default_na=False), stats["sheet_rows"]
+
+@pytest.mark.parametrize("engine", list(SCREEN_ENGINES))
+def test_chunked_parallel_matches_full(tmp_path, engine):
+    src = generate_csv(str(tmp_path / "src.csv"), 1000, encoding="cp932", ng_ratio=0.3, check_ratio=0.2, seed=3)
+    # 청크 스트리밍은 항상 load="text" 로 읽음 → 같은 로드 방식의 전체 실행과 비교
+    full = {load: _run(src, tmp_path, f"full_{load}", engine=engine, load=load) for load in ("infer", "text")}
+    # 청크 경계가 병렬 구간 / 처리 창(workers * 2)과 어긋나도록 나누어떨어지지 않는 크기
+    for name, load, options in [("parallel", "infer", {"workers": 3}),
+                                ("parallel_text", "text", {"workers": 3, "load": "text"}),
+                                ("chunked", "text", {"chunksize": 230}),
+                                ("chunked_parallel", "text", {"chunksize": 230, "workers": 3})]:
+        expected, expected_rows = full[load]
+        actual, rows = _run(src, tmp_path, name, engine=engine, **options)
+        pd.testing.assert_frame_equal(actual, expected, obj=name)
+        assert rows == expected_rows
+
+def test_chunked_dtypes_do_not_depend_on_chunk_boundaries(tmp_path):
+    # 일부 청크에서만 비어 있는 숫자 컬럼: 청크별로 추론하면 "3" / "3.0" 으로 갈림
+    src = generate_csv(str(tmp_path / "src.csv"), 400, encoding="cp932", ng_ratio=0.3, check_ratio=0.2, seed=5)
+    df = pd.read_csv(src, encoding="cp932", dtype=str, keep_default_na=False)
+    df.loc[:119, "給与形態（unitText）"] = ""
+    df.loc[200:, "仕事ID"] = ""
+    df.loc[:49, "郵便番号（postalCode）"] = ""
+    df.to_csv(src, index=False, encoding="cp932")
+
+    expected, expected_rows = _run(src, tmp_path, "full", load="text")
+    for name, options in {"chunked": {"chunksize": 50}, "chunked_parallel": {"chunksize": 50, "workers": 2}}.items():
+        actual, rows = _run(src, tmp_path, name, **options)
+        pd.testing.assert_frame_equal(actual, expected, obj=name)
+        assert rows == expected_rows
+    assert set(actual["給与形態（unitText）"].iloc[120:]) <= {"1", "2", "3", "4", "5", "6"}
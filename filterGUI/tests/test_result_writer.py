@@ -0,0 +1,132 @@
+# test_result_writer.py
+# -*- coding: utf-8 -*-
+"""
+StreamingResultWriter.discard / run_filter: 임시 파일 / 쓰다 만 출력 정리
++ 시트 분할 (max_rows 를 넘으면 審査結果_2 … 로 이어서 기록. 모든 백엔드)
++ "single" 시트 구성의 색인 시트 (行番号 링크가 분할된 審査結果 의 해당 행을 가리키는지)
+"""
+
+import glob
+import os
+import tempfile
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from filter_core_v2 import DEFAULT_RULES, run_filter
+from result_writer import (
+    INDEX_COLS, ROUTES, SHEET_ALL, SHEET_CHECK, SHEET_NG, WRITER_BACKENDS, StreamingResultWriter, open_result_writer,
+)
+
+FRAME = pd.DataFrame({"判定(総合)": ["OK", "NG", "要確認"], "理由(要約)": ["", "a", "b"]})
+
+def _openpyxl_temp_files() -> set:
+    return set(glob.glob(os.path.join(tempfile.gettempdir(), "openpyxl.*")))
+
+def test_discard_removes_temp_files(tmp_path):
+    before = _openpyxl_temp_files()
+    out = tmp_path / "r.part.xlsx"
+    w = StreamingResultWriter(str(out))
+    w.append(FRAME)
+    w.discard()
+    assert _openpyxl_temp_files() - before == set()
+    assert not out.exists()
+
+def test_discard_keeps_existing_file_when_not_saving(tmp_path):
+    out = tmp_path / "r.xlsx"
+    out.write_bytes(b"keep")
+    w = StreamingResultWriter(str(out))
+    w.append(FRAME)
+    w.discard()
+    assert out.read_bytes() == b"keep"
+
+def test_discard_without_openpyxl_internals(tmp_path):
+    # openpyxl 내부 속성(_writer)이 없어도 예외 없이 끝나야 함
+    w = StreamingResultWriter(str(tmp_path / "r.xlsx"))
+    w.append(FRAME)
+    for shards in w.shards.values():
+        for ws, _ in shards:
+            ws.__dict__.pop("_writer", None)
+    w.discard()
+
+@pytest.mark.parametrize("chunksize", [None, 500])
+@pytest.mark.parametrize("written", [False, True])
+def test_failed_save_leaves_nothing(sample_csvs, tmp_path, monkeypatch, chunksize, written):
+    # close() 의 XLSX 직렬화 도중 실패해도 임시 파일 / 쓰다 만 출력이 남지 않아야 함
+    # written: 시트를 다 쓴 뒤 실패(True) / 쓰기 전에 실패(False)
+    real_save = Workbook.save
+
+    def save(self, path):
+        if written:
+            real_save(self, path)
+        else:
+            with open(path, "wb") as f:
+                f.write(b"PK")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Workbook, "save", save)
+    before = _openpyxl_temp_files()
+    out = tmp_path / "out.xlsx"
+    with pytest.raises(Exception, match="disk full"):
+        run_filter(sample_csvs["synthetic"], str(out), chunksize=chunksize, rules=DEFAULT_RULES)
+    assert _openpyxl_temp_files() - before == set()
+    assert os.listdir(tmp_path) == []
+
+# ------------------------------------------------------------
+# 시트 분할
+# ------------------------------------------------------------
+TOTALS = ["NG", "OK", "要確認", "NG", "NG", "OK", "要確認", "NG"]
+ROWS = pd.DataFrame({"判定(総合)": TOTALS, "理由(要約)": [f"r{i}" for i in range(len(TOTALS))],
+                     "求人ID": list(range(len(TOTALS)))})
+
+def _write(path, backend, layout, max_rows):
+    w = open_result_writer(str(path), backend, layout, max_rows=max_rows)
+    for a in (0, 5):                                   # 분할 위치와 어긋나는 청크
+        w.append(ROWS.iloc[a:a + 5])
+    w.close()
+    return w.counts
+
+def _sheets(path) -> dict:
+    wb = load_workbook(path)
+    return {ws.title: [list(r) for r in ws.iter_rows(values_only=True)] for ws in wb.worksheets}
+
+@pytest.mark.parametrize("backend", list(WRITER_BACKENDS))
+def test_shards_sheets(tmp_path, backend):
+    out = tmp_path / "r.xlsx"
+    counts = _write(out, backend, "sheets", max_rows=4)   # 시트당 데이터 3행
+    sheets = _sheets(out)
+    header = list(ROWS.columns)
+    expected = {SHEET_ALL: ROWS, SHEET_NG: ROWS[ROWS["判定(総合)"] == "NG"],
+                SHEET_CHECK: ROWS[ROWS["判定(総合)"] == "要確認"]}
+    assert sorted(sheets) == sorted([SHEET_ALL, f"{SHEET_ALL}_2", f"{SHEET_ALL}_3", SHEET_NG, f"{SHEET_NG}_2",
+                                     SHEET_CHECK])
+    for name, frame in expected.items():
+        shards = [t for t in (name, f"{name}_2", f"{name}_3") if t in sheets]
+        assert all(sheets[t][0] == header for t in shards)
+        assert all(1 < len(sheets[t]) <= 4 for t in shards)
+        assert [r for t in shards for r in sheets[t][1:]] == frame.values.tolist()
+        assert counts[name] == len(frame)
+
+@pytest.mark.parametrize("backend", list(WRITER_BACKENDS))
+def test_single_layout_index_links(tmp_path, backend):
+    out = tmp_path / "r.xlsx"
+    _write(out, backend, "single", max_rows=4)
+    sheets = _sheets(out)
+    wb = load_workbook(out)
+    for ws in wb.worksheets:
+        assert ws.auto_filter.ref and ws.freeze_panes == "A2"
+
+    for total, name in ROUTES.items():
+        ids = []
+        for title in (t for t in (name, f"{name}_2") if t in sheets):
+            ws = wb[title]
+            assert sheets[title][0] == INDEX_COLS
+            for cell, (_, verdict, reason) in zip(ws["A"][1:], sheets[title][1:]):
+                target, ref = cell.hyperlink.location.split("!")
+                row = int(ref[1:])
+                assert int(cell.value) == row                     # xlsxwriter 는 링크 셀이 문자열
+                linked = sheets[target.strip("'")][row - 1]
+                assert (linked[0], linked[1]) == (verdict, reason)
+                ids.append(linked[2])
+        assert ids == ROWS.loc[ROWS["判定(総合)"] == total, "求人ID"].tolist()
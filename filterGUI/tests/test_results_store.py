@@ -0,0 +1,100 @@
+# test_results_store.py
+# -*- coding: utf-8 -*-
+"""결과 DB: 같은 DB 에 여러 실행이 동시에 기록하는 경우 + 기록 내용"""
+
+import shutil
+
+import pytest
+
+import pandas as pd
+
+import results_store
+from filter_cli import run_batch
+from filter_core_v2 import DEFAULT_RULES, reason_codes, run_filter
+from results_store import ResultsStore
+
+def _block(n: int, start: int = 0) -> pd.DataFrame:
+    return pd.DataFrame({
+        "判定(総合)": ["NG"] * n, "理由(要約)": ["職種が空欄"] * n, "職種": ["NG"] * n,
+        "時給換算値(円/時)": [1100.0] * n, "仕事ID": range(start, start + n), "就業先会社名": ["株式会社テスト"] * n,
+    })
+
+def test_recording_does_not_hold_write_lock(tmp_path, monkeypatch):
+    # 한 실행이 심사(기록) 중이어도 다른 실행은 바로 commit 할 수 있어야 함
+    monkeypatch.setattr(results_store, "BUSY_TIMEOUT_SEC", 0.5)
+    db = str(tmp_path / "results.sqlite3")
+    slow, fast = ResultsStore(db, reason_codes), ResultsStore(db, reason_codes)
+    try:
+        slow.begin(csv_path="slow.csv")
+        slow.add(_block(100))
+        fast.begin(csv_path="fast.csv")
+        fast.add(_block(50, start=1000))
+        fast_id = fast.commit()
+        slow.add(_block(100, start=100))
+        slow_id = slow.commit()
+        assert fast.run_verdicts(fast_id)["job_key"].tolist() == [str(i) for i in range(1000, 1050)]
+        history = slow.job_history(150)
+        assert history["run_id"].tolist() == [slow_id]
+        assert history["reason_codes"].tolist() == [",".join(map(str, reason_codes("職種が空欄")))]
+    finally:
+        slow.close()
+        fast.close()
+
+def test_parallel_runs_share_results_db(sample_csvs, tmp_path):
+    # 같은 理由 문장을 두 실행이 동시에 새로 넣음 + 심사 중에 서로의 기록을 막지 않아야 함
+    paths = []
+    for name in ("a.csv", "b.csv", "c.csv"):
+        shutil.copy(sample_csvs["synthetic"], tmp_path / name)
+        paths.append(str(tmp_path / name))
+    db = str(tmp_path / "results.sqlite3")
+
+    results = run_batch(paths, str(tmp_path / "out"), jobs=3, options={"results_db": db, "rules": DEFAULT_RULES})
+    assert [r["error"] for r in results] == [None, None, None]
+
+    store = ResultsStore(db)
+    try:
+        runs = store.runs()
+        assert sorted(runs["run_id"]) == sorted(r["run_id"] for r in results)
+        assert runs["rows"].tolist() == [results[0]["rows"]] * 3
+        for r in results:
+            counts = store.run_verdicts(r["run_id"])["verdict"].value_counts()
+            assert (counts["NG"], counts["要確認"]) == (r["ng"], r["check"])
+    finally:
+        store.close()
+
+def test_failed_run_leaves_nothing(sample_csvs, tmp_path):
+    import threading
+
+    db = str(tmp_path / "results.sqlite3")
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(Exception):
+        run_filter(sample_csvs["synthetic"], str(tmp_path / "x.xlsx"), results_db=db, cancel_event=cancel)
+    store = ResultsStore(db)
+    try:
+        assert store.runs().empty
+        assert store.conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0] == 0
+    finally:
+        store.close()
+
+@pytest.mark.parametrize("load", ["infer", "text"])
+def test_blank_company_and_job_key_are_recorded_as_null(sample_csvs, tmp_path, load):
+    df = pd.read_csv(sample_csvs["synthetic"], encoding="cp932", dtype=str)
+    df.loc[[0, 3], "就業先会社名"] = None
+    df.loc[[1, 3], "仕事ID"] = None
+    df.loc[2, "仕事ID"] = "  "
+    csv_path = str(tmp_path / "blank.csv")
+    df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+    db = str(tmp_path / "results.sqlite3")
+
+    stats = {}
+    run_filter(csv_path, str(tmp_path / "out.xlsx"), results_db=db, stats=stats, load=load)
+    store = ResultsStore(db)
+    try:
+        rows = store.conn.execute("SELECT job_key, company FROM verdicts WHERE run_id = ? ORDER BY row_no",
+                                  (stats["results_db"]["run_id"],)).fetchall()
+        assert len(rows) == len(df)
+        assert [r[1] for r in rows[:4]] == [None, df.loc[1, "就業先会社名"], df.loc[2, "就業先会社名"], None]
+        assert [r[0] for r in rows[:4]] == [df.loc[0, "仕事ID"], None, None, None]
+    finally:
+        store.close()
@@ -0,0 +1,39 @@
+# test_run_filter.py
+# -*- coding: utf-8 -*-
+"""
+run_filter 오류 처리: CSV 파싱 오류만 "CSV 읽기 실패" 로 보고, 판정 / 기록 중 오류는 그대로 전달
+"""
+
+import pandas as pd
+import pytest
+
+import filter_core_v2
+from filter_core_v2 import DEFAULT_RULES, SCREEN_ENGINES, run_filter
+
+@pytest.mark.parametrize("engine", list(SCREEN_ENGINES))
+@pytest.mark.parametrize("chunksize", [None, 100])
+def test_header_only_csv(sample_csvs, tmp_path, engine, chunksize):
+    src = tmp_path / "header.csv"
+    with open(sample_csvs["synthetic"], "rb") as f:
+        src.write_bytes(f.readline())
+    out = tmp_path / "out.xlsx"
+    stats = {}
+    run_filter(str(src), str(out), engine=engine, chunksize=chunksize, stats=stats, rules=DEFAULT_RULES)
+    assert stats["rows"] == 0
+    assert len(pd.read_excel(out, sheet_name=None)) == 3
+
+@pytest.mark.parametrize("content", [b"", b'a,b\n1,"2\n'])
+def test_parse_error_is_read_failure(tmp_path, content):
+    src = tmp_path / "bad.csv"
+    src.write_bytes(content)
+    with pytest.raises(RuntimeError, match="CSV 읽기 실패"):
+        run_filter(str(src), str(tmp_path / "out.xlsx"), chunksize=100, rules=DEFAULT_RULES)
+
+def test_other_errors_propagate_unchanged(sample_csvs, tmp_path, monkeypatch):
+    def broken(out, chunk, slim=False):
+        raise KeyError("bug")
+
+    monkeypatch.setattr(filter_core_v2, "output_frame", broken)
+    with pytest.raises(KeyError, match="bug"):
+        run_filter(sample_csvs["synthetic"], str(tmp_path / "out.xlsx"), chunksize=500, rules=DEFAULT_RULES)
+    assert list(tmp_path.iterdir()) == []
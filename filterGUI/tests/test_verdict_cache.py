@@ -0,0 +1,87 @@
+# test_verdict_cache.py
+# -*- coding: utf-8 -*-
+"""
+같은 판정 캐시 파일을 여러 실행이 동시에 쓰는 경우 (filter_cli --jobs / 서비스 / 감시 / GUI)
++ 표시 언어 / 규칙이 다른 실행끼리 캐시를 공유 / 지우지 않는지
+"""
+
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import verdict_cache
+from bench_jobdata import generate_csv
+from filter_cli import run_batch
+from filter_core_v2 import DEFAULT_RULES, REASON_LANGS, run_filter
+from verdict_cache import VerdictCache
+
+def test_parallel_runs_share_verdict_cache(sample_csvs, tmp_path):
+    # 내용이 같은 파일 2개 → 두 실행이 같은 판정 결과 본문을 동시에 새로 넣음
+    a = tmp_path / "a.csv"
+    b = tmp_path / "a2.csv"
+    shutil.copy(sample_csvs["synthetic"], a)
+    shutil.copy(sample_csvs["synthetic"], b)
+    cache = str(tmp_path / "cache.sqlite3")
+    options = {"verdict_cache": cache, "workers": 1}
+
+    results = run_batch([str(a), str(b)], str(tmp_path / "out"), jobs=2, options=options)
+    assert [r["error"] for r in results] == [None, None]
+
+    # 다시 실행하면 전부 캐시 적중, 결과 건수는 같음
+    again = run_batch([str(a), str(b)], str(tmp_path / "out2"), jobs=2, options=options)
+    assert [r["error"] for r in again] == [None, None]
+    for first, second in zip(results, again):
+        assert (second["ng"], second["check"]) == (first["ng"], first["check"])
+
+@pytest.mark.parametrize("name", ["testdata", "synthetic"])
+def test_languages_share_cache(sample_csvs, tmp_path, name):
+    if name == "synthetic":
+        src = generate_csv(str(tmp_path / "small.csv"), 500, encoding="cp932", ng_ratio=0.3, check_ratio=0.2, seed=2)
+    elif name in sample_csvs:
+        src = sample_csvs[name]
+    else:
+        pytest.skip("testdata 없음")
+    cache = str(tmp_path / "cache.sqlite3")
+    for i, lang in enumerate(REASON_LANGS):
+        plain, cached = tmp_path / f"plain_{i}.xlsx", tmp_path / f"cached_{i}.xlsx"
+        stats = {}
+        run_filter(src, str(plain), lang=lang, rules=DEFAULT_RULES)
+        run_filter(src, str(cached), lang=lang, rules=DEFAULT_RULES, verdict_cache=cache, stats=stats)
+        if i:
+            assert stats["verdict_cache"]["misses"] == 0   # 첫 실행(jp) 의 항목을 kr 도 그대로 사용
+        pd.testing.assert_frame_equal(pd.read_excel(cached), pd.read_excel(plain))
+
+def _store(cache, hashes):
+    cache.store(np.asarray(hashes, dtype=np.int64), pd.DataFrame({"a": ["x"] * len(hashes)}))
+
+def test_other_rules_are_kept(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    a = VerdictCache(path, "rules_a")
+    _store(a, [1, 2, 3])
+    a.close()
+    VerdictCache(path, "rules_b").close()   # 다른 규칙으로 열어도 rules_a 의 항목은 남음
+    a = VerdictCache(path, "rules_a")
+    try:
+        assert (a.lookup(np.array([1, 2, 3], dtype=np.int64)) >= 0).all()
+    finally:
+        a.close()
+
+def test_prune_by_age_and_size(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = VerdictCache(path, "rules_a")
+    _store(cache, [1, 2, 3, 4])
+    with cache.conn:
+        cache.conn.execute("UPDATE verdicts SET last_used = '2000-01-01' WHERE row_hash = 1")
+        cache.conn.execute("UPDATE verdicts SET last_used = date('now', '-2 days') WHERE row_hash = 2")
+    cache.close()
+
+    monkeypatch.setattr(verdict_cache, "CACHE_MAX_ROWS", 2)
+    cache = VerdictCache(path, "rules_b")
+    try:
+        # 1: 기간 초과 / 2: 상한 초과분 중 가장 오래 안 쓰인 행
+        assert [r[0] for r in cache.conn.execute("SELECT row_hash FROM verdicts ORDER BY row_hash")] == [3, 4]
+        assert cache.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 1
+    finally:
+        cache.close()
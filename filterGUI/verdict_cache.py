@@ -0,0 +1,134 @@
+# verdict_cache.py
+# -*- coding: utf-8 -*-
+"""
+verdict_cache.py - 행 단위 판정 결과 캐시 (SQLite)
+
+- 키: (규칙 지문, 행 해시)
+  - 행 해시: 판정에 쓰는 컬럼 값으로 계산한 64bit 해시 (filter_core_v2.row_hashes)
+  - 규칙 지문: 최저임금 표 / 토큰 목록 / 환산 상수 등의 해시 (filter_core_v2.rules_fingerprint)
+- 값: 판정 결과 1행 (JSON 배열). 같은 판정 결과는 results 테이블에 한 번만 저장하고
+  verdicts 테이블은 행 해시 → 결과 번호만 가짐 (대부분의 행이 같은 판정이라 크기/조회가 가벼움)
+  理由(要約) 는 언어와 무관한 코드 형식으로 저장 → jp / kr 실행이 같은 항목을 공유 (표시는 filter_core_v2)
+- 규칙이 바뀌면 지문이 바뀌므로 이전 결과는 자동으로 쓰이지 않음
+  (다른 지문의 행은 지우지 않음: 설정이 다른 실행이 번갈아 써도 서로의 캐시를 지우지 않도록.
+   열 때 오래 안 쓰인 행과 CACHE_MAX_ROWS 를 넘는 분(사용일이 오래된 순)만 삭제해서 파일 크기를 억제)
+- 여러 실행이 같은 캐시 파일을 동시에 써도 됨: 쓰기는 블록 단위의 짧은 트랜잭션(BEGIN IMMEDIATE)으로만 하고,
+  결과 본문 번호는 INSERT OR IGNORE 후 다시 조회 (다른 실행이 먼저 넣은 본문도 같은 번호를 사용)
+"""
+
+import json
+import os
+import sqlite3
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+CACHE_MAX_AGE_DAYS = 30    # 이 기간 동안 한 번도 안 쓰인 행은 삭제
+CACHE_MAX_ROWS = 2_000_000 # 모든 지문 합계 행 수 상한 (약 100MB). 넘으면 사용일이 오래된 행부터 삭제
+LOOKUP_BATCH = 100_000     # 한 번에 조회하는 행 수
+BUSY_TIMEOUT_SEC = 30      # 다른 실행(GUI / CLI / 서비스 / 감시)이 쓰는 중이면 이 시간까지 기다림
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id    INTEGER PRIMARY KEY,
+    rules TEXT NOT NULL,
+    body  TEXT NOT NULL,
+    UNIQUE (rules, body)
+);
+CREATE TABLE IF NOT EXISTS verdicts (
+    rules     TEXT    NOT NULL,
+    row_hash  INTEGER NOT NULL,
+    result_id INTEGER NOT NULL,
+    last_used TEXT    NOT NULL,
+    PRIMARY KEY (rules, row_hash)
+) WITHOUT ROWID;
+"""
+
+class VerdictCache:
+    def __init__(self, path: str, rules_key: str, lang: str = "jp"):
+        """lang: 꺼낸 판정 결과의 理由 표시 언어 (저장 내용과는 무관)"""
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self.path = path
+        self.rules_key = rules_key
+        self.lang = lang
+        self.today = date.today().isoformat()
+        self.hits = 0
+        self.misses = 0
+
+        self.conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_SEC)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS lookup (row_hash INTEGER PRIMARY KEY)")
+        self._prune()
+
+        # 결과 번호 → 판정 결과 본문 (현재 규칙 지문 분만. 다른 실행이 나중에 넣은 본문은 lookup 에서 추가)
+        self._bodies = dict(self.conn.execute("SELECT id, body FROM results WHERE rules = ?", (rules_key,)))
+
+    def _prune(self):
+        cutoff = (date.today() - timedelta(days=CACHE_MAX_AGE_DAYS)).isoformat()
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.execute("DELETE FROM verdicts WHERE last_used < ?", (cutoff,))
+            excess = self.conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0] - CACHE_MAX_ROWS
+            if excess > 0:
+                self.conn.execute("DELETE FROM verdicts WHERE (rules, row_hash) IN"
+                                  " (SELECT rules, row_hash FROM verdicts ORDER BY last_used LIMIT ?)", (excess,))
+            self.conn.execute("DELETE FROM results WHERE id NOT IN (SELECT DISTINCT result_id FROM verdicts)")
+
+    def lookup(self, hashes: np.ndarray) -> np.ndarray:
+        """hashes(int64 배열) → 결과 번호 배열 (캐시에 없으면 -1)"""
+        found = {}
+        touched = []
+        keys = np.unique(hashes).tolist()
+        with self.conn:   # 임시 테이블만 씀 → 캐시 파일의 쓰기 잠금은 잡지 않음
+            for a in range(0, len(keys), LOOKUP_BATCH):
+                self.conn.execute("DELETE FROM lookup")
+                self.conn.executemany("INSERT INTO lookup VALUES (?)", ((h,) for h in keys[a:a + LOOKUP_BATCH]))
+                # 결과 본문도 같이 읽음 (다른 실행이 연 뒤에 넣은 본문 / 정리로 사라진 본문 대응)
+                cur = self.conn.execute(
+                    "SELECT v.row_hash, v.result_id, v.last_used, r.body FROM lookup l"
+                    " JOIN verdicts v ON v.rules = ? AND v.row_hash = l.row_hash"
+                    " JOIN results r ON r.id = v.result_id",
+                    (self.rules_key,),
+                )
+                for h, rid, last_used, body in cur:
+                    found[h] = rid
+                    self._bodies[rid] = body
+                    if last_used != self.today:
+                        touched.append((self.today, self.rules_key, h))
+        # 사용일 갱신은 하루 한 번만 (매일 재실행해도 쓰기량이 늘지 않도록)
+        if touched:
+            with self.conn:
+                self.conn.execute("BEGIN IMMEDIATE")
+                self.conn.executemany("UPDATE verdicts SET last_used = ? WHERE rules = ? AND row_hash = ?", touched)
+        return np.fromiter((found.get(h, -1) for h in hashes.tolist()), dtype=np.int64, count=len(hashes))
+
+    def results(self, ids) -> list:
+        """결과 번호 목록 → 판정 결과(값 리스트) 목록"""
+        return [json.loads(self._bodies[rid]) for rid in ids]
+
+    def store(self, hashes: np.ndarray, out: pd.DataFrame):
+        """판정 결과 out(행 순서 = hashes 순서)을 캐시에 기록"""
+        values = out.astype(object).where(out.notna(), None)
+        bodies = [json.dumps(r, ensure_ascii=False) for r in values.itertuples(index=False, name=None)]
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            # 다른 실행이 같은 본문을 먼저 넣었거나 정리했을 수 있음 → 블록의 본문마다 번호를 다시 확인
+            ids = {}
+            for body in set(bodies):
+                self.conn.execute("INSERT OR IGNORE INTO results (rules, body) VALUES (?, ?)", (self.rules_key, body))
+                rid = self.conn.execute("SELECT id FROM results WHERE rules = ? AND body = ?",
+                                        (self.rules_key, body)).fetchone()[0]
+                ids[body] = rid
+                self._bodies[rid] = body
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?)",
+                ((self.rules_key, h, ids[b], self.today) for h, b in zip(hashes.tolist(), bodies)),
+            )
+
+    def close(self):
+        self.conn.close()
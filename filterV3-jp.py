@@ -25,6 +25,8 @@ import pandas as pd
 from datetime import datetime
 from typing import Optional, Tuple
 
+from csv_encoding import detect_csv_encoding
+
 # ============================================================
 # 【パス設定】
 # ============================================================
@@ -132,14 +134,18 @@ def find_pref_anywhere(*texts: str) -> Tuple[str, str]:
 if not os.path.exists(CSV_PATH):
     raise FileNotFoundError(f"❌ CSVファイルなし: {CSV_PATH}")
 
-# CSV読み込み - 3つのエンコーディング試行 (utf-8-sig → cp932 → utf-8)
+# CSV読み込み - サンプルで判定したエンコーディングで1回だけ読み込み (判定: csv_encoding.py)
+# (判定が外れた場合のみ残りのエンコーディングを試行)
+CSV_ENCODING, CSV_ENCODING_CONFIDENCE = detect_csv_encoding(CSV_PATH)
 df = None
 last_err = None
-for enc in ["utf-8-sig", "cp932", "utf-8"]:
+for enc in [CSV_ENCODING] + [e for e in ["utf-8-sig", "cp932", "utf-8"] if e != CSV_ENCODING]:
     try:
         df = pd.read_csv(CSV_PATH, encoding=enc)
+        if enc != CSV_ENCODING:
+            CSV_ENCODING, CSV_ENCODING_CONFIDENCE = enc, 0.0
         break
-    except Exception as e:
+    except UnicodeDecodeError as e:
         last_err = e
 
 if df is None:
@@ -426,4 +432,5 @@ with pd.ExcelWriter(OUT_XLSX, engine="openpyxl") as writer:
 print("✅ 処理完了:", OUT_XLSX)
 print("🔹 最低賃金: 担当者換算(日給8h/月160h/年1920h)、週給は要確認")
 print("🔹 都道府県: GFJ → 住所 → 市区町村 → 職種/会社 順序で補完")
-print("🔹 職種判定: 地域名・地名形式はNG、募集・条件・数字は要確認")
\ No newline at end of file
+print("🔹 職種判定: 地域名・地名形式はNG、募集・条件・数字は要確認")
+print(f"🔹 エンコーディング: {CSV_ENCODING} (信頼度 {CSV_ENCODING_CONFIDENCE})")
\ No newline at end of file
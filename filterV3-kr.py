@@ -25,6 +25,8 @@ import pandas as pd
 from datetime import datetime
 from typing import Optional, Tuple
 
+from csv_encoding import detect_csv_encoding
+
 # ============================================================
 # [경로 설정]
 # ============================================================
@@ -132,14 +134,18 @@ def find_pref_anywhere(*texts: str) -> Tuple[str, str]:
 if not os.path.exists(CSV_PATH):
     raise FileNotFoundError(f"❌ CSV 파일 없음: {CSV_PATH}")
 
-# CSV 읽기 - 3가지 인코딩 시도 (utf-8-sig → cp932 → utf-8)
+# CSV 읽기 - 샘플로 판별한 인코딩으로 한 번만 읽기 (판별: csv_encoding.py)
+# (판별이 틀린 경우에만 나머지 인코딩 시도)
+CSV_ENCODING, CSV_ENCODING_CONFIDENCE = detect_csv_encoding(CSV_PATH)
 df = None
 last_err = None
-for enc in ["utf-8-sig", "cp932", "utf-8"]:
+for enc in [CSV_ENCODING] + [e for e in ["utf-8-sig", "cp932", "utf-8"] if e != CSV_ENCODING]:
     try:
         df = pd.read_csv(CSV_PATH, encoding=enc)
+        if enc != CSV_ENCODING:
+            CSV_ENCODING, CSV_ENCODING_CONFIDENCE = enc, 0.0
         break
-    except Exception as e:
+    except UnicodeDecodeError as e:
         last_err = e
 
 if df is None:
@@ -429,4 +435,5 @@ with pd.ExcelWriter(OUT_XLSX, engine="openpyxl") as writer:
 print("✅ 처리 완료:", OUT_XLSX)
 print("🔹 최저임금: 담당자 환산(일급8h/월160h/연1920h), 주급은 요확인")
 print("🔹 도도부현: GFJ → 주소 → 시구정촌 → 직종/회사 순서로 보완")
-print("🔹 직종판정: 지역명/지명형식은 NG, 모집/조건/숫자는 요확인")
\ No newline at end of file
+print("🔹 직종판정: 지역명/지명형식은 NG, 모집/조건/숫자는 요확인")
+print(f"🔹 인코딩: {CSV_ENCODING} (신뢰도 {CSV_ENCODING_CONFIDENCE})")
\ No newline at end of file